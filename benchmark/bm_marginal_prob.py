@@ -0,0 +1,75 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmark for :meth:`QubitDevice.marginal_prob`.
+
+Measures the cost per call of marginalizing the computational basis probabilities
+onto 1 to 10 wires, and compares it to marginalizing with ``np.apply_over_axes``
+followed by a permutation of the flattened basis states.
+
+Usage::
+
+    python benchmark/bm_marginal_prob.py [--wires 14] [--repeat 200]
+"""
+import argparse
+import itertools
+import timeit
+
+import numpy as np
+
+import pennylane as qml
+
+
+def apply_over_axes_marginal_prob(prob, wires, num_wires):
+    """Marginal probabilities computed by summing over one axis at a time,
+    and permuting the flattened basis states."""
+    inactive_wires = list(set(range(num_wires)) - set(wires))
+    prob = np.apply_over_axes(np.sum, prob.reshape([2] * num_wires), inactive_wires).flatten()
+
+    basis_states = np.array(list(itertools.product([0, 1], repeat=len(wires))))
+    perm = np.ravel_multi_index(basis_states[:, np.argsort(np.argsort(wires))].T, [2] * len(wires))
+    return prob[perm]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--wires", type=int, default=14, help="number of device wires")
+    parser.add_argument("--repeat", type=int, default=200, help="calls per measurement")
+    args = parser.parse_args()
+
+    dev = qml.device("default.qubit", wires=args.wires)
+    prob = np.random.random(2 ** args.wires)
+    prob /= np.sum(prob)
+
+    print("{} device wires, {} calls per measurement".format(args.wires, args.repeat))
+    print("{:>8} {:>16} {:>16}".format("wires", "marginal_prob", "apply_over_axes"))
+
+    for k in range(1, min(10, args.wires) + 1):
+        # measured wires in decreasing order, so the result has to be permuted
+        wires = list(range(args.wires - 1, args.wires - 1 - k, -1))
+
+        new = timeit.timeit(lambda: dev.marginal_prob(prob, wires), number=args.repeat)
+        old = timeit.timeit(
+            lambda: apply_over_axes_marginal_prob(prob, wires, args.wires), number=args.repeat
+        )
+
+        print(
+            "{:>8} {:>13.1f} us {:>13.1f} us".format(
+                k, 1e6 * new / args.repeat, 1e6 * old / args.repeat
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
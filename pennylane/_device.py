@@ -16,6 +16,7 @@ This module contains the :class:`Device` abstract base class.
 """
 # pylint: disable=too-many-format-args
 import abc
+import copy
 
 import numpy as np
 
@@ -29,6 +30,7 @@ from pennylane.operation import (
     Tensor,
 )
 from pennylane.qnodes import QuantumFunctionError
+from pennylane.variable import Variable
 
 
 class DeviceError(Exception):
@@ -43,8 +45,29 @@ class Device(abc.ABC):
     Args:
         wires (int): number of subsystems in the quantum state represented by the device.
             Default 1 if not specified.
-        shots (int): Number of circuit evaluations/random samples used to estimate
+        shots (int or Sequence[int]): Number of circuit evaluations/random samples used to estimate
             expectation values of observables. Defaults to 1000 if not specified.
+            A sequence of shot numbers may be passed to devices supporting shot vectors,
+            see :attr:`shot_vector`.
+        seed (str, None, int, array_like[int], numpy.random.SeedSequence, numpy.random.Generator):
+            Seed for the random number generator of the device, used to generate samples.
+            The accepted values are:
+
+            * ``"global"`` (default): the device owns no generator, and draws its samples
+              from the global NumPy random state, so that :func:`numpy.random.seed` keeps
+              making the results reproducible. This is the only accepted string; it is
+              needed because ``None`` already has a meaning for NumPy generators.
+
+            * ``None``: the device owns a generator seeded with fresh entropy from the
+              operating system, independent of the global random state.
+
+            * an ``int``, ``array_like[int]`` or :class:`numpy.random.SeedSequence`: the
+              device owns a generator created via :func:`numpy.random.default_rng`, and its
+              samples are reproducible. :meth:`spawn_rngs` spawns independent child
+              generators from the seed.
+
+            * a :class:`numpy.random.Generator`: the device uses the generator passed,
+              which may be shared with other devices.
     """
 
     # pylint: disable=too-many-public-methods
@@ -52,7 +75,7 @@ class Device(abc.ABC):
     _circuits = {}  #: dict[str->Circuit]: circuit templates associated with this API class
     _asarray = staticmethod(np.asarray)
 
-    def __init__(self, wires=1, shots=1000):
+    def __init__(self, wires=1, shots=1000, seed="global"):
         self.num_wires = wires
         self.shots = shots
 
@@ -60,6 +83,31 @@ class Device(abc.ABC):
         self._obs_queue = None
         self._parameters = None
 
+        self._rng = None
+        """None or numpy.random.Generator: random number generator of the device;
+        ``None`` if the global NumPy random state is used"""
+
+        self._seed_sequence = None
+        """None or numpy.random.SeedSequence: seed sequence the random number
+        generator was created from, used to spawn independent child generators"""
+
+        if isinstance(seed, str):
+            if seed != "global":
+                raise DeviceError(
+                    "Unknown seed {}; must be 'global', or a valid seed for "
+                    "numpy.random.default_rng.".format(seed)
+                )
+
+        elif isinstance(seed, np.random.Generator):
+            self._rng = seed
+
+        else:
+            if not isinstance(seed, np.random.SeedSequence):
+                seed = np.random.SeedSequence(seed)
+
+            self._seed_sequence = seed
+            self._rng = np.random.default_rng(seed)
+
     def __repr__(self):
         """String representation."""
         return "{}.\nInstance: ".format(self.__module__, self.__class__.__name__, self.name)
@@ -70,6 +118,68 @@ class Device(abc.ABC):
             self.name, self.pennylane_requires, self.version, self.author
         )
 
+    @property
+    def rng(self):
+        """The random number generator used by the device to generate samples.
+
+        Returns:
+            numpy.random.Generator or module: the random number generator of the device,
+            or the :mod:`numpy.random` module if the global random state is used
+        """
+        if self._rng is None:
+            return np.random
+
+        return self._rng
+
+    def spawn_rngs(self, num_rngs):
+        """Create independent random number generators from the random number
+        generator of the device.
+
+        The child generators can be used by parallel evaluations, such that each
+        thread owns its own random stream. If the device was created from a seed,
+        the child generators are spawned from its seed sequence, and are therefore
+        reproducible.
+
+        **Example**
+
+        >>> dev = qml.device("default.qubit", wires=2, shots=100, analytic=False, seed=42)
+        >>> devs = [qml.device("default.qubit", wires=2, shots=100, analytic=False, seed=rng)
+        ...         for rng in dev.spawn_rngs(4)]
+
+        Args:
+            num_rngs (int): number of generators to create
+
+        Returns:
+            list[numpy.random.Generator]: independent random number generators
+        """
+        if self._seed_sequence is None:
+            # derive a seed sequence from the global state or the provided generator
+            entropy = np.frombuffer(self.rng.bytes(16), dtype=np.uint32)
+            self._seed_sequence = np.random.SeedSequence([int(e) for e in entropy])
+
+        return [np.random.default_rng(s) for s in self._seed_sequence.spawn(num_rngs)]
+
+    def clones(self, num_clones):
+        """Create copies of the device for parallel evaluations.
+
+        Each copy owns an independent random number generator created by
+        :meth:`spawn_rngs`, and can be sent to a worker process.
+
+        Args:
+            num_clones (int): number of copies to create
+
+        Returns:
+            list[~.Device]: copies of the device
+        """
+        devices = []
+
+        for rng in self.spawn_rngs(num_clones):
+            dev = copy.copy(self)
+            dev._rng = rng  # pylint: disable=protected-access
+            devices.append(dev)
+
+        return devices
+
     @property
     @abc.abstractmethod
     def name(self):
@@ -116,7 +226,8 @@ class Device(abc.ABC):
     @property
     def shots(self):
         """Number of circuit evaluations/random samples used to estimate
-        expectation values of observables"""
+        expectation values of observables. If a shot vector is set, this is the
+        largest number of shots in the shot vector."""
         return self._shots
 
     @shots.setter
@@ -124,18 +235,45 @@ class Device(abc.ABC):
         """Changes the number of shots.
 
         Args:
-            shots (int): number of circuit evaluations/random samples used to estimate
-                expectation values of observables
+            shots (int or Sequence[int]): number of circuit evaluations/random samples used to
+                estimate expectation values of observables, or a sequence of shot numbers
+                to set the :attr:`shot_vector`
 
         Raises:
             DeviceError: if number of shots is less than 1
         """
+        shot_vector = None
+
+        if isinstance(shots, (list, tuple, np.ndarray)):
+            shot_vector = tuple(int(s) for s in shots)
+
+            if not shot_vector:
+                raise DeviceError("The specified shot vector must not be empty.")
+
+            # the smallest number of shots is validated below
+            shots = min(shot_vector)
+
         if shots < 1:
             raise DeviceError(
                 "The specified number of shots needs to be at least 1. Got {}.".format(shots)
             )
 
-        self._shots = int(shots)
+        self._shots = int(shots) if shot_vector is None else max(shot_vector)
+        self._shot_vector = shot_vector
+
+    @property
+    def shot_vector(self):
+        """Sequence of shot numbers to evaluate circuits for, if a sequence was assigned to
+        :attr:`shots`.
+
+        Devices supporting shot vectors simulate a circuit once, and return one set of
+        results per number of shots, estimated from the first samples of a single sample
+        stream of :attr:`shots` samples.
+
+        Returns:
+            None or tuple[int]: the shot numbers, or ``None`` if a single number of shots is used
+        """
+        return self._shot_vector
 
     @classmethod
     def capabilities(cls):
@@ -171,6 +309,11 @@ class Device(abc.ABC):
         Returns:
             array[float]: measured value(s)
         """
+        if self.shot_vector is not None:
+            raise DeviceError(
+                "The {} device does not support shot vectors.".format(self.short_name)
+            )
+
         self.check_validity(queue, observables)
         self._op_queue = queue
         self._obs_queue = observables
@@ -222,6 +365,43 @@ class Device(abc.ABC):
 
             return self._asarray(results)
 
+    def batch_execute(self, circuit, parameters, **kwargs):
+        """Execute a circuit for a batch of positional parameter values.
+
+        Each row of ``parameters`` contains the flattened positional arguments of
+        the quantum function, and is used as the value of the circuit's
+        positional :class:`~.Variable` instances. Keyword argument values are
+        left unchanged.
+
+        For plugin developers: the default implementation resets the device and
+        calls :meth:`execute` once per row. Devices may overwrite this method
+        to vectorize or parallelize the execution of the batch.
+
+        Args:
+            circuit (~.CircuitGraph): circuit to execute on the device
+            parameters (array[float]): positional parameter values of shape
+                ``(batch_size, num_variables)``
+
+        Returns:
+            array[float]: measured value(s), with one row per set of parameter values
+        """
+        saved_values = Variable.positional_arg_values
+        results = []
+
+        try:
+            for values in parameters:
+                Variable.positional_arg_values = np.asarray(values)
+                self.reset()
+                results.append(
+                    self.execute(
+                        circuit.operations, circuit.observables, circuit.variable_deps, **kwargs
+                    )
+                )
+        finally:
+            Variable.positional_arg_values = saved_values
+
+        return self._asarray(results)
+
     @property
     def op_queue(self):
         """The operation queue to be applied.
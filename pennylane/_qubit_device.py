@@ -19,13 +19,64 @@ This module contains the :class:`QubitDevice` abstract base class.
 # e.g. instead of expval(self, observable, wires, par) have expval(self, observable)
 # pylint: disable=arguments-differ, abstract-method, no-value-for-parameter,too-many-instance-attributes
 import abc
-import itertools
+from collections import OrderedDict
+import functools
 
 import numpy as np
 
-from pennylane.operation import Sample, Variance, Expectation, Probability
+from pennylane.operation import Sample, Variance, Expectation, Probability, Counts
 from pennylane.qnodes import QuantumFunctionError
-from pennylane import Device
+from pennylane.variable import Variable
+from pennylane import Device, DeviceError
+
+
+@functools.lru_cache()
+def _marginal_axes(num_wires, wires):
+    """Axes of a ``[2] * num_wires`` probability tensor to sum over and to permute
+    when marginalizing onto the given wires.
+
+    Args:
+        num_wires (int): number of wires of the device
+        wires (tuple[int]): wires to return the marginal probabilities for
+
+    Returns:
+        tuple[tuple[int], tuple[int]]: the inactive wires, and the permutation
+        to apply to the remaining axes, which are in increasing wire order
+    """
+    inactive_wires = tuple(w for w in range(num_wires) if w not in wires)
+    perm = tuple(int(i) for i in np.argsort(wires))
+    return inactive_wires, perm
+
+
+def _expand_matrix(mat, wires, all_wires):
+    """Expand a matrix acting on ``wires`` to a matrix acting on ``all_wires``.
+
+    Args:
+        mat (array): square matrix of dimension ``2**len(wires)``
+        wires (Sequence[int]): the wires ``mat`` acts on
+        all_wires (Sequence[int]): ordered wires of the expanded matrix; must
+            contain all of ``wires``
+
+    Returns:
+        array: square matrix of dimension ``2**len(all_wires)``
+    """
+    wires = list(wires)
+    all_wires = list(all_wires)
+
+    if wires == all_wires:
+        return mat
+
+    num_wires = len(all_wires)
+    rest = [w for w in all_wires if w not in wires]
+
+    # the Kronecker product acts on the wires ``wires + rest``
+    mat = np.kron(mat, np.identity(2 ** len(rest)))
+
+    order = wires + rest
+    perm = [order.index(w) for w in all_wires]
+    mat = np.reshape(mat, [2] * 2 * num_wires)
+    mat = np.transpose(mat, perm + [p + num_wires for p in perm])
+    return np.reshape(mat, (2 ** num_wires, 2 ** num_wires))
 
 
 class QubitDevice(Device):
@@ -52,21 +103,63 @@ class QubitDevice(Device):
       variances, and samples of observables after the circuit has been rotated
       into the observable eigenbasis.
 
+    * :meth:`~.counts`: returns the number of samples of each computational basis state.
+
     Args:
         wires (int): number of subsystems in the quantum state represented by the device
-        shots (int): number of circuit evaluations/random samples used to estimate
-            expectation values of observables
+        shots (int or Sequence[int]): number of circuit evaluations/random samples used to
+            estimate expectation values of observables. If a sequence of shot numbers is
+            passed, :meth:`execute` returns the results for each number of shots,
+            see :attr:`~.Device.shot_vector`.
         analytic (bool): If ``True``, the device calculates probability, expectation values,
             and variances analytically. If ``False``, a finite number of samples set by
             the argument ``shots`` are used to estimate these quantities.
+        fusion (int): Maximum number of wires of a fused gate. If non-zero, consecutive
+            circuit operations acting on nested sets of at most ``fusion`` wires are
+            merged into a single :class:`~.QubitUnitary` before being passed to
+            :meth:`apply`. Requires the device to support ``QubitUnitary``.
+            Defaults to 0, which disables gate fusion.
+        shot_chunk_size (int): If provided, finite-shot expectation values and variances
+            are estimated from samples generated in chunks of at most ``shot_chunk_size``
+            shots, which are reduced incrementally, so that the memory required does not
+            grow with the number of shots. Circuits returning samples are not affected.
+            Defaults to ``None``, which generates all samples at once.
+        seed (str, None, int, array_like[int], numpy.random.SeedSequence, numpy.random.Generator):
+            Seed for the random number generator used to generate samples. If ``"global"``
+            (default), the global NumPy random state is used; if ``None``, a generator
+            with fresh entropy. See :class:`~.Device` for all accepted values.
     """
 
     # pylint: disable=too-many-public-methods
     _asarray = staticmethod(np.asarray)
     observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity"}
 
-    def __init__(self, wires=1, shots=1000, analytic=True):
-        super().__init__(wires=wires, shots=shots)
+    _fusion_cache_size = 100
+    """int: maximum number of gate fusion plans stored by the device"""
+
+    def __init__(
+        self, wires=1, shots=1000, analytic=True, fusion=0, shot_chunk_size=None, seed="global"
+    ):
+        super().__init__(wires=wires, shots=shots, seed=seed)
+
+        if shot_chunk_size is not None and shot_chunk_size < 1:
+            raise DeviceError("The shot chunk size must be a positive integer.")
+
+        self.shot_chunk_size = shot_chunk_size
+        """None or int: maximum number of samples generated at once when estimating
+        expectation values and variances; if ``None``, all samples are generated at once"""
+
+        if fusion and "QubitUnitary" not in self.operations:
+            raise DeviceError(
+                "Gate fusion requires the QubitUnitary operation, which is not "
+                "supported by the {} device.".format(self.short_name)
+            )
+
+        self.fusion = fusion
+        """int: maximum number of wires of a fused gate; 0 if gate fusion is disabled"""
+
+        self._fusion_plans = OrderedDict()
+        """OrderedDict[int, list[tuple[int]]]: gate fusion plans, keyed by circuit hash"""
 
         self.analytic = analytic
         """bool: If ``True``, the device supports exact calculation of expectation
@@ -77,6 +170,19 @@ class QubitDevice(Device):
         """None or array[int]: stores the samples generated by the device
         *after* rotation to diagonalize the observables."""
 
+        self._sampled_prob = None
+        """None or tuple[tuple[int], array[float]]: the measured wires and the probabilities
+        of their basis states most recently sampled from; reused by :meth:`generate_samples`
+        until the next execution or reset, as the state does not change in between"""
+
+        self._cdf = None
+        """None or tuple[array[float], array[float]]: the probability array most recently
+        sampled from, and its cumulative distribution"""
+
+        self._wires_measured = None
+        """None or set[int]: wires measured by the observables of the last execution;
+        if ``None``, all wires are considered measured"""
+
         self._circuit_hash = None
         """None or int: stores the hash of the circuit from the last execution which
         can be used by devices in :meth:`apply` for parametric compilation."""
@@ -118,6 +224,9 @@ class QubitDevice(Device):
         Most importantly the quantum state is reset to its initial value.
         """
         self._samples = None
+        self._sampled_prob = None
+        self._cdf = None
+        self._wires_measured = None
         self._circuit_hash = None
 
     def execute(self, circuit, **kwargs):
@@ -150,24 +259,130 @@ class QubitDevice(Device):
 
         self._circuit_hash = circuit.hash
 
+        operations = circuit.operations
+
+        if self.fusion:
+            operations = self.fuse_operations(operations, circuit.hash)
+
         # apply all circuit operations
-        self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
+        self._sampled_prob = None
+        self.apply(operations, rotations=circuit.diagonalizing_gates, **kwargs)
 
         # generate computational basis samples
+        self._wires_measured = None
+
+        if (not self.analytic) or circuit.is_sampled:
+            self._wires_measured = {
+                int(w) for obs in circuit.observables for w in np.hstack(obs.wires)
+            }
+
+        if self.shot_vector is not None:
+            return self.shot_vector_statistics(circuit)
+
+        if self._streamable(circuit):
+            # generate and reduce the samples chunk by chunk
+            results = self.streamed_statistics(circuit.observables)
+            return self._asarray_results(results, circuit)
+
         if (not self.analytic) or circuit.is_sampled:
             self._samples = self.generate_samples()
 
         # compute the required statistics
         results = self.statistics(circuit.observables)
+        return self._asarray_results(results, circuit)
 
-        # Ensures that a combination with sample does not put
+    def _asarray_results(self, results, circuit):
+        """Convert the statistics of a circuit to the array returned by :meth:`execute`.
+
+        Args:
+            results (list): the statistics returned by :meth:`statistics`
+            circuit (~.CircuitGraph): the executed circuit
+
+        Returns:
+            array: measured value(s)
+        """
+        # Ensures that a combination with sample or counts does not put
         # expvals and vars in superfluous arrays
-        all_sampled = all(obs.return_type is Sample for obs in circuit.observables)
-        if circuit.is_sampled and not all_sampled:
+        return_types = {obs.return_type for obs in circuit.observables}
+        if circuit.is_sampled and len(return_types) > 1:
             return self._asarray(results, dtype="object")
 
         return self._asarray(results)
 
+    def shot_vector_statistics(self, circuit):
+        """Return the statistics of an executed circuit for each number of shots
+        in the shot vector.
+
+        The circuit is simulated once. A single stream of :attr:`~.Device.shots` samples,
+        the largest number of shots in the shot vector, is generated, and the statistics
+        for ``n`` shots are estimated from the first ``n`` samples. As the samples are
+        independent, each prefix of the stream is an unbiased sample of the given size.
+
+        Args:
+            circuit (~.CircuitGraph): circuit that was applied to the device
+
+        Returns:
+            array: measured value(s), with one row per number of shots in the shot vector
+        """
+        samples = None
+
+        if (not self.analytic) or circuit.is_sampled:
+            samples = self.generate_samples()
+
+        results = []
+
+        for shots in self.shot_vector:
+            if samples is not None:
+                self._samples = samples[:shots]
+
+            results.append(self._asarray_results(self.statistics(circuit.observables), circuit))
+
+        self._samples = samples
+
+        if circuit.is_sampled:
+            # the rows have different shapes if samples are returned
+            rows = np.empty(len(results), dtype=object)
+
+            for i, res in enumerate(results):
+                rows[i] = res
+
+            return rows
+
+        return self._asarray(results)
+
+    def batch_execute(self, circuit, parameters, **kwargs):
+        """Execute a circuit for a batch of positional parameter values.
+
+        Each row of ``parameters`` contains the flattened positional arguments of
+        the quantum function, and is used as the value of the circuit's
+        positional :class:`~.Variable` instances. Keyword argument values are
+        left unchanged.
+
+        For plugin developers: the default implementation resets the device and
+        calls :meth:`execute` once per row. Simulators may overwrite this method
+        to execute the whole batch at once.
+
+        Args:
+            circuit (~.CircuitGraph): circuit to execute on the device
+            parameters (array[float]): positional parameter values of shape
+                ``(batch_size, num_variables)``
+
+        Returns:
+            array[float]: measured value(s), with one row per set of parameter values
+        """
+        saved_values = Variable.positional_arg_values
+        results = []
+
+        try:
+            for values in parameters:
+                Variable.positional_arg_values = np.asarray(values)
+                self.reset()
+                results.append(self.execute(circuit, **kwargs))
+        finally:
+            Variable.positional_arg_values = saved_values
+
+        return self._asarray(results)
+
     @abc.abstractmethod
     def apply(self, operations, **kwargs):
         """Apply quantum operations, rotate the circuit into the measurement
@@ -210,6 +425,113 @@ class QubitDevice(Device):
             hash (int): the hash value of the circuit constructed by `CircuitGraph.hash`
         """
 
+    def fuse_operations(self, operations, circuit_hash=None):
+        """Merge runs of consecutive operations into single :class:`~.QubitUnitary` operations.
+
+        A run of operations is merged if the wires of each operation contain, or are
+        contained in, the wires of the run so far, and the run acts on at most
+        :attr:`fusion` wires. State preparations and operations without a matrix
+        representation are never merged.
+
+        The grouping of the operations only depends on the circuit structure.
+        If ``circuit_hash`` is provided, it is cached, so that subsequent executions
+        of the same circuit only recompute the matrices of the fused gates.
+
+        Args:
+            operations (list[~.Operation]): operations to fuse
+            circuit_hash (int): hash of the circuit the operations belong to
+
+        Returns:
+            list[~.Operation]: the fused operations
+        """
+        # pylint: disable=import-outside-toplevel
+        from pennylane.ops import QubitUnitary
+
+        plan = self._fusion_plans.get(circuit_hash)
+
+        if plan is None:
+            plan = self._fusion_plan(operations)
+
+            if circuit_hash is not None:
+                self._fusion_plans[circuit_hash] = plan
+
+                if len(self._fusion_plans) > self._fusion_cache_size:
+                    self._fusion_plans.popitem(last=False)
+        else:
+            self._fusion_plans.move_to_end(circuit_hash)
+
+        fused = []
+
+        for start, stop, wires in plan:
+            if stop - start == 1:
+                fused.append(operations[start])
+                continue
+
+            mat = np.identity(2 ** len(wires))
+
+            for op in operations[start:stop]:
+                mat = _expand_matrix(op.matrix, op.wires, wires) @ mat
+
+            fused.append(QubitUnitary(mat, wires=list(wires), do_queue=False))
+
+        return fused
+
+    def _fusion_plan(self, operations):
+        """Group consecutive operations for gate fusion.
+
+        Args:
+            operations (list[~.Operation]): operations to fuse
+
+        Returns:
+            list[tuple[int, int, tuple[int]]]: for each fused gate, the index of its first
+            operation, the index after its last operation, and the wires it acts on
+        """
+        plan = []
+        start, wires = 0, None
+
+        for i, op in enumerate(operations):
+            op_wires = list(op.wires)
+
+            if wires is not None and self._fusible(op):
+                if set(op_wires) <= set(wires):
+                    continue
+
+                if set(wires) <= set(op_wires) and len(op_wires) <= self.fusion:
+                    # extend the wires of the run, keeping the existing wire order
+                    wires = wires + [w for w in op_wires if w not in wires]
+                    continue
+
+            if wires is not None or i > 0:
+                plan.append((start, i, tuple(wires or operations[start].wires)))
+
+            start = i
+            wires = op_wires if self._fusible(op) and len(op_wires) <= self.fusion else None
+
+        if operations:
+            plan.append((start, len(operations), tuple(wires or operations[start].wires)))
+
+        return plan
+
+    @staticmethod
+    def _fusible(operation):
+        """Whether an operation may be merged with other operations during gate fusion.
+
+        Args:
+            operation (~.Operation): operation to check
+
+        Returns:
+            bool: ``True`` if the operation has a matrix representation
+        """
+        if operation.name in ("BasisState", "QubitStateVector"):
+            return False
+
+        try:
+            operation.matrix  # pylint: disable=pointless-statement
+        except NotImplementedError:
+            return False
+
+        return True
+
     @staticmethod
     def active_wires(operators):
         """Returns the wires acted on by a set of operators.
@@ -257,6 +579,9 @@ class QubitDevice(Device):
             elif obs.return_type is Probability:
                 results.append(self.probability(wires=obs.wires))
 
+            elif obs.return_type is Counts:
+                results.append(self.counts(wires=obs.wires))
+
             elif obs.return_type is not None:
                 raise QuantumFunctionError(
                     "Unsupported return type specified for observable {}".format(obs.name)
@@ -264,6 +589,98 @@ class QubitDevice(Device):
 
         return results
 
+    def _streamable(self, circuit):
+        """Whether the statistics of a circuit are estimated from samples generated in chunks.
+
+        Args:
+            circuit (~.CircuitGraph): circuit to execute on the device
+
+        Returns:
+            bool: ``True`` if the device is in finite-shot mode with a shot chunk size smaller
+            than the number of shots, and the circuit does not return samples
+        """
+        return (
+            not self.analytic
+            and self.shot_vector is None
+            and all(obs.return_type is not Sample for obs in circuit.observables)
+            and self.shot_chunk_size is not None
+            and self.shot_chunk_size < self.shots
+        )
+
+    def streamed_statistics(self, observables):
+        """Estimate expectation values and variances from samples generated in chunks.
+
+        At most :attr:`shot_chunk_size` samples are held in memory at once. The sample
+        mean and variance of each observable are updated after every chunk by combining
+        the statistics of the chunk with the running statistics (Welford's algorithm,
+        generalized to chunks by Chan et al.). Sample counts are summed over the chunks,
+        and probabilities are returned as in :meth:`statistics`.
+
+        Args:
+            observables (List[:class:`Observable`]): the observables to be measured
+
+        Raises:
+            QuantumFunctionError: if the value of :attr:`~.Observable.return_type` is not supported
+
+        Returns:
+            List[float]: the corresponding statistics
+        """
+        for obs in observables:
+            if obs.return_type not in (Expectation, Variance, Probability, Counts, None):
+                raise QuantumFunctionError(
+                    "Unsupported return type specified for observable {}".format(obs.name)
+                )
+
+        sampled = [obs for obs in observables if obs.return_type in (Expectation, Variance)]
+        counted = [obs for obs in observables if obs.return_type is Counts]
+        counts = [np.zeros(2 ** len(obs.wires), dtype=np.int64) for obs in counted]
+
+        # running number of samples, mean and sum of squared deviations for each observable
+        count = 0
+        mean = np.zeros(len(sampled))
+        m2 = np.zeros(len(sampled))
+
+        total_shots = self.shots
+
+        try:
+            while count < total_shots:
+                chunk = min(self.shot_chunk_size, total_shots - count)
+                self.shots = chunk
+                self._samples = self.generate_samples()
+
+                for i, obs in enumerate(sampled):
+                    values = self.sample(obs)
+                    chunk_mean = np.mean(values)
+                    delta = chunk_mean - mean[i]
+
+                    m2[i] += np.var(values) * chunk + delta ** 2 * count * chunk / (count + chunk)
+                    mean[i] += delta * chunk / (count + chunk)
+
+                for i, obs in enumerate(counted):
+                    counts[i] += self.counts(wires=obs.wires)
+
+                count += chunk
+        finally:
+            self.shots = total_shots
+            self._samples = None
+
+        results = []
+        sampled_stats = iter(zip(mean, m2 / count))
+        counts = iter(counts)
+
+        for obs in observables:
+            if obs.return_type is Probability:
+                results.append(self.probability(wires=obs.wires))
+
+            elif obs.return_type is Counts:
+                results.append(next(counts))
+
+            elif obs.return_type is not None:
+                obs_mean, obs_var = next(sampled_stats)
+                results.append(obs_mean if obs.return_type is Expectation else obs_var)
+
+        return results
+
     def generate_samples(self):
         r"""Returns the computational basis samples generated for all wires.
 
@@ -276,13 +693,33 @@ class QubitDevice(Device):
             generate their own computational basis samples, with the resulting
             computational basis samples stored as ``self._samples``.
 
+        If only some of the wires are measured (see ``_wires_measured``), the samples are
+        drawn from the marginal distribution of the measured wires, and the columns
+        of all other wires are zero.
+
+        The probabilities are computed once per execution, so that the samples of all
+        chunks of a streamed execution are drawn from the same cumulative distribution.
+
         Returns:
-             array[complex]: array of samples in the shape ``(dev.shots, dev.num_wires)``
+             array[int]: array of samples in the shape ``(dev.shots, dev.num_wires)``
         """
-        number_of_states = 2 ** self.num_wires
-        rotated_prob = self.probability()
-        samples = self.sample_basis_states(number_of_states, rotated_prob)
-        return QubitDevice.states_to_binary(samples, self.num_wires)
+        wires = self._wires_measured
+        all_wires = wires is None or len(wires) >= self.num_wires
+        wires = list(range(self.num_wires)) if all_wires else sorted(wires)
+
+        if self._sampled_prob is None or self._sampled_prob[0] != tuple(wires):
+            # sample from the marginal distribution of the measured wires only
+            rotated_prob = self.probability() if all_wires else self.probability(wires=wires)
+            self._sampled_prob = (tuple(wires), rotated_prob)
+
+        samples = self.sample_basis_states(2 ** len(wires), self._sampled_prob[1])
+
+        if all_wires:
+            return QubitDevice.states_to_binary(samples, self.num_wires)
+
+        binary = np.zeros((len(samples), self.num_wires), dtype=np.uint8)
+        binary[:, wires] = QubitDevice.states_to_binary(samples, len(wires))
+        return binary
 
     def sample_basis_states(self, number_of_states, state_probability):
         """Sample from the computational basis states based on the state
@@ -290,14 +727,31 @@ class QubitDevice(Device):
 
         This is an auxiliary method to the generate_samples method.
 
+        Uniform random numbers are located in the cumulative distribution of the
+        basis states using a binary search. The cumulative distribution is reused
+        as long as the same probability array is passed.
+
         Args:
             number_of_states (int): the number of basis states to sample from
+            state_probability (array[float]): the probabilities of the basis states
 
         Returns:
-            List[int]: the sampled basis states
+            array[int]: the sampled basis states
         """
-        basis_states = np.arange(number_of_states)
-        return np.random.choice(basis_states, self.shots, p=state_probability)
+        if self._cdf is None or self._cdf[0] is not state_probability:
+            cdf = np.cumsum(state_probability, dtype=np.float64)
+
+            # normalize to account for rounding errors
+            cdf /= cdf[-1]
+            self._cdf = (state_probability, cdf)
+
+        # Locating sorted random numbers traverses the cumulative distribution in order,
+        # which is considerably faster than random lookups for many shots.
+        # The samples are shuffled afterwards.
+        uniform = np.sort(self.rng.random(self.shots))
+        samples = np.searchsorted(self._cdf[1], uniform, side="right")
+        self.rng.shuffle(samples)
+        return np.minimum(samples, number_of_states - 1)
 
     @staticmethod
     def states_to_binary(samples, num_wires):
@@ -306,15 +760,15 @@ class QubitDevice(Device):
         This is an auxiliary method to the generate_samples method.
 
         Args:
-            samples (List[int]): samples of basis states in base 10 representation
-            number_of_states (int): the number of basis states to sample from
+            samples (array[int]): samples of basis states in base 10 representation
+            num_wires (int): the number of qubits
 
         Returns:
-            List[int]: basis states in binary representation
+            array[uint8]: basis states in binary representation, of shape
+            ``(len(samples), num_wires)``
         """
-        powers_of_two = 1 << np.arange(num_wires)
-        states_sampled_base_ten = samples[:, None] & powers_of_two
-        return (states_sampled_base_ten > 0).astype(int)[:, ::-1]
+        shifts = np.arange(num_wires - 1, -1, -1)
+        return ((samples[:, None] >> shifts) & 1).astype(np.uint8)
 
     @property
     def circuit_hash(self):
@@ -395,25 +849,17 @@ class QubitDevice(Device):
             # no need to marginalize
             return prob
 
-        wires = np.hstack(wires)
+        wires = tuple(int(w) for w in np.hstack(wires))
+        inactive_wires, perm = _marginal_axes(self.num_wires, wires)
 
-        # determine which wires are to be summed over
-        inactive_wires = list(set(range(self.num_wires)) - set(wires))
-
-        # reshape the probability so that each axis corresponds to a wire
-        prob = prob.reshape([2] * self.num_wires)
-
-        # sum over all inactive wires
-        prob = np.apply_over_axes(np.sum, prob, inactive_wires).flatten()
+        # reshape the probability so that each axis corresponds to a wire,
+        # and sum over all inactive wires
+        prob = np.sum(np.reshape(prob, [2] * self.num_wires), axis=inactive_wires)
 
         # The wires provided might not be in consecutive order (i.e., wires might be [2, 0]).
-        # If this is the case, we must permute the marginalized probability so that
-        # it corresponds to the orders of the wires passed.
-        basis_states = np.array(list(itertools.product([0, 1], repeat=len(wires))))
-        perm = np.ravel_multi_index(
-            basis_states[:, np.argsort(np.argsort(wires))].T, [2] * len(wires)
-        )
-        return prob[perm]
+        # If this is the case, we must permute the axes of the marginalized probability
+        # so that it corresponds to the orders of the wires passed.
+        return np.reshape(np.transpose(prob, perm), -1)
 
     def expval(self, observable):
         wires = observable.wires
@@ -444,13 +890,32 @@ class QubitDevice(Device):
         name = observable.name
 
         if isinstance(name, str) and name in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
-            # Process samples for observables with eigenvalues {1, -1}
-            return 1 - 2 * self._samples[:, wires[0]]
+            # Process samples for observables with eigenvalues {1, -1}.
+            # The samples may be stored as unsigned integers, and must be
+            # converted before subtracting.
+            return 1 - 2 * self._samples[:, wires[0]].astype(int)
 
         # Replace the basis state in the computational basis with the correct eigenvalue.
-        # Extract only the columns of the basis samples required based on ``wires``.
-        wires = np.hstack(wires)
-        samples = self._samples[:, np.array(wires)]
-        unraveled_indices = [2] * len(wires)
-        indices = np.ravel_multi_index(samples.T, unraveled_indices)
+        # Only the columns of the basis samples required based on ``wires`` are decoded.
+        wires = np.hstack(wires).astype(int)
+        powers_of_two = 1 << np.arange(len(wires) - 1, -1, -1)
+        indices = self._samples[:, wires] @ powers_of_two
         return observable.eigvals[indices]
+
+    def counts(self, wires):
+        """Return the number of samples of each computational basis state.
+
+        Only the columns of the basis samples required based on ``wires`` are decoded,
+        and the samples are counted using :func:`numpy.bincount`.
+
+        Args:
+            wires (Sequence[int]): wires to count the sampled basis states of
+
+        Returns:
+            array[int]: the number of samples of each of the ``2**len(wires)`` basis states,
+            in lexicographic order
+        """
+        wires = np.hstack(wires).astype(int)
+        powers_of_two = 1 << np.arange(len(wires) - 1, -1, -1)
+        indices = self._samples[:, wires] @ powers_of_two
+        return np.bincount(indices, minlength=2 ** len(wires))
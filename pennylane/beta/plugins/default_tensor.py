@@ -355,8 +355,8 @@ class DefaultTensor(Device):
     C_DTYPE = np.complex128
     R_DTYPE = np.float64
 
-    def __init__(self, wires, shots=1000, analytic=True):
-        super().__init__(wires, shots)
+    def __init__(self, wires, shots=1000, analytic=True, seed="global"):
+        super().__init__(wires, shots, seed=seed)
         self.analytic = True
         self._nodes = []
         self._edges = []
@@ -552,7 +552,7 @@ class DefaultTensor(Device):
             joint_probabilities.append(self.ev(obs_nodes, obs_wires))
 
         outcomes = np.array([np.prod(p) for p in joint_outcomes])
-        return np.random.choice(outcomes, self.shots, p=joint_probabilities)
+        return self.rng.choice(outcomes, self.shots, p=joint_probabilities)
 
     def _get_operator_matrix(self, operation, par):
         """Get the operator matrix for a given operation or observable.
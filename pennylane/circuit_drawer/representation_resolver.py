@@ -419,6 +419,9 @@ class RepresentationResolver:
         if obs.return_type == qml.operation.Probability:
             return "Probs"
 
+        if obs.return_type == qml.operation.Counts:
+            return "Counts"
+
         # Unknown return_type
         return "{}[{}]".format(str(obs.return_type), self.operator_representation(obs, wire))
 
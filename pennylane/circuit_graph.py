@@ -20,7 +20,7 @@ from collections import Counter, OrderedDict, namedtuple
 import networkx as nx
 
 import pennylane as qml
-from pennylane.operation import Sample
+from pennylane.operation import Sample, Counts
 
 from .circuit_drawer import CHARSETS, CircuitDrawer
 from .utils import _flatten
@@ -155,6 +155,7 @@ class CircuitGraph:
             qml.operation.Variance: "var",
             qml.operation.Sample: "sample",
             qml.operation.Probability: "probs",
+            qml.operation.Counts: "counts",
         }
 
         print("\nObservables")
@@ -165,7 +166,7 @@ class CircuitGraph:
             else:
                 return_type = str(op.return_type)
 
-            if op.return_type == qml.operation.Probability:
+            if op.return_type in (qml.operation.Probability, qml.operation.Counts):
                 print("{}(wires={})".format(return_type, op.wires))
             elif op.parameters:
                 params = "".join([str(p) for p in op.parameters])
@@ -551,5 +552,5 @@ class CircuitGraph:
     @property
     def is_sampled(self):
         """Returns ``True`` if the circuit graph contains observables
-        which are sampled."""
-        return any(obs.return_type == Sample for obs in self.observables_in_order)
+        which are sampled, or whose sample counts are returned."""
+        return any(obs.return_type in (Sample, Counts) for obs in self.observables_in_order)
@@ -15,10 +15,10 @@
 """
 This module contains the functions for computing different types of measurement
 outcomes from quantum observables - expectation values, variances of expectations,
-and measurement samples.
+measurement samples, and sample counts.
 """
 import pennylane as qml
-from .operation import Observable, Sample, Variance, Expectation, Probability, Tensor
+from .operation import Observable, Sample, Variance, Expectation, Probability, Counts, Tensor
 from .qnodes import QuantumFunctionError
 
 
@@ -28,6 +28,15 @@ def _remove_if_in_queue(op):
         qml._current_context.queue.remove(op)
 
 
+def _check_not_hamiltonian(op, measurement):
+    r"""Helper function raising an error if a Hamiltonian is passed to a measurement
+    other than the expectation value"""
+    if isinstance(op, qml.Hamiltonian):
+        raise QuantumFunctionError(
+            "Hamiltonians can only be measured using expval, not {}".format(measurement)
+        )
+
+
 def expval(op):
     r"""Expectation value of the supplied observable.
 
@@ -49,6 +58,9 @@ def expval(op):
     >>> circuit(0.5)
     -0.4794255386042029
 
+    The expectation value of a :class:`~.Hamiltonian` is returned as a single
+    measurement, on devices that support it.
+
     Args:
         op (Observable): a quantum observable object
 
@@ -62,11 +74,14 @@ def expval(op):
 
     if qml._current_context is not None:
         # delete observables from QNode operation queue if needed
-        if isinstance(op, Tensor):
-            for o in op.obs:
-                _remove_if_in_queue(o)
-        else:
-            _remove_if_in_queue(op)
+        terms = op.ops if isinstance(op, qml.Hamiltonian) else [op]
+
+        for term in terms:
+            if isinstance(term, Tensor):
+                for o in term.obs:
+                    _remove_if_in_queue(o)
+
+            _remove_if_in_queue(term)
 
     # set return type to be an expectation value
     op.return_type = Expectation
@@ -110,6 +125,8 @@ def var(op):
             "{} is not an observable: cannot be used with var".format(op.name)
         )
 
+    _check_not_hamiltonian(op, "var")
+
     if qml._current_context is not None:
         # delete operations from QNode queue
         if isinstance(op, Tensor):
@@ -161,6 +178,8 @@ def sample(op):
             "{} is not an observable: cannot be used with sample".format(op.name)
         )
 
+    _check_not_hamiltonian(op, "sample")
+
     if qml._current_context is not None:
         # delete operations from QNode queue
         if isinstance(op, Tensor):
@@ -223,3 +242,44 @@ def probs(wires):
         qml._current_context._append_op(op)
 
     return op
+
+
+def counts(wires):
+    r"""Number of times each computational basis state was sampled, with the number
+    of shots determined from the ``dev.shots`` attribute of the corresponding device.
+
+    This measurement function accepts no observables, and instead
+    instructs the QNode to return a flat integer array containing the
+    number of samples of each computational basis state, in the same
+    lexicographic order as :func:`~.probs`. Unlike :func:`~.sample`, the size
+    of the returned array does not depend on the number of shots.
+
+    **Example:**
+
+    .. code-block:: python3
+
+        dev = qml.device("default.qubit", wires=2, shots=1000)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.counts(wires=[0, 1])
+
+    Executing this QNode:
+
+    >>> circuit()
+    array([497, 503,   0,   0])
+
+    Args:
+        wires (Sequence[int] or int): the wire the operation acts on
+    """
+    # pylint: disable=protected-access
+    op = qml.Identity(wires=wires, do_queue=False)
+    op.return_type = Counts
+
+    if qml._current_context is not None:
+        # add observable to QNode observable queue
+        qml._current_context._append_op(op)
+
+    return op
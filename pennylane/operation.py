@@ -40,6 +40,9 @@ and measure observables in PennyLane.
   represents an application of the operation with given parameter values to
   a given sequence of wires (subsystems).
 
+* Each :class:`~.Channel` subclass represents a type of quantum channel, for example
+  a noise process acting on a mixed state, given by a set of Kraus matrices.
+
 * Each  :class:`~.Observable` subclass represents a type of physical observable.
   Each instance of these subclasses represents an instruction to measure and
   return the respective result for the given parameter values on a
@@ -151,6 +154,7 @@ class ObservableReturnTypes(Enum):
     Variance = 2
     Expectation = 3
     Probability = 4
+    Counts = 5
 
 
 Sample = ObservableReturnTypes.Sample
@@ -168,6 +172,10 @@ Probability = ObservableReturnTypes.Probability
 """Enum: An enumeration which represents returning probabilities
 of all computational basis states."""
 
+Counts = ObservableReturnTypes.Counts
+"""Enum: An enumeration which represents returning the number of
+times each computational basis state was sampled."""
+
 # =============================================================================
 # Class property
 # =============================================================================
@@ -664,6 +672,70 @@ class Operation(Operator):
         super().__init__(*params, wires=wires, do_queue=do_queue)
 
 
+# =============================================================================
+# Base Channel class
+# =============================================================================
+
+
+class Channel(Operation):
+    r"""Base class for quantum channels.
+
+    Quantum channels are completely positive, trace-preserving maps acting on
+    the density matrix :math:`\rho` of the subsystems, given in Kraus form as
+
+    .. math:: \rho \mapsto \sum_k K_k \rho K_k^\dagger.
+
+    Channels do not have a unitary matrix representation, and are only supported
+    by devices simulating mixed states.
+
+    As with :class:`~.Operation`, the following class attributes must be
+    defined for all channels:
+
+    * :attr:`~.Operator.num_params`
+    * :attr:`~.Operator.num_wires`
+    * :attr:`~.Operator.par_domain`
+
+    In addition, channels must define the static method :meth:`_kraus_matrices`.
+
+    Args:
+        params (tuple[float, int, array, Variable]): channel parameters
+
+    Keyword Args:
+        wires (Sequence[int]): Subsystems the channel acts on. If not given, args[-1]
+            is interpreted as wires.
+        do_queue (bool): Indicates whether the channel should be
+            immediately pushed into a :class:`BaseQNode` circuit queue.
+    """
+
+    @staticmethod
+    @abc.abstractmethod
+    def _kraus_matrices(*params):
+        """Kraus matrices representing the channel in the computational basis.
+
+        This is a *static method* that should be defined for all new channels,
+        and returns the list of Kraus matrices of the channel.
+
+        **Example:**
+
+        >>> qml.BitFlip._kraus_matrices(0.1)
+        [array([[0.9486833, 0.       ],
+                [0.       , 0.9486833]]), array([[0.        , 0.31622777],
+                [0.31622777, 0.        ]])]
+
+        Returns:
+            list[array]: list of Kraus matrices
+        """
+
+    @property
+    def kraus_matrices(self):
+        """Kraus matrices of an instantiated channel in the computational basis.
+
+        Returns:
+            list[array]: list of Kraus matrices
+        """
+        return self._kraus_matrices(*self.parameters)
+
+
 # =============================================================================
 # Base Observable class
 # =============================================================================
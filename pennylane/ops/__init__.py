@@ -24,6 +24,7 @@ from pennylane.operation import Any, Observable, CVObservable
 
 from .cv import *
 from .qubit import *
+from .channel import *
 
 from .cv import __all__ as _cv__all__
 from .cv import ops as _cv__ops__
@@ -33,6 +34,9 @@ from .qubit import __all__ as _qubit__all__
 from .qubit import ops as _qubit__ops__
 from .qubit import obs as _qubit__obs__
 
+from .channel import __all__ as _channel__all__
+from .channel import channels as _channel__channels__
+
 
 class Identity(CVObservable):
     r"""pennylane.Identity(wires)
@@ -66,6 +70,6 @@ class Identity(CVObservable):
         return []
 
 
-__all__ = _cv__all__ + _qubit__all__ + ["Identity"]
-__all_ops__ = list(_cv__ops__ | _qubit__ops__)
+__all__ = _cv__all__ + _qubit__all__ + _channel__all__ + ["Identity"]
+__all_ops__ = list(_cv__ops__ | _qubit__ops__ | _channel__channels__)
 __all_obs__ = list(_cv__obs__ | _qubit__obs__) + ["Identity"]
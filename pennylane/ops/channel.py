@@ -0,0 +1,186 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the available built-in noisy qubit
+quantum channels supported by PennyLane, as well as their conventions.
+"""
+# pylint:disable=abstract-method,arguments-differ
+import numpy as np
+
+from pennylane.operation import Channel
+
+
+def _check_probability(p, name):
+    """Raise an exception if a channel parameter is not a probability.
+
+    Args:
+        p (float): channel parameter
+        name (str): name of the channel parameter
+
+    Raises:
+        ValueError: if the parameter is not between 0 and 1
+    """
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("{} must be between 0 and 1.".format(name))
+
+
+class AmplitudeDamping(Channel):
+    r"""AmplitudeDamping(gamma, wires)
+    Single-qubit amplitude damping channel.
+
+    This channel is modelled by the following Kraus matrices:
+
+    .. math::
+        K_0 = \begin{bmatrix}
+                1 & 0 \\
+                0 & \sqrt{1-\gamma}
+                \end{bmatrix}
+
+    .. math::
+        K_1 = \begin{bmatrix}
+                0 & \sqrt{\gamma}  \\
+                0 & 0
+                \end{bmatrix}
+
+    where :math:`\gamma \in [0, 1]` is the amplitude damping probability.
+
+    **Details:**
+
+    * Number of wires: 1
+    * Number of parameters: 1
+    * Gradient recipe: None; uses finite difference
+
+    Args:
+        gamma (float): amplitude damping probability
+        wires (Sequence[int] or int): the wire the channel acts on
+    """
+    num_params = 1
+    num_wires = 1
+    par_domain = "R"
+
+    @staticmethod
+    def _kraus_matrices(*params):
+        gamma = params[0]
+        _check_probability(gamma, "gamma")
+
+        K0 = np.diag([1, np.sqrt(1 - gamma)])
+        K1 = np.sqrt(gamma) * np.array([[0, 1], [0, 0]])
+        return [K0, K1]
+
+
+class BitFlip(Channel):
+    r"""BitFlip(p, wires)
+    Single-qubit bit flip (Pauli :math:`X`) channel.
+
+    This channel is modelled by the following Kraus matrices:
+
+    .. math:: K_0 = \sqrt{1-p} \begin{bmatrix}
+                1 & 0 \\
+                0 & 1
+                \end{bmatrix}
+
+    .. math:: K_1 = \sqrt{p}\begin{bmatrix}
+                0 & 1  \\
+                1 & 0
+                \end{bmatrix}
+
+    where :math:`p \in [0, 1]` is the probability of a bit flip.
+
+    **Details:**
+
+    * Number of wires: 1
+    * Number of parameters: 1
+    * Gradient recipe: None; uses finite difference
+
+    Args:
+        p (float): the probability that a bit flip error occurs
+        wires (Sequence[int] or int): the wire the channel acts on
+    """
+    num_params = 1
+    num_wires = 1
+    par_domain = "R"
+
+    @staticmethod
+    def _kraus_matrices(*params):
+        p = params[0]
+        _check_probability(p, "p")
+
+        K0 = np.sqrt(1 - p) * np.eye(2)
+        K1 = np.sqrt(p) * np.array([[0, 1], [1, 0]])
+        return [K0, K1]
+
+
+class DepolarizingChannel(Channel):
+    r"""DepolarizingChannel(p, wires)
+    Single-qubit symmetrically depolarizing channel.
+
+    This channel is modelled by the following Kraus matrices:
+
+    .. math::
+        K_0 = \sqrt{1-p} \begin{bmatrix}
+                1 & 0 \\
+                0 & 1
+                \end{bmatrix}
+
+    .. math::
+        K_1 = \sqrt{p/3}\begin{bmatrix}
+                0 & 1  \\
+                1 & 0
+                \end{bmatrix}
+
+    .. math::
+        K_2 = \sqrt{p/3}\begin{bmatrix}
+                0 & -i \\
+                i & 0
+                \end{bmatrix}
+
+    .. math::
+        K_3 = \sqrt{p/3}\begin{bmatrix}
+                1 & 0 \\
+                0 & -1
+                \end{bmatrix}
+
+    where :math:`p \in [0, 1]` is the depolarization probability, and each Pauli
+    gate is applied with probability :math:`p/3`.
+
+    **Details:**
+
+    * Number of wires: 1
+    * Number of parameters: 1
+    * Gradient recipe: None; uses finite difference
+
+    Args:
+        p (float): each Pauli gate is applied with probability :math:`\frac{p}{3}`
+        wires (Sequence[int] or int): the wire the channel acts on
+    """
+    num_params = 1
+    num_wires = 1
+    par_domain = "R"
+
+    @staticmethod
+    def _kraus_matrices(*params):
+        p = params[0]
+        _check_probability(p, "p")
+
+        K0 = np.sqrt(1 - p) * np.eye(2)
+        K1 = np.sqrt(p / 3) * np.array([[0, 1], [1, 0]])
+        K2 = np.sqrt(p / 3) * np.array([[0, -1j], [1j, 0]])
+        K3 = np.sqrt(p / 3) * np.array([[1, 0], [0, -1]])
+        return [K0, K1, K2, K3]
+
+
+channels = {"AmplitudeDamping", "BitFlip", "DepolarizingChannel"}
+
+
+__all__ = list(channels)
@@ -789,6 +789,15 @@ class CRot(Operation):
         a, b, c = params
         return CRZ._matrix(c) @ (CRY._matrix(b) @ CRZ._matrix(a))
 
+    @staticmethod
+    def decomposition(phi, theta, omega, wires):
+        decomp_ops = [
+            CRZ(phi, wires=wires),
+            CRY(theta, wires=wires),
+            CRZ(omega, wires=wires),
+        ]
+        return decomp_ops
+
 
 class U1(Operation):
     r"""U1(phi)
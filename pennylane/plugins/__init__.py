@@ -22,7 +22,11 @@ to verify and test quantum gradient computations.
     :toctree: api
 
     default_qubit
+    default_qubit_autograd
+    default_mixed
     default_gaussian
 """
 from .default_qubit import DefaultQubit
+from .default_qubit_autograd import DefaultQubitAutograd
+from .default_mixed import DefaultMixed
 from .default_gaussian import DefaultGaussian
@@ -648,6 +648,10 @@ class DefaultGaussian(Device):
             relation :math:`[\x,\p]=i\hbar`
         analytic (bool): indicates if the device should calculate expectations
             and variances analytically
+        seed (str, None, int, array_like[int], numpy.random.SeedSequence, numpy.random.Generator):
+            Seed for the random number generator used to estimate expectation values and
+            generate samples. If ``"global"`` (default), the global NumPy random state is used.
+            See :class:`~.Device` for all accepted values.
     """
     name = "Default Gaussian PennyLane plugin"
     short_name = "default.gaussian"
@@ -686,8 +690,8 @@ class DefaultGaussian(Device):
 
     _circuits = {}
 
-    def __init__(self, wires, *, shots=1000, hbar=2, analytic=True):
-        super().__init__(wires, shots)
+    def __init__(self, wires, *, shots=1000, hbar=2, analytic=True, seed="global"):
+        super().__init__(wires, shots, seed=seed)
         self.eng = None
         self.hbar = hbar
         self.analytic = analytic
@@ -778,7 +782,7 @@ class DefaultGaussian(Device):
             # estimate the ev
             # use central limit theorem, sample normal distribution once, only ok if n_eval is large
             # (see https://en.wikipedia.org/wiki/Berry%E2%80%93Esseen_theorem)
-            ev = np.random.normal(ev, np.sqrt(var / self.shots))
+            ev = self.rng.normal(ev, np.sqrt(var / self.shots))
 
         return ev
 
@@ -828,7 +832,7 @@ class DefaultGaussian(Device):
 
         stdphi = np.sqrt(covphi[0, 0])
         meanphi = muphi[0]
-        return np.random.normal(meanphi, stdphi, self.shots)
+        return self.rng.normal(meanphi, stdphi, self.shots)
 
     def reset(self):
         """Reset the device"""
@@ -0,0 +1,300 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+The default mixed-state plugin provides a simulator of noisy qubit-based quantum
+circuits.
+
+It stores the density matrix :math:`\rho` of the qubits, and supports the built-in
+:mod:`qubit operations <pennylane.ops.qubit>`, applied as :math:`U\rho U^\dagger`,
+as well as the :mod:`noisy channels <pennylane.ops.channel>` given by their Kraus
+matrices.
+"""
+import itertools
+
+import numpy as np
+
+from pennylane import QubitDevice, DeviceError, QubitStateVector, BasisState
+from pennylane.operation import Channel
+
+
+# tolerance for numerical errors
+tolerance = 1e-10
+
+
+class DefaultMixed(QubitDevice):
+    """Default mixed-state qubit device for PennyLane.
+
+    The density matrix of the ``wires`` qubits is stored as a tensor of shape
+    ``[2] * (2 * wires)``, where the first ``wires`` axes index the rows and the last
+    ``wires`` axes index the columns of the density matrix.
+
+    Args:
+        wires (int): the number of wires to initialize the device with
+        shots (int or Sequence[int]): How many times the circuit should be evaluated (or sampled)
+            to estimate the expectation values. Defaults to 1000 if not specified.
+            If ``analytic == True``, then the number of shots is ignored
+            in the calculation of expectation values and variances, and only controls the number
+            of samples returned by ``sample``.
+        analytic (bool): indicates if the device should calculate expectations
+            and variances analytically
+        seed (str, None, int, array_like[int], numpy.random.SeedSequence, numpy.random.Generator):
+            Seed for the random number generator used to generate samples. If ``"global"``
+            (default), the global NumPy random state is used. Otherwise, the device owns
+            a :class:`numpy.random.Generator` created from the seed, or from fresh entropy
+            if ``None``. See :class:`~.Device` for all accepted values.
+    """
+
+    name = "Default mixed-state qubit PennyLane plugin"
+    short_name = "default.mixed"
+    pennylane_requires = "0.9"
+    version = "0.9.0"
+    author = "Xanadu Inc."
+    _capabilities = {"inverse_operations": True}
+
+    operations = {
+        "BasisState",
+        "QubitStateVector",
+        "QubitUnitary",
+        "PauliX",
+        "PauliY",
+        "PauliZ",
+        "Hadamard",
+        "S",
+        "T",
+        "CNOT",
+        "SWAP",
+        "CSWAP",
+        "Toffoli",
+        "CZ",
+        "PhaseShift",
+        "RX",
+        "RY",
+        "RZ",
+        "Rot",
+        "CRX",
+        "CRY",
+        "CRZ",
+        "CRot",
+        "AmplitudeDamping",
+        "BitFlip",
+        "DepolarizingChannel",
+    }
+
+    observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity"}
+
+    def __init__(self, wires, *, shots=1000, analytic=True, seed="global"):
+        super().__init__(wires, shots, analytic, seed=seed)
+
+        self._state = None
+        """array[complex]: density matrix of shape ``[2] * (2 * num_wires)``"""
+
+        self._pre_rotated_state = None
+        """array[complex]: density matrix before the diagonalizing gates were applied"""
+
+        self.reset()
+
+    def _apply_to_axes(self, mat, rho, axes):
+        """Multiply a matrix into the specified axes of the density tensor.
+
+        This is the same axis contraction as :meth:`~.DefaultQubit.mat_vec_product`,
+        applied to a tensor with ``2 * num_wires`` axes.
+
+        Args:
+            mat (array): matrix to multiply
+            rho (array): density tensor of shape ``[2] * (2 * num_wires)``
+            axes (Sequence[int]): axes of the density tensor to multiply into
+
+        Returns:
+            array: density tensor after applying ``mat`` to the specified axes
+        """
+        axes = list(axes)
+        mat = np.reshape(mat, [2] * len(axes) * 2)
+        tdot = np.tensordot(mat, rho, axes=(np.arange(len(axes), 2 * len(axes)), axes))
+
+        # tensordot moves the contracted axes to the first positions
+        # of the resulting tensor; invert this permutation
+        unused_idxs = [idx for idx in range(rho.ndim) if idx not in axes]
+        perm = axes + unused_idxs
+        inv_perm = np.argsort(perm)  # argsort gives inverse permutation
+        return np.transpose(tdot, inv_perm)
+
+    def _apply_unitary(self, mat, wires):
+        r"""Apply a unitary to the specified wires of the density matrix,
+        :math:`\rho \mapsto U\rho U^\dagger`.
+
+        Args:
+            mat (array): unitary matrix to apply
+            wires (Sequence[int]): target wires
+        """
+        col_axes = [w + self.num_wires for w in wires]
+        rho = self._apply_to_axes(mat, self._state, wires)
+        self._state = self._apply_to_axes(np.conj(mat), rho, col_axes)
+
+    def _apply_channel(self, kraus, wires):
+        r"""Apply a channel in Kraus form to the specified wires of the density matrix,
+        :math:`\rho \mapsto \sum_k K_k\rho K_k^\dagger`.
+
+        Args:
+            kraus (list[array]): Kraus matrices of the channel
+            wires (Sequence[int]): target wires
+        """
+        col_axes = [w + self.num_wires for w in wires]
+        result = np.zeros_like(self._state)
+
+        for K in kraus:
+            rho = self._apply_to_axes(K, self._state, wires)
+            result += self._apply_to_axes(np.conj(K), rho, col_axes)
+
+        self._state = result
+
+    def _apply_operation(self, operation):
+        """Apply a gate or a channel to the density matrix.
+
+        Args:
+            operation (~.Operation): operation to apply
+        """
+        if isinstance(operation, Channel):
+            self._apply_channel(operation.kraus_matrices, operation.wires)
+        else:
+            self._apply_unitary(operation.matrix, operation.wires)
+
+    def apply(self, operations, rotations=None, **kwargs):
+        rotations = rotations or []
+        self._sampled_prob = None
+
+        # apply the circuit operations
+        for i, operation in enumerate(operations):
+            wires = operation.wires
+            par = operation.parameters
+
+            if i > 0 and isinstance(operation, (QubitStateVector, BasisState)):
+                raise DeviceError(
+                    "Operation {} cannot be used after other Operations have already been applied "
+                    "on a {} device.".format(operation.name, self.short_name)
+                )
+
+            if isinstance(operation, QubitStateVector):
+                input_state = np.asarray(par[0], dtype=np.complex128)
+                self.apply_state_vector(input_state, wires)
+
+            elif isinstance(operation, BasisState):
+                basis_state = par[0]
+                self.apply_basis_state(basis_state, wires)
+
+            else:
+                self._apply_operation(operation)
+
+        # store the pre-rotated state
+        self._pre_rotated_state = self._state
+
+        # apply the circuit rotations
+        for operation in rotations:
+            self._apply_operation(operation)
+
+    def _set_pure_state(self, state):
+        r"""Set the density matrix to the pure state :math:`|\psi\rangle\langle\psi|`.
+
+        Args:
+            state (array[complex]): state vector of length ``2**num_wires``
+        """
+        rho = np.outer(state, np.conj(state))
+        self._state = np.reshape(rho, [2] * 2 * self.num_wires)
+
+    def apply_state_vector(self, input_state, wires):
+        """Initialize the density matrix in the pure state given by a state vector.
+
+        Args:
+            input_state (array[complex]): normalized input state of length
+                ``2**len(wires)``
+            wires (list[int]): list of wires where the provided state should
+                be initialized
+        """
+        if not np.isclose(np.linalg.norm(input_state, 2), 1.0, atol=tolerance):
+            raise ValueError("Sum of amplitudes-squared does not equal one.")
+
+        n_state_vector = input_state.shape[0]
+
+        if input_state.ndim == 1 and n_state_vector == 2 ** len(wires):
+            # generate basis states on subset of qubits via the cartesian product
+            basis_states = np.array(list(itertools.product([0, 1], repeat=len(wires))))
+
+            # get basis states to alter on full set of qubits
+            unravelled_indices = np.zeros((2 ** len(wires), self.num_wires), dtype=int)
+            unravelled_indices[:, wires] = basis_states
+
+            # get indices for which the state is changed to input state vector elements
+            ravelled_indices = np.ravel_multi_index(unravelled_indices.T, [2] * self.num_wires)
+
+            state = np.zeros(2 ** self.num_wires, dtype=np.complex128)
+            state[ravelled_indices] = input_state
+            self._set_pure_state(state)
+        else:
+            raise ValueError("State vector must be of length 2**wires.")
+
+    def apply_basis_state(self, state, wires):
+        """Initialize the density matrix in a specified computational basis state.
+
+        Args:
+            state (array[int]): computational basis state of shape ``(wires,)``
+                consisting of 0s and 1s.
+            wires (list[int]): list of wires where the provided computational state should
+                be initialized
+        """
+        # length of basis state parameter
+        n_basis_state = len(state)
+
+        if not set(state).issubset({0, 1}):
+            raise ValueError("BasisState parameter must consist of 0 or 1 integers.")
+
+        if n_basis_state != len(wires):
+            raise ValueError("BasisState parameter and wires must be of equal length.")
+
+        # get computational basis state number
+        basis_states = 2 ** (self.num_wires - 1 - np.array(wires))
+        num = int(np.dot(state, basis_states))
+
+        self._state = np.zeros([2 ** self.num_wires] * 2, dtype=np.complex128)
+        self._state[num, num] = 1.0
+        self._state = np.reshape(self._state, [2] * 2 * self.num_wires)
+
+    @property
+    def state(self):
+        """Returns the density matrix of the circuit prior to measurement.
+
+        Returns:
+            array[complex]: density matrix of shape ``(2**num_wires, 2**num_wires)``
+        """
+        dim = 2 ** self.num_wires
+        return np.reshape(self._pre_rotated_state, (dim, dim))
+
+    def reset(self):
+        """Reset the device"""
+        # init the density matrix to |00..0><00..0|
+        super().reset()
+        self.apply_basis_state([0] * self.num_wires, list(range(self.num_wires)))
+        self._pre_rotated_state = self._state
+
+    def probability(self, wires=None):
+        if self._state is None:
+            return None
+
+        wires = wires or range(self.num_wires)
+
+        # the probabilities of the computational basis states are the diagonal
+        # elements of the density matrix; numerical errors may leave these
+        # slightly negative, which would prevent sampling from them
+        dim = 2 ** self.num_wires
+        prob = np.real(np.diagonal(np.reshape(self._state, (dim, dim))))
+        prob = np.maximum(prob, 0)
+        return self.marginal_prob(prob, wires)
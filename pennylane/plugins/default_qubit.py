@@ -19,29 +19,218 @@ It implements the necessary :class:`~pennylane._device.Device` methods as well a
 :mod:`qubit operations <pennylane.ops.qubit>`, and provides a very simple pure state
 simulation of a qubit-based quantum circuit architecture.
 """
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import itertools
+import tempfile
 
 import numpy as np
 
 from pennylane import QubitDevice, DeviceError, QubitStateVector, BasisState
+from pennylane._qubit_device import _marginal_axes
+from pennylane.operation import Expectation, Probability, Tensor, Variance
+from pennylane.variable import Variable
+from pennylane.vqe import Hamiltonian
 
 
 # tolerance for numerical errors
 tolerance = 1e-10
 
 
+@functools.lru_cache()
+def _basis_slices(num_wires, wires):
+    """Index tuples selecting the computational basis blocks of a ``[2] * num_wires``
+    state tensor with respect to the target wires.
+
+    The :math:`k`-th index tuple fixes the axes corresponding to ``wires`` to the bits
+    of :math:`k` (where ``wires[0]`` is the most significant bit), leaving all other
+    axes unrestricted. Indexing with the resulting tuples always returns a view.
+
+    Args:
+        num_wires (int): number of axes of the state tensor
+        wires (tuple[int]): target wires
+
+    Returns:
+        list[tuple]: list of ``2 ** len(wires)`` index tuples
+    """
+    slices = []
+
+    for bits in itertools.product([0, 1], repeat=len(wires)):
+        idx = [slice(None)] * num_wires
+        for w, b in zip(wires, bits):
+            idx[w] = b
+
+        # the leading ellipsis ensures that basic indexing returns
+        # a (possibly zero-dimensional) view rather than a scalar
+        slices.append((Ellipsis, *idx))
+
+    return slices
+
+
+def _permute_blocks(perm, vec, out, slices):
+    """Copy the blocks of ``vec`` into ``out`` in permuted order.
+
+    Args:
+        perm (Sequence[int]): output block ``i`` is copied from input block ``perm[i]``
+        vec (array[complex]): input state tensor
+        out (array[complex]): output state tensor
+        slices (list[tuple]): index tuples selecting the blocks, as returned
+            by :func:`_basis_slices`
+    """
+    for out_idx, j in zip(slices, perm):
+        np.copyto(out[out_idx], vec[slices[j]])
+
+
+def _scale_blocks(diag, vec, out, slices):
+    """Multiply each block of ``vec`` by the corresponding phase, writing into ``out``.
+
+    Args:
+        diag (array[complex]): the phases; ``diag[i]`` must be a scalar or broadcastable
+            against the blocks
+        vec (array[complex]): input state tensor
+        out (array[complex]): output state tensor
+        slices (list[tuple]): index tuples selecting the blocks, as returned
+            by :func:`_basis_slices`
+    """
+    for idx, phase in zip(slices, diag):
+        if np.ndim(phase) == 0 and phase == 1:
+            np.copyto(out[idx], vec[idx])
+        else:
+            np.multiply(vec[idx], phase, out=out[idx])
+
+
+def _mix_blocks(mat, vec, out, slices):
+    r"""Accumulate the output blocks :math:`\text{out}_i = \sum_j U_{ij}\,\text{vec}_j`.
+
+    Args:
+        mat (array[complex]): the matrix; ``mat[i, j]`` must be a scalar or broadcastable
+            against the blocks
+        vec (array[complex]): input state tensor
+        out (array[complex]): output state tensor; must not share memory with ``vec``
+        slices (list[tuple]): index tuples selecting the blocks, as returned
+            by :func:`_basis_slices`
+    """
+    for i, out_idx in enumerate(slices):
+        block = out[out_idx]
+        np.multiply(vec[slices[0]], mat[i, 0], out=block)
+
+        for j in range(1, len(slices)):
+            block += mat[i, j] * vec[slices[j]]
+
+
+def _sparse_split(indices, wires, num_wires):
+    """Split computational basis state indices into the basis state of the target wires
+    and the bits of the remaining wires.
+
+    Args:
+        indices (array[int]): computational basis state indices of all wires
+        wires (Sequence[int]): target wires; ``wires[0]`` is the most significant bit
+            of the returned basis states
+        num_wires (int): number of wires of the device
+
+    Returns:
+        tuple[array[int], array[int], array[int]]: the basis state indices of the target
+        wires, the indices with the bits of the target wires cleared, and for each basis
+        state of the target wires the bits to set in the cleared indices
+    """
+    shifts = num_wires - 1 - np.asarray(wires, dtype=np.int64)
+    wire_bits = np.left_shift(1, shifts)
+    powers_of_two = np.left_shift(1, np.arange(len(wires) - 1, -1, -1, dtype=np.int64))
+
+    sub = ((indices[:, None] >> shifts) & 1) @ powers_of_two
+    rest = indices & ~np.sum(wire_bits)
+
+    basis = np.array(list(itertools.product([0, 1], repeat=len(wires))), dtype=np.int64)
+    offsets = np.reshape(basis @ wire_bits, -1)
+    return sub, rest, offsets
+
+
+def _pauli_word(observable):
+    """Represent an observable as a Pauli word, if possible.
+
+    Args:
+        observable (~.Observable): a single observable, or a tensor product of observables
+
+    Returns:
+        None or dict[int, str]: dictionary mapping each wire to the Pauli operator
+        acting on it (``"PauliX"``, ``"PauliY"`` or ``"PauliZ"``), or ``None`` if the observable
+        is not a tensor product of Pauli operators and identities on distinct wires
+    """
+    factors = observable.obs if isinstance(observable, Tensor) else [observable]
+    word = {}
+    wires = set()
+
+    for obs in factors:
+        if obs.name not in ("PauliX", "PauliY", "PauliZ", "Identity"):
+            return None
+
+        wire = obs.wires[0]
+
+        if wire in wires:
+            return None
+
+        wires.add(wire)
+
+        if obs.name != "Identity":
+            word[wire] = obs.name
+
+    return word
+
+
 class DefaultQubit(QubitDevice):
     """Default qubit device for PennyLane.
 
     Args:
         wires (int): the number of modes to initialize the device in
-        shots (int): How many times the circuit should be evaluated (or sampled) to estimate
-            the expectation values. Defaults to 1000 if not specified.
+        shots (int or Sequence[int]): How many times the circuit should be evaluated (or sampled)
+            to estimate the expectation values. Defaults to 1000 if not specified.
             If ``analytic == True``, then the number of shots is ignored
             in the calculation of expectation values and variances, and only controls the number
-            of samples returned by ``sample``.
+            of samples returned by ``sample``. If a sequence of shot numbers is passed, the
+            circuit is simulated once and the results for each number of shots are returned.
         analytic (bool): indicates if the device should calculate expectations
             and variances analytically
+        fusion (int): maximum number of wires of a fused gate. If non-zero, runs of
+            consecutive gates acting on nested sets of at most ``fusion`` wires are
+            merged into a single unitary before being applied. Defaults to 0,
+            which disables gate fusion.
+        c_dtype (type): complex floating point type of the state vector and gate
+            matrices. Use ``np.complex64`` to halve the memory footprint of the
+            simulation at the cost of precision. Defaults to ``np.complex128``.
+        num_threads (int): number of threads used to apply gates and compute
+            probabilities on devices with many wires. The state vector is split into
+            chunks over the highest-order wires not acted on, which are processed in
+            parallel. Defaults to 1.
+        storage (str): where the state vector is stored. Either ``"memory"`` (default),
+            or ``"memmap"``, in which case the state vector is kept in a memory-mapped
+            temporary file in the default temporary directory (see :func:`tempfile.gettempdir`),
+            and gates are applied chunk by chunk, or ``"sparse"``, in which case only the
+            non-zero amplitudes and their indices are stored, and gates are applied to them
+            directly. The sparse state is converted to a dense state vector in memory once
+            the fraction of non-zero amplitudes exceeds ``sparse_threshold``.
+        sparse_threshold (float): fraction of non-zero amplitudes above which a sparse state
+            is converted to a dense state vector. States with at most 64 non-zero
+            amplitudes are always kept sparse, since they are cheap to store either way.
+            Only used if ``storage="sparse"``. Defaults to 0.05.
+        chunk_size (int): maximum number of amplitudes processed at once when applying gates
+            and computing probabilities, bounding the size of temporary arrays. Defaults to
+            ``2**20`` if ``storage="memmap"``, and to no limit otherwise.
+        shot_chunk_size (int): maximum number of samples generated at once when estimating
+            expectation values and variances in finite-shot mode. Defaults to ``None``,
+            which generates all samples at once.
+        checkpoints (int): maximum number of state vector checkpoints stored by the device.
+            If non-zero, the state after the longest prefix of operations whose parameters
+            did not change since the previous execution of the same circuit is stored, and
+            subsequent executions of the circuit starting with the same prefix resume from it.
+            This avoids replaying unchanged gates, for example when computing gradients
+            with the parameter-shift rule. Requires ``storage="memory"``. Defaults to 0,
+            which disables checkpointing.
+        seed (str, None, int, array_like[int], numpy.random.SeedSequence, numpy.random.Generator):
+            Seed for the random number generator used to generate samples. If ``"global"``
+            (default), the global NumPy random state is used. Otherwise, the device owns
+            a :class:`numpy.random.Generator` created from the seed, or from fresh entropy
+            if ``None``. See :class:`~.Device` for all accepted values.
     """
 
     name = "Default qubit PennyLane plugin"
@@ -49,7 +238,7 @@ class DefaultQubit(QubitDevice):
     pennylane_requires = "0.9"
     version = "0.9.0"
     author = "Xanadu Inc."
-    _capabilities = {"inverse_operations": True}
+    _capabilities = {"inverse_operations": True, "provides_adjoint_jacobian": True}
 
     operations = {
         "BasisState",
@@ -77,23 +266,163 @@ class DefaultQubit(QubitDevice):
         "CRot",
     }
 
-    observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity"}
+    observables = {"PauliX", "PauliY", "PauliZ", "Hadamard", "Hermitian", "Identity", "Hamiltonian"}
+
+    _diagonal_operations = {"PauliZ", "S", "T", "RZ", "PhaseShift", "CZ", "CRZ"}
+    """set[str]: operations whose matrix is diagonal in the computational basis,
+    and which are therefore applied as an elementwise multiplication"""
 
-    def __init__(self, wires, *, shots=1000, analytic=True):
+    _permutation_operations = {
+        "PauliX": (1, 0),
+        "CNOT": (0, 1, 3, 2),
+        "SWAP": (0, 2, 1, 3),
+        "CSWAP": (0, 1, 2, 3, 4, 6, 5, 7),
+        "Toffoli": (0, 1, 2, 3, 4, 5, 7, 6),
+    }
+    """dict[str, tuple[int]]: operations that permute the computational basis states,
+    mapped to the permutation. Output basis state ``i`` is taken from input basis state
+    ``perm[i]``. All of these operations are self-inverse."""
+
+    _min_threaded_wires = 16
+    """int: minimum number of wires for which gates are applied using multiple threads"""
+
+    _default_memmap_chunk_size = 2 ** 20
+    """int: default chunk size if the state vector is memory-mapped"""
+
+    _min_dense_amplitudes = 64
+    """int: number of non-zero amplitudes up to which a sparse state is never made dense,
+    independently of ``sparse_threshold``"""
+
+    def __init__(
+        self,
+        wires,
+        *,
+        shots=1000,
+        analytic=True,
+        fusion=0,
+        c_dtype=np.complex128,
+        num_threads=1,
+        storage="memory",
+        sparse_threshold=0.05,
+        chunk_size=None,
+        shot_chunk_size=None,
+        checkpoints=0,
+        seed="global"
+    ):
         self.eng = None
         self.analytic = analytic
 
-        self._state = np.zeros(2 ** wires, dtype=complex)
+        c_dtype = np.dtype(c_dtype)
+
+        if not np.issubdtype(c_dtype, np.complexfloating):
+            raise DeviceError(
+                "The {} device requires a complex floating point type, "
+                "not {}.".format(self.short_name, c_dtype)
+            )
+
+        self.c_dtype = c_dtype
+        """numpy.dtype: complex floating point type of the state vector"""
+
+        if storage not in ("memory", "memmap", "sparse"):
+            raise DeviceError(
+                "Unknown storage {} for the {} device; "
+                "must be 'memory', 'memmap' or 'sparse'.".format(storage, self.short_name)
+            )
+
+        self.storage = storage
+        """str: where the state vector is stored, either ``"memory"``, ``"memmap"``
+        or ``"sparse"``"""
+
+        self.sparse_threshold = sparse_threshold
+        """float: fraction of non-zero amplitudes above which a sparse state is made dense"""
+
+        self._sparse_state = None
+        """None or tuple[array[int], array[complex]]: sorted indices and values of the non-zero
+        amplitudes, if the state is stored sparsely; ``None`` if the state vector is dense"""
+
+        self._pre_rotated_sparse_state = None
+        """None or tuple[array[int], array[complex]]: the sparse pre-rotated state"""
+
+        if chunk_size is None and storage == "memmap":
+            chunk_size = self._default_memmap_chunk_size
+
+        if chunk_size is not None and chunk_size < 1:
+            raise DeviceError("The chunk size must be a positive integer.")
+
+        self.chunk_size = chunk_size
+        """None or int: maximum number of amplitudes processed at once"""
+
+        self._buffer = None
+        """None or array[complex]: preallocated array the next gate application writes into"""
+
+        if num_threads < 1:
+            raise DeviceError("The number of threads must be a positive integer.")
+
+        self.num_threads = num_threads
+        """int: number of threads used to apply gates and compute probabilities"""
+
+        self._executor = None
+        """None or ThreadPoolExecutor: thread pool, created on first use"""
+
+        self._prob = None
+        """None or array[float]: cached probabilities of the computational basis states"""
+
+        self._prob_state = None
+        """None or array[complex]: the state vector the cached probabilities belong to"""
+
+        self._rotations = []
+        """list[~.Operation]: diagonalizing gates that have not yet been applied to the state"""
+
+        if checkpoints and storage != "memory":
+            raise DeviceError("State vector checkpoints require storage='memory'.")
+
+        self.checkpoints = checkpoints
+        """int: maximum number of state vector checkpoints; 0 if checkpointing is disabled"""
+
+        self._checkpoints = OrderedDict()
+        """OrderedDict[tuple[int, tuple], array[complex]]: state vectors after a prefix of the
+        operations of a circuit, keyed by the circuit hash and the parameters of the prefix"""
+
+        self._last_parameters = None
+        """None or tuple[int, list[tuple]]: hash and operation parameters of the last
+        executed circuit"""
+
+        super().__init__(
+            wires, shots, analytic, fusion=fusion, shot_chunk_size=shot_chunk_size, seed=seed
+        )
+
+        self._init_state()
+
+    def _init_state(self):
+        """Initialize the state in the all-zero computational basis state."""
+        if self.storage == "sparse":
+            self._state = self._pre_rotated_state = None
+            self._sparse_state = (np.zeros(1, dtype=np.int64), np.ones(1, dtype=self.c_dtype))
+            self._pre_rotated_sparse_state = self._sparse_state
+            return
+
+        self._state = self._zeros()
         self._state[0] = 1
         self._pre_rotated_state = self._state
 
-        super().__init__(wires, shots, analytic)
-
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
+        self._prob = self._sampled_prob = None
+
+        start, checkpoint = 0, None
+
+        if self._sparse_state is not None:
+            # the initial state is never needed once the circuit is applied
+            self._pre_rotated_sparse_state = None
+
+        if self.checkpoints and self._circuit_hash is not None:
+            start, checkpoint = self._restore_checkpoint(operations)
 
         # apply the circuit operations
-        for i, operation in enumerate(operations):
+        for i, operation in enumerate(operations[start:], start):
+            if i == checkpoint:
+                self._save_checkpoint(i)
+
             # number of wires on device
             wires = operation.wires
             par = operation.parameters
@@ -113,19 +442,112 @@ class DefaultQubit(QubitDevice):
                 self.apply_basis_state(basis_state, wires)
 
             else:
-                self._state = self.mat_vec_product(operation.matrix, self._state, wires)
+                self._apply_operation(operation)
+
+        if checkpoint == len(operations):
+            self._save_checkpoint(checkpoint)
 
         # store the pre-rotated state
         self._pre_rotated_state = self._state
+        self._pre_rotated_sparse_state = self._sparse_state
+
+        # The circuit rotations are only applied once the rotated state is required.
+        # Expectation values of Pauli words are computed from the pre-rotated state,
+        # so if all observables are Pauli words, the rotations are never applied.
+        self._rotations = list(rotations)
+
+    @staticmethod
+    def _parameter_key(operation):
+        """Hashable representation of the parameter values of an operation.
+
+        Args:
+            operation (~.Operation): operation
+
+        Returns:
+            tuple: the data type, shape and raw bytes of each parameter
+        """
+        key = []
+
+        for p in operation.parameters:
+            p = np.asarray(p)
+            key.append((p.dtype.str, p.shape, p.tobytes()))
+
+        return tuple(key)
+
+    def _restore_checkpoint(self, operations):
+        """Resume from the longest checkpointed prefix of the operations of the current circuit.
+
+        The state vector is set to a copy of the checkpointed state, if any. The prefix
+        of operations whose parameters are unchanged since the previous execution of the
+        circuit is returned as the next prefix to checkpoint.
+
+        Args:
+            operations (list[~.Operation]): operations to apply
+
+        Returns:
+            tuple[int, None or int]: the number of operations already applied, and the number
+            of operations after which to store a checkpoint, or ``None``
+        """
+        circuit_hash = self._circuit_hash
+        keys = [self._parameter_key(op) for op in operations]
+
+        start, restored = 0, None
+
+        for key in self._checkpoints:
+            h, prefix = key
+
+            if h == circuit_hash and len(prefix) > start and tuple(keys[: len(prefix)]) == prefix:
+                start, restored = len(prefix), key
+
+        if restored is not None:
+            self._checkpoints.move_to_end(restored)
+            self._state = np.copy(self._checkpoints[restored])
+
+        checkpoint = None
+
+        if self._last_parameters is not None and self._last_parameters[0] == circuit_hash:
+            unchanged = 0
+
+            for previous, current in zip(self._last_parameters[1], keys):
+                if previous != current:
+                    break
+                unchanged += 1
+
+            if unchanged > start:
+                checkpoint = unchanged
+
+        self._last_parameters = (circuit_hash, keys)
+        return start, checkpoint
+
+    def _save_checkpoint(self, num_operations):
+        """Store a copy of the state vector after applying a prefix of the operations
+        of the current circuit.
+
+        The least recently used checkpoint is discarded if more than :attr:`checkpoints`
+        checkpoints are stored.
+
+        Args:
+            num_operations (int): number of operations applied to the state vector
+        """
+        circuit_hash, keys = self._last_parameters
+        key = (circuit_hash, tuple(keys[:num_operations]))
+        self._checkpoints[key] = np.copy(self._state)
+
+        if len(self._checkpoints) > self.checkpoints:
+            self._checkpoints.popitem(last=False)
+
+    def _apply_rotations(self):
+        """Apply the pending diagonalizing gates to the state vector."""
+        rotations, self._rotations = self._rotations, []
 
-        # apply the circuit rotations
         for operation in rotations:
-            wires = operation.wires
-            par = operation.parameters
-            self._state = self.mat_vec_product(operation.matrix, self._state, wires)
+            self._apply_operation(operation)
 
     @property
     def state(self):
+        if self._pre_rotated_sparse_state is not None:
+            return self._sparse_to_dense(self._pre_rotated_sparse_state)
+
         return self._pre_rotated_state
 
     def apply_state_vector(self, input_state, wires):
@@ -152,7 +574,14 @@ class DefaultQubit(QubitDevice):
 
             # get indices for which the state is changed to input state vector elements
             ravelled_indices = np.ravel_multi_index(unravelled_indices.T, [2] * self.num_wires)
-            self._state = np.zeros_like(self._state)
+
+            if self._sparse_state is not None:
+                nonzero = input_state != 0
+                amplitudes = np.asarray(input_state[nonzero], dtype=self.c_dtype)
+                self._set_sparse_state(ravelled_indices[nonzero], amplitudes)
+                return
+
+            self._state = self._zeros()
             self._state[ravelled_indices] = input_state
         else:
             raise ValueError("State vector must be of length 2**wires.")
@@ -179,9 +608,515 @@ class DefaultQubit(QubitDevice):
         basis_states = 2 ** (self.num_wires - 1 - np.array(wires))
         num = int(np.dot(state, basis_states))
 
-        self._state = np.zeros_like(self._state)
+        if self._sparse_state is not None:
+            self._sparse_state = (np.array([num], dtype=np.int64), np.ones(1, dtype=self.c_dtype))
+            return
+
+        self._state = self._zeros()
         self._state[num] = 1.0
 
+    def _apply_operation(self, operation):
+        """Apply a gate to the state vector, using the cheapest available kernel.
+
+        Permutation gates are applied by :meth:`_apply_permutation`, diagonal gates
+        by :meth:`_apply_diagonal`, and all remaining gates by :meth:`_apply_unitary`.
+
+        Args:
+            operation (~.Operation): operation to apply
+        """
+        wires = operation.wires
+        name = operation.base_name
+
+        if self._sparse_state is not None:
+            self._apply_sparse(operation)
+            return
+
+        if name in self._permutation_operations:
+            self._apply_permutation(self._permutation_operations[name], wires)
+
+        elif name in self._diagonal_operations:
+            self._apply_diagonal(np.diag(operation.matrix), wires)
+
+        else:
+            self._apply_unitary(operation.matrix, wires)
+
+    def _apply_permutation(self, perm, wires):
+        """Apply a permutation of the computational basis states of the specified wires.
+
+        Each output block is a copy of an input block; no arithmetic is performed.
+
+        Args:
+            perm (Sequence[int]): output basis state ``i`` of the target wires is
+                taken from input basis state ``perm[i]``
+            wires (Sequence[int]): target subsystems
+        """
+        out = self._get_buffer()
+        self._run_kernel(_permute_blocks, perm, self._state, out, wires)
+        self._swap_buffer(out)
+
+    def _apply_diagonal(self, diag, wires):
+        """Apply a gate that is diagonal in the computational basis to the specified wires.
+
+        Each block of the state is multiplied by the corresponding phase; blocks with
+        a unit phase are copied.
+
+        Args:
+            diag (array[complex]): the diagonal of the gate matrix
+            wires (Sequence[int]): target subsystems
+        """
+        out = self._get_buffer()
+        diag = np.asarray(diag, dtype=self.c_dtype)
+        self._run_kernel(_scale_blocks, diag, self._state, out, wires)
+        self._swap_buffer(out)
+
+    def _apply_unitary(self, mat, wires):
+        """Apply a unitary matrix to the specified wires of the state vector.
+
+        One- and two-qubit gates are applied by :meth:`_apply_small_unitary`, which writes
+        into a preallocated buffer. Gates acting on three or more wires fall back
+        to :meth:`mat_vec_product`, unless the state vector is memory-mapped or processed
+        in chunks.
+
+        Args:
+            mat (array): unitary matrix to apply
+            wires (Sequence[int]): target subsystems
+        """
+        mat = np.asarray(mat, dtype=self.c_dtype)
+
+        if len(wires) > 2 and self.storage != "memmap" and not self._chunk_wires(wires):
+            self._state = self.mat_vec_product(mat, self._state, wires)
+            return
+
+        out = self._get_buffer()
+        self._apply_small_unitary(mat, self._state, wires, out)
+        self._swap_buffer(out)
+
+    def _apply_sparse(self, operation):
+        """Apply a gate to the non-zero amplitudes of a sparse state.
+
+        Permutation gates only change the indices, and diagonal gates only the values of the
+        non-zero amplitudes. For all other gates, each non-zero amplitude contributes to the
+        ``2**len(wires)`` amplitudes that differ from it on the target wires.
+
+        Args:
+            operation (~.Operation): operation to apply
+        """
+        wires = operation.wires
+        name = operation.base_name
+        indices, amplitudes = self._sparse_state
+        sub, rest, offsets = _sparse_split(indices, wires, self.num_wires)
+
+        if name in self._permutation_operations:
+            # output basis state i is taken from input basis state perm[i]
+            target = np.argsort(self._permutation_operations[name])
+            self._set_sparse_state(rest | offsets[target[sub]], amplitudes)
+            return
+
+        if name in self._diagonal_operations:
+            diag = np.asarray(np.diag(operation.matrix), dtype=self.c_dtype)
+            self._set_sparse_state(indices, amplitudes * diag[sub])
+            return
+
+        mat = np.asarray(operation.matrix, dtype=self.c_dtype)
+        new_indices = np.ravel(rest[None, :] | offsets[:, None])
+        new_amplitudes = np.ravel(mat[:, sub] * amplitudes[None, :])
+        self._set_sparse_state(new_indices, new_amplitudes)
+
+    def _set_sparse_state(self, indices, amplitudes):
+        """Set the sparse state, summing the amplitudes of repeated indices and dropping
+        amplitudes that are zero up to :data:`tolerance`.
+
+        The state is converted to a dense state vector if the fraction of non-zero
+        amplitudes exceeds :attr:`sparse_threshold`, and their number exceeds
+        :attr:`_min_dense_amplitudes`.
+
+        Args:
+            indices (array[int]): computational basis state indices
+            amplitudes (array[complex]): amplitudes of the basis states
+        """
+        indices, inverse = np.unique(indices, return_inverse=True)
+
+        if len(indices) < len(inverse):
+            summed = np.zeros(len(indices), dtype=self.c_dtype)
+            np.add.at(summed, inverse, amplitudes)
+            amplitudes = summed
+        else:
+            amplitudes = amplitudes[np.argsort(inverse)]
+
+        nonzero = np.abs(amplitudes) > tolerance
+        self._sparse_state = (indices[nonzero], amplitudes[nonzero])
+
+        nnz = np.count_nonzero(nonzero)
+
+        if nnz > self._min_dense_amplitudes and nnz > self.sparse_threshold * 2 ** self.num_wires:
+            self._densify()
+
+    def _sparse_to_dense(self, sparse_state):
+        """Convert a sparse state to a dense state vector.
+
+        Args:
+            sparse_state (tuple[array[int], array[complex]]): indices and values of the
+                non-zero amplitudes
+
+        Returns:
+            array[complex]: state vector of length ``2**num_wires``
+        """
+        indices, amplitudes = sparse_state
+        state = self._zeros()
+        state[indices] = amplitudes
+        return state
+
+    def _densify(self):
+        """Convert the sparse state, if any, to a dense state vector in memory."""
+        if self._sparse_state is None:
+            return
+
+        self._state = self._sparse_to_dense(self._sparse_state)
+
+        if self._pre_rotated_sparse_state is self._sparse_state:
+            self._pre_rotated_state = self._state
+        elif self._pre_rotated_sparse_state is not None:
+            self._pre_rotated_state = self._sparse_to_dense(self._pre_rotated_sparse_state)
+        else:
+            self._pre_rotated_state = None
+
+        self._sparse_state = self._pre_rotated_sparse_state = None
+
+    def _sparse_marginal_prob(self, wires):
+        """Compute the marginal probability of a sparse state.
+
+        Args:
+            wires (Sequence[int]): wires to return the marginal probabilities for
+
+        Returns:
+            array[float]: array of the resulting marginal probabilities
+        """
+        wires = list(np.hstack(wires))
+        indices, amplitudes = self._sparse_state
+        sub, _, _ = _sparse_split(indices, wires, self.num_wires)
+        return np.bincount(sub, weights=np.abs(amplitudes) ** 2, minlength=2 ** len(wires))
+
+    def _chunk_wires(self, wires):
+        """Wires over which the state vector is split into chunks that are processed
+        separately.
+
+        The state vector is split into at least one chunk per thread if multithreading is
+        enabled, and into chunks whose blocks contain at most :attr:`chunk_size` amplitudes
+        if a chunk size is set.
+
+        Args:
+            wires (Sequence[int]): wires acted on by the gate
+
+        Returns:
+            list[int]: the highest-order wires not in ``wires`` used to split the state vector;
+            empty if the state vector is processed in one go
+        """
+        num_chunk_wires = 0
+
+        if self.num_threads > 1 and self.num_wires >= self._min_threaded_wires:
+            num_chunk_wires = int(np.ceil(np.log2(self.num_threads)))
+
+        if self.chunk_size is not None:
+            block_wires = self.num_wires - len(wires)
+            max_block_wires = int(np.floor(np.log2(self.chunk_size)))
+            num_chunk_wires = max(num_chunk_wires, block_wires - max_block_wires)
+
+        free_wires = [w for w in range(self.num_wires) if w not in wires]
+        return free_wires[:num_chunk_wires]
+
+    def _run_kernel(self, kernel, coeffs, vec, out, wires):
+        """Run a slicing kernel on the state vector, splitting the work between threads
+        if multithreading is enabled.
+
+        Args:
+            kernel (callable): one of the slicing kernels, with signature
+                ``kernel(coeffs, vec, out, slices)``
+            coeffs (array): the permutation, phases or matrix passed to the kernel
+            vec (array[complex]): input state vector
+            out (array[complex]): output state vector
+            wires (Sequence[int]): target subsystems
+        """
+        vec = np.reshape(vec, [2] * self.num_wires)
+        out = np.reshape(out, [2] * self.num_wires)
+
+        chunk_wires = self._chunk_wires(wires)
+        slices = _basis_slices(self.num_wires, tuple(chunk_wires) + tuple(wires))
+
+        if not chunk_wires:
+            kernel(coeffs, vec, out, slices)
+            return
+
+        # the chunk wires are the most significant bits of the slice index
+        size = 2 ** len(wires)
+        chunks = [slices[i : i + size] for i in range(0, len(slices), size)]
+        list(self._map(lambda c: kernel(coeffs, vec, out, c), chunks))
+
+    def _map(self, fn, iterable):
+        """Apply a function to each element of an iterable, using the thread pool
+        if multithreading is enabled.
+
+        Args:
+            fn (callable): function to apply
+            iterable (Iterable): the arguments
+
+        Returns:
+            Iterator: the results, in order
+        """
+        if self.num_threads == 1:
+            return map(fn, iterable)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
+
+        return self._executor.map(fn, iterable)
+
+    def _zeros(self):
+        """Allocate a zero-initialized state vector, using the storage of the device.
+
+        Returns:
+            array[complex]: array of length ``2**num_wires``
+        """
+        shape = (2 ** self.num_wires,)
+
+        if self.storage == "memmap":
+            # the file is unlinked on closing, but its contents remain
+            # accessible via the memory map
+            with tempfile.TemporaryFile() as f:
+                return np.memmap(f, dtype=self.c_dtype, mode="w+", shape=shape)
+
+        return np.zeros(shape, dtype=self.c_dtype)
+
+    def _get_buffer(self):
+        """Returns the preallocated buffer for the next gate application, allocating
+        a new one if no suitable buffer is available.
+
+        Returns:
+            array[complex]: C-contiguous array of length ``2**num_wires``
+        """
+        buffer, self._buffer = self._buffer, None
+
+        if (
+            buffer is None
+            or buffer.dtype != self.c_dtype
+            or buffer.shape != (2 ** self.num_wires,)
+            or not buffer.flags.c_contiguous
+        ):
+            buffer = self._zeros()
+
+        return buffer
+
+    def _swap_buffer(self, out):
+        """Make ``out`` the new state vector, and recycle the previous state vector
+        as the buffer for the next gate application.
+
+        The pre-rotated state is made available via :attr:`state`, and is therefore
+        never recycled.
+
+        Args:
+            out (array[complex]): the updated state vector
+        """
+        if self._state is not self._pre_rotated_state:
+            self._buffer = self._state
+
+        self._state = out
+
+    def _apply_small_unitary(self, mat, vec, wires, out):
+        r"""Apply a unitary to a state vector by strided slicing.
+
+        Rather than contracting the full state tensor with the gate, the state is viewed as a
+        ``[2] * num_wires`` tensor, and each of the :math:`2^k` output blocks is accumulated
+        from the input blocks via :math:`\text{out}_i = \sum_j U_{ij}\,\text{vec}_j`.
+        No reshaping copies or transpositions of the state are required.
+
+        Args:
+            mat (array): matrix to multiply
+            vec (array): state vector to multiply
+            wires (Sequence[int]): target subsystems
+            out (array[complex]): C-contiguous array the result is written into;
+                must not share memory with ``vec``
+
+        Returns:
+            array[complex]: the array ``out``
+        """
+        dim = 2 ** len(wires)
+        self._run_kernel(_mix_blocks, np.reshape(mat, (dim, dim)), vec, out, wires)
+        return out
+
+    def batch_execute(self, circuit, parameters, **kwargs):
+        """Execute a circuit for a batch of positional parameter values.
+
+        In analytic mode, circuits that only return expectation values, variances
+        and probabilities are simulated for the whole batch at once: the device holds
+        a ``(batch_size, 2**num_wires)`` stack of state vectors, and each gate is
+        applied to all of them using the slicing kernels, with the gate matrices of
+        parametrized operations broadcast along the batch dimension.
+        Other circuits are executed row by row.
+
+        Args:
+            circuit (~.CircuitGraph): circuit to execute on the device
+            parameters (array[float]): positional parameter values of shape
+                ``(batch_size, num_variables)``
+
+        Returns:
+            array[float]: measured value(s), with one row per set of parameter values
+        """
+        parameters = np.asarray(parameters)
+
+        if not self._batchable(circuit):
+            return super().batch_execute(circuit, parameters, **kwargs)
+
+        self.check_validity(circuit.operations, circuit.observables)
+        self.reset()
+        self._circuit_hash = circuit.hash
+
+        batch_size = len(parameters)
+        variable_ops = {id(d.op) for deps in circuit.variable_deps.values() for d in deps}
+        operations = circuit.operations
+
+        if operations and isinstance(operations[0], (QubitStateVector, BasisState)):
+            # state preparations are independent of the batch parameters
+            self.apply(operations[:1])
+            operations = operations[1:]
+
+        shape = [batch_size] + [2] * self.num_wires
+        state = np.repeat(self._state[np.newaxis], batch_size, axis=0).reshape(shape)
+        out = np.empty_like(state)
+
+        saved_values = Variable.positional_arg_values
+
+        try:
+            for op in operations + circuit.diagonalizing_gates:
+                if id(op) in variable_ops:
+                    mats = []
+
+                    for values in parameters:
+                        Variable.positional_arg_values = values
+                        mats.append(op.matrix)
+
+                    mats = np.stack(mats)
+                else:
+                    mats = op.matrix
+
+                self._apply_batched(op, mats, state, out)
+                state, out = out, state
+        finally:
+            Variable.positional_arg_values = saved_values
+
+        prob = np.abs(state) ** 2
+        results = []
+
+        for obs in circuit.observables:
+            marginal = self._batched_marginal_prob(prob, obs.wires)
+
+            if obs.return_type is Probability:
+                results.append(marginal)
+                continue
+
+            eigvals = obs.eigvals
+            mean = marginal @ eigvals
+
+            if obs.return_type is Expectation:
+                results.append(mean.real)
+            else:
+                results.append(marginal @ (eigvals ** 2) - mean.real ** 2)
+
+        return self._asarray([self._asarray([r[b] for r in results]) for b in range(batch_size)])
+
+    def _streamable(self, circuit):
+        # Hamiltonians are measured by :meth:`expval`, which is not used when streaming
+        if any(isinstance(obs, Hamiltonian) for obs in circuit.observables):
+            return False
+
+        return super()._streamable(circuit)
+
+    def _batchable(self, circuit):
+        """Whether :meth:`batch_execute` can simulate a circuit for all rows at once.
+
+        Args:
+            circuit (~.CircuitGraph): circuit to execute
+
+        Returns:
+            bool: ``True`` if the device is in analytic mode without a shot vector and stores
+            the state vector in memory, and the circuit only returns expectation values, variances and
+            probabilities of observables that do not depend on positional parameters,
+            and contains no parametrized state preparations
+        """
+        if not self.analytic or self.storage != "memory" or self.shot_vector is not None:
+            return False
+
+        observables = circuit.observables
+        if any(o.return_type not in (Expectation, Variance, Probability) for o in observables):
+            return False
+
+        # Hamiltonians are measured by :meth:`expval`, which is not used for batches
+        if any(isinstance(o, Hamiltonian) for o in observables):
+            return False
+
+        observable_ids = {id(o) for o in observables}
+
+        for deps in circuit.variable_deps.values():
+            for d in deps:
+                if id(d.op) in observable_ids or isinstance(d.op, (QubitStateVector, BasisState)):
+                    return False
+
+        state_preparations = (QubitStateVector, BasisState)
+        return not any(isinstance(op, state_preparations) for op in circuit.operations[1:])
+
+    def _apply_batched(self, operation, mats, vec, out):
+        """Apply a gate to a stack of state tensors.
+
+        Args:
+            operation (~.Operation): operation to apply
+            mats (array[complex]): the gate matrix, or a stack of gate matrices
+                of shape ``(batch_size, dim, dim)``
+            vec (array[complex]): input state tensors of shape ``[batch_size] + [2] * num_wires``
+            out (array[complex]): output state tensors of the same shape
+        """
+        wires = operation.wires
+        name = operation.base_name
+        slices = _basis_slices(self.num_wires, tuple(wires))
+        mats = np.asarray(mats, dtype=self.c_dtype)
+
+        # trailing axes so that per-row coefficients broadcast against the blocks
+        block_axes = (1,) * (self.num_wires - len(wires))
+
+        if name in self._permutation_operations:
+            _permute_blocks(self._permutation_operations[name], vec, out, slices)
+
+        elif name in self._diagonal_operations:
+            diag = np.diagonal(mats, axis1=-2, axis2=-1)
+
+            if diag.ndim == 2:
+                diag = np.reshape(diag.T, diag.T.shape + block_axes)
+
+            _scale_blocks(diag, vec, out, slices)
+
+        else:
+            if mats.ndim == 3:
+                batch_size, dim, _ = mats.shape
+                mats = np.reshape(np.moveaxis(mats, 0, -1), (dim, dim, batch_size) + block_axes)
+
+            _mix_blocks(mats, vec, out, slices)
+
+    def _batched_marginal_prob(self, prob, wires):
+        """Marginal probabilities of a stack of probability tensors.
+
+        Args:
+            prob (array[float]): probability tensors of shape ``[batch_size] + [2] * num_wires``
+            wires (Sequence[int]): wires to return the marginal probabilities for,
+                in the order of the returned basis states
+
+        Returns:
+            array[float]: array of shape ``(batch_size, 2**len(wires))``
+        """
+        wires = tuple(int(w) for w in np.hstack(wires))
+        inactive, perm = _marginal_axes(self.num_wires, wires)
+        prob = np.sum(prob, axis=tuple(w + 1 for w in inactive))
+
+        # permute the remaining axes in the same way as marginal_prob
+        prob = np.transpose(prob, [0] + [i + 1 for i in perm])
+        return np.reshape(prob, (len(prob), -1))
+
     def mat_vec_product(self, mat, vec, wires):
         r"""Apply multiplication of a matrix to subsystems of the quantum state.
 
@@ -210,18 +1145,315 @@ class DefaultQubit(QubitDevice):
         state_multi_index = np.transpose(tdot, inv_perm)
         return np.reshape(state_multi_index, 2 ** self.num_wires)
 
+    def __getstate__(self):
+        # Copies of the device, e.g. sent to worker processes by Device.clones, do not share
+        # the thread pool, the gate application buffer or the checkpoints with the original.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_buffer"] = None
+        state["_checkpoints"] = OrderedDict()
+        state["_last_parameters"] = None
+        return state
+
     def reset(self):
         """Reset the device"""
         # init the state vector to |00..0>
         super().reset()
-        self._state = np.zeros(2 ** self.num_wires, dtype=complex)
-        self._state[0] = 1
-        self._pre_rotated_state = self._state
+        self._init_state()
+        self._rotations = []
+        self._prob = None
 
     def probability(self, wires=None):
-        if self._state is None:
+        if self._state is None and self._sparse_state is None:
             return None
 
+        self._apply_rotations()
+
         wires = wires or range(self.num_wires)
-        prob = self.marginal_prob(np.abs(self._state) ** 2, wires)
+
+        if self._sparse_state is not None:
+            return self._sparse_marginal_prob(wires)
+        chunk_wires = self._chunk_wires([])
+
+        if chunk_wires:
+            return self._chunked_marginal_prob(wires, len(chunk_wires))
+
+        # the probabilities of all computational basis states are computed once,
+        # and reused until the state changes
+        if self._prob is None or self._prob_state is not self._state:
+            self._prob = np.abs(self._state) ** 2
+            self._prob_state = self._state
+
+        prob = self.marginal_prob(self._prob, wires)
         return prob
+
+    def expval(self, observable):
+        if isinstance(observable, Hamiltonian):
+            return self._hamiltonian_expval(observable)
+
+        if self.analytic and self.storage == "memory":
+            word = _pauli_word(observable)
+
+            if word is not None:
+                return self._pauli_expval(word)
+
+        return super().expval(observable)
+
+    def var(self, observable):
+        if self.analytic and self.storage == "memory":
+            word = _pauli_word(observable)
+
+            if word is not None:
+                # Pauli words square to the identity
+                return 1 - self._pauli_expval(word) ** 2
+
+        return super().var(observable)
+
+    def _pauli_expval(self, word, state=None):
+        r"""Expectation value of a Pauli word with respect to the pre-rotated state.
+
+        Applying the Pauli word :math:`P` to a computational basis state :math:`|b\rangle`
+        flips the bits of :math:`b` on the wires acted on by :math:`X` or :math:`Y`, and
+        multiplies by the phase :math:`(-i)^{n_Y}(-1)^{\sum_w b'_w}`, where :math:`b'` is the
+        flipped state, and the sum runs over the wires acted on by :math:`Y` or :math:`Z`.
+        :math:`\langle\psi|P|\psi\rangle` is therefore computed by reversing axes
+        of the state tensor, without applying any gates.
+
+        Args:
+            word (dict[int, str]): dictionary mapping wires to Pauli operators,
+                as returned by :func:`_pauli_word`
+            state (array[complex]): dense pre-rotated state vector; defaults to
+                the dense pre-rotated state of the device
+
+        Returns:
+            float: expectation value of the Pauli word
+        """
+        if state is None:
+            state = self._pre_rotated_state
+
+        state = np.reshape(state, [2] * self.num_wires)
+
+        flip_wires = tuple(w for w, name in word.items() if name != "PauliZ")
+        sign_wires = sorted(w for w, name in word.items() if name != "PauliX")
+        num_y = sum(name == "PauliY" for name in word.values())
+
+        # reversing axes returns a view of the state
+        overlap = np.conj(state) * np.flip(state, axis=flip_wires)
+        inactive = tuple(w for w in range(self.num_wires) if w not in sign_wires)
+        overlap = np.sum(overlap, axis=inactive)
+
+        # the remaining axes correspond to the sign wires, in increasing order
+        for _ in sign_wires:
+            overlap = overlap[0] - overlap[1]
+
+        return ((-1j) ** num_y * overlap).real
+
+    def _hamiltonian_expval(self, hamiltonian):
+        """Expectation value of a Hamiltonian with respect to the pre-rotated state.
+
+        Terms that are Pauli words are evaluated by :meth:`_pauli_expval`; the matrices
+        of all other terms are applied to the state using :meth:`mat_vec_product`.
+
+        Args:
+            hamiltonian (~.Hamiltonian): Hamiltonian to measure
+
+        Raises:
+            DeviceError: if the device is not in analytic mode
+
+        Returns:
+            float: expectation value of the Hamiltonian
+        """
+        if not self.analytic:
+            raise DeviceError(
+                "The expectation value of a Hamiltonian can only be computed "
+                "on the {} device in analytic mode.".format(self.short_name)
+            )
+
+        # the terms are applied to a dense copy of a sparse pre-rotated state,
+        # leaving the storage of the device unchanged
+        state = np.asarray(self.state)
+        res = 0.0
+
+        for coeff, obs in zip(*hamiltonian.terms):
+            word = _pauli_word(obs)
+
+            if word is not None:
+                res += coeff * self._pauli_expval(word, state)
+                continue
+
+            wires = list(np.hstack(obs.wires))
+            res += coeff * np.vdot(state, self.mat_vec_product(obs.matrix, state, wires)).real
+
+        return res
+
+    def _apply_observable(self, observable, vec):
+        """Apply the matrix of an observable to a state vector.
+
+        Args:
+            observable (~.Observable or ~.Hamiltonian): observable to apply
+            vec (array[complex]): state vector
+
+        Returns:
+            array[complex]: state vector after applying the observable
+        """
+        if isinstance(observable, Hamiltonian):
+            return sum(
+                coeff * self._apply_observable(obs, vec) for coeff, obs in zip(*observable.terms)
+            )
+
+        wires = list(np.hstack(observable.wires))
+        return self.mat_vec_product(observable.matrix, vec, wires)
+
+    def _adjoint_operations(self, operations):
+        """Decompose the differentiable operations without a generator, so that every
+        parametrized operation differentiated by :meth:`adjoint_jacobian` has a generator.
+
+        Args:
+            operations (list[~.Operation]): operations of the circuit
+
+        Raises:
+            DeviceError: if a differentiable operation has neither a generator nor a decomposition
+
+        Returns:
+            list[~.Operation]: the decomposed operations
+        """
+        expanded = []
+
+        for op in operations:
+            differentiable = op.grad_method is not None and any(
+                isinstance(p, Variable) and not p.is_kwarg for p in op.params
+            )
+
+            if not differentiable or op.generator[0] is not None:
+                expanded.append(op)
+                continue
+
+            try:
+                # the decomposed operations keep the Variables of the original operation
+                decomposition = op.decomposition(*op.params, wires=op.wires)
+            except NotImplementedError:
+                raise DeviceError(
+                    "The {} operation has no generator and no decomposition, and cannot be "
+                    "differentiated using the adjoint method.".format(op.name)
+                )
+
+            if op.inverse:
+                decomposition = [d.inv() for d in reversed(decomposition)]
+
+            expanded.extend(self._adjoint_operations(decomposition))
+
+        return expanded
+
+    def adjoint_jacobian(self, operations, observables, parameters):
+        r"""Compute the Jacobian of the expectation values of a circuit using the adjoint method.
+
+        The circuit is simulated forward once. The final state :math:`|\psi\rangle`, and the
+        states :math:`|\lambda_k\rangle = O_k|\psi\rangle` for each observable, are then
+        rotated backwards through the circuit by applying the inverse of each operation.
+        For an operation :math:`U(\theta)=e^{is\theta G}`, the partial derivative of the
+        expectation value of :math:`O_k` is
+
+        .. math:: \frac{\partial\langle O_k\rangle}{\partial\theta}
+            = 2\,\text{Re}\,\langle\lambda_k|isG|\phi\rangle,
+
+        where :math:`|\phi\rangle` and :math:`|\lambda_k\rangle` are the rotated states
+        directly after the operation. The Jacobian is therefore computed at the cost of
+        a few circuit executions, using only ``len(observables) + 2`` state vectors.
+
+        Parametrized operations without a generator are decomposed into operations with
+        generators. The derivatives are exact, even if the device is not in analytic mode.
+
+        Args:
+            operations (list[~.Operation]): operations to be applied to the device
+            observables (list[~.Observable]): observables whose expectation values are
+                differentiated
+            parameters (dict[int, list[ParameterDependency]]): reference dictionary
+                mapping free parameter indices to the operations that depend on them
+
+        Raises:
+            DeviceError: if an observable is not an expectation value
+
+        Returns:
+            array[float]: Jacobian matrix of shape ``(len(observables), len(parameters))``
+        """
+        for obs in observables:
+            if obs.return_type is not Expectation:
+                raise DeviceError(
+                    "The adjoint method only supports expectation values, not {}.".format(
+                        obs.return_type
+                    )
+                )
+
+        # simulate the circuit forward once
+        self.reset()
+        self.apply(operations)
+        phi = np.array(self.state, dtype=self.c_dtype)
+        lambdas = [self._apply_observable(obs, phi) for obs in observables]
+
+        jac = np.zeros((len(observables), len(parameters)), dtype=float)
+
+        for op in reversed(self._adjoint_operations(operations)):
+            if isinstance(op, (QubitStateVector, BasisState)):
+                # state preparations can only be the first operation
+                break
+
+            generator, scale = op.generator
+            trainable = [p for p in op.params if isinstance(p, Variable) and not p.is_kwarg]
+
+            if trainable and generator is not None and op.grad_method is not None:
+                if not isinstance(generator, np.ndarray):
+                    # generator is an existing PennyLane observable
+                    generator = generator._matrix()
+
+                if op.inverse:
+                    scale = -scale
+
+                # derivative of the state with respect to the operation parameter
+                mu = 1j * scale * self.mat_vec_product(generator, phi, op.wires)
+
+                for k, lam in enumerate(lambdas):
+                    jac[k, trainable[0].idx] += 2 * np.vdot(lam, mu).real * trainable[0].mult
+
+            # rotate the states backwards through the operation
+            mat = np.conj(op.matrix).T
+            phi = self.mat_vec_product(mat, phi, op.wires)
+            lambdas = [self.mat_vec_product(mat, lam, op.wires) for lam in lambdas]
+
+        return jac
+
+    def _chunked_marginal_prob(self, wires, num_chunk_wires):
+        """Compute the marginal probability of the state vector chunk by chunk.
+
+        The state vector is split into contiguous chunks over the highest-order
+        wires. The probabilities of each chunk are computed and summed over the
+        remaining wires not in ``wires``, using multiple threads if enabled.
+
+        Args:
+            wires (Sequence[int]): wires to return the marginal probabilities for
+            num_chunk_wires (int): number of highest-order wires to split the state over
+
+        Returns:
+            array[float]: array of the resulting marginal probabilities
+        """
+        wires = list(np.hstack(wires))
+        num_inner = self.num_wires - num_chunk_wires
+        inner_wires = range(num_chunk_wires, self.num_wires)
+        inactive = tuple(w - num_chunk_wires for w in inner_wires if w not in wires)
+
+        def chunk_prob(chunk):
+            prob = np.abs(chunk) ** 2
+            return np.sum(np.reshape(prob, [2] * num_inner), axis=inactive)
+
+        chunks = np.reshape(self._state, (2 ** num_chunk_wires, 2 ** num_inner))
+        prob = np.stack(list(self._map(chunk_prob, chunks)))
+
+        # the axes of prob correspond to the chunk wires, followed by the
+        # remaining inner wires, both in increasing order
+        prob_wires = list(range(num_chunk_wires)) + [w for w in inner_wires if w in wires]
+        prob = np.reshape(prob, [2] * len(prob_wires))
+        prob = np.sum(prob, axis=tuple(i for i, w in enumerate(prob_wires) if w not in wires))
+
+        # the remaining axes are in increasing wire order,
+        # and are permuted in the same way as marginal_prob
+        _, perm = _marginal_axes(self.num_wires, tuple(int(w) for w in wires))
+        return np.transpose(prob, perm).flatten()
@@ -0,0 +1,218 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+The autograd qubit plugin is a variant of the :mod:`default qubit plugin <.default_qubit>`
+whose simulation is written in :mod:`autograd.numpy`. Circuits executed on it are
+differentiable by backpropagation through the simulation, using a
+:class:`~.PassthruQNode`.
+"""
+import numpy as np
+from autograd import numpy as anp
+from autograd.tracer import getval
+
+from pennylane import DeviceError, QubitDevice
+from pennylane._qubit_device import _marginal_axes
+from pennylane.vqe import Hamiltonian
+
+from .default_qubit import DefaultQubit
+
+
+I = np.eye(2)
+X = np.array([[0, 1], [1, 0]])
+Y = np.array([[0, -1j], [1j, 0]])
+Z = np.array([[1, 0], [0, -1]])
+
+
+def _controlled(U):
+    """Controlled version of a single-qubit gate, with the first wire as the control.
+
+    Args:
+        U (array): single-qubit gate matrix
+
+    Returns:
+        array: two-qubit gate matrix
+    """
+    return anp.array(
+        [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, U[0, 0], U[0, 1]], [0, 0, U[1, 0], U[1, 1]]]
+    )
+
+
+def _rx(theta):
+    """One-qubit rotation about the x axis."""
+    return anp.cos(theta / 2) * I + 1j * anp.sin(-theta / 2) * X
+
+
+def _ry(theta):
+    """One-qubit rotation about the y axis."""
+    return anp.cos(theta / 2) * I + 1j * anp.sin(-theta / 2) * Y
+
+
+def _rz(theta):
+    """One-qubit rotation about the z axis."""
+    return anp.cos(theta / 2) * I + 1j * anp.sin(-theta / 2) * Z
+
+
+def _phase_shift(phi):
+    """One-qubit phase shift."""
+    return anp.array([[1, 0], [0, anp.exp(1j * phi)]])
+
+
+def _rot(a, b, c):
+    """Arbitrary one-qubit rotation using three Euler angles."""
+    return anp.dot(_rz(c), anp.dot(_ry(b), _rz(a)))
+
+
+class DefaultQubitAutograd(DefaultQubit):
+    """Default qubit device for PennyLane, differentiable by backpropagation using autograd.
+
+    The state vector is evolved using :mod:`autograd.numpy`, and the gate matrices of the
+    parametrized operations are constructed from their (possibly traced) parameters. The
+    results are returned as autograd arrays, so that a :class:`~.PassthruQNode` executed on
+    this device can be differentiated by autograd directly; the cost of the gradient does not
+    depend on the number of parameters.
+
+    Samples are generated from the probabilities of the computational basis states,
+    but are not differentiable.
+
+    Args:
+        wires (int): the number of modes to initialize the device in
+        shots (int): How many times the circuit should be evaluated (or sampled)
+            to estimate the expectation values. Defaults to 1000 if not specified.
+            If ``analytic == True``, then the number of shots is ignored
+            in the calculation of expectation values and variances, and only controls the number
+            of samples returned by ``sample``.
+        analytic (bool): indicates if the device should calculate expectations
+            and variances analytically
+        seed (str, None, int, array_like[int], numpy.random.SeedSequence, numpy.random.Generator):
+            Seed for the random number generator used to generate samples. If ``"global"``
+            (default), the global NumPy random state is used. Otherwise, the device owns
+            a :class:`numpy.random.Generator` created from the seed, or from fresh entropy
+            if ``None``. See :class:`~.Device` for all accepted values.
+    """
+
+    name = "Default qubit PennyLane plugin (autograd)"
+    short_name = "default.qubit.autograd"
+    _capabilities = {"inverse_operations": True, "passthru_interface": "autograd"}
+
+    # the Hamiltonian expectation value of default.qubit is not differentiable by autograd
+    observables = DefaultQubit.observables - {"Hamiltonian"}
+
+    _parametrized_matrices = {
+        "RX": _rx,
+        "RY": _ry,
+        "RZ": _rz,
+        "PhaseShift": _phase_shift,
+        "Rot": _rot,
+        "CRX": lambda theta: _controlled(_rx(theta)),
+        "CRY": lambda theta: _controlled(_ry(theta)),
+        "CRZ": lambda theta: _controlled(_rz(theta)),
+        "CRot": lambda a, b, c: _controlled(_rot(a, b, c)),
+    }
+    """dict[str, callable]: functions returning the gate matrices of the parametrized
+    operations, written in :mod:`autograd.numpy`"""
+
+    _asarray = staticmethod(anp.array)
+
+    def __init__(self, wires, *, shots=1000, analytic=True, seed="global"):
+        super().__init__(wires, shots=shots, analytic=analytic, seed=seed)
+
+    def _apply_operation(self, operation):
+        """Apply a gate to the state vector using :meth:`mat_vec_product`.
+
+        Args:
+            operation (~.Operation): operation to apply
+        """
+        name = operation.base_name
+
+        if name in self._parametrized_matrices:
+            mat = self._parametrized_matrices[name](*operation.parameters)
+
+            if operation.inverse:
+                mat = anp.conj(anp.transpose(mat))
+        else:
+            mat = operation.matrix
+
+        self._state = self.mat_vec_product(mat, self._state, operation.wires)
+
+    def mat_vec_product(self, mat, vec, wires):
+        r"""Apply multiplication of a matrix to subsystems of the quantum state.
+
+        Args:
+            mat (array): matrix to multiply
+            vec (array): state vector to multiply
+            wires (Sequence[int]): target subsystems
+
+        Returns:
+            array: output vector after applying ``mat`` to input ``vec`` on specified subsystems
+        """
+        mat = anp.reshape(mat, [2] * len(wires) * 2)
+        vec = anp.reshape(vec, [2] * self.num_wires)
+        axes = (np.arange(len(wires), 2 * len(wires)), wires)
+        tdot = anp.tensordot(mat, vec, axes=axes)
+
+        # tensordot causes the axes given in `wires` to end up in the first positions
+        # of the resulting tensor; invert this permutation
+        unused_idxs = [idx for idx in range(self.num_wires) if idx not in wires]
+        perm = list(wires) + unused_idxs
+        inv_perm = np.argsort(perm)  # argsort gives inverse permutation
+        state_multi_index = anp.transpose(tdot, inv_perm)
+        return anp.reshape(state_multi_index, 2 ** self.num_wires)
+
+    def probability(self, wires=None):
+        if self._state is None:
+            return None
+
+        self._apply_rotations()
+
+        wires = wires or range(self.num_wires)
+        prob = anp.real(self._state * anp.conj(self._state))
+        return self.marginal_prob(prob, wires)
+
+    def marginal_prob(self, prob, wires=None):
+        if wires is None:
+            # no need to marginalize
+            return prob
+
+        wires = tuple(int(w) for w in np.hstack(wires))
+        inactive_wires, perm = _marginal_axes(self.num_wires, wires)
+
+        # reshape the probability so that each axis corresponds to a wire,
+        # and sum over all inactive wires
+        prob = anp.sum(anp.reshape(prob, [2] * self.num_wires), axis=inactive_wires)
+        return anp.reshape(anp.transpose(prob, perm), -1)
+
+    def sample_basis_states(self, number_of_states, state_probability):
+        # the samples are not differentiable
+        return super().sample_basis_states(number_of_states, getval(state_probability))
+
+    def expval(self, observable):
+        if isinstance(observable, Hamiltonian):
+            raise DeviceError(
+                "Hamiltonian expectation values are not supported "
+                "on the {} device.".format(self.short_name)
+            )
+
+        if self.analytic:
+            prob = self.probability(wires=observable.wires)
+            return anp.dot(observable.eigvals, prob)
+
+        return QubitDevice.expval(self, observable)
+
+    def var(self, observable):
+        if self.analytic:
+            eigvals = observable.eigvals
+            prob = self.probability(wires=observable.wires)
+            return anp.dot(eigvals ** 2, prob) - anp.dot(eigvals, prob) ** 2
+
+        return QubitDevice.var(self, observable)
@@ -16,6 +16,7 @@ This subpackage contains the supported types of QNodes.
 
 .. currentmodule:: pennylane.qnodes
 """
+from .adjoint import AdjointQNode
 from .base import BaseQNode, QuantumFunctionError
 from .cv import CVQNode
 from .decorator import qnode, QNode
@@ -195,6 +195,14 @@ class BaseQNode:
         self._metric_tensor_subcircuits = None
         """dict[tuple[int], dict[str, Any]]: circuit descriptions for computing the metric tensor"""
 
+        self._construction_key = None
+        """None or tuple: key identifying the argument values the circuit was last
+        constructed with, see :meth:`_argument_key`"""
+
+        self._forward_cache = None
+        """None or tuple[tuple, Any]: key identifying the argument values of the
+        last evaluation, and the output of the evaluation"""
+
         # introspect the quantum function signature
         _get_signature(self.func)
 
@@ -490,7 +498,8 @@ class BaseQNode:
 
         For immutable nodes this method is called the first time :meth:`BaseQNode.evaluate`
         or :meth:`.JacobianQNode.jacobian` is called, and for mutable nodes *each time*
-        they are called. It executes the quantum function,
+        they are called, unless the Jacobian is computed at the argument values the circuit
+        was last constructed with. It executes the quantum function,
         stores the resulting sequence of :class:`.Operator` instances,
         converts it into a circuit graph, and creates the Variable mapping.
 
@@ -512,6 +521,7 @@ class BaseQNode:
         """
         # pylint: disable=attribute-defined-outside-init, too-many-branches, too-many-statements
 
+        self._construction_key = None
         self.arg_vars, self.kwarg_vars = self._make_variables(args, kwargs)
 
         # temporary queues for operations and observables
@@ -570,6 +580,35 @@ class BaseQNode:
                     "The operations {} cannot affect the circuit output.".format(invisible)
                 )
 
+        self._construction_key = self._argument_key(args, kwargs)
+
+    @staticmethod
+    def _argument_key(args, kwargs):
+        """Hashable key identifying the values of the arguments of the quantum function.
+
+        Args:
+            args (tuple[Any]): positional arguments to the quantum function (differentiable)
+            kwargs (dict[str, Any]): auxiliary arguments (not differentiable)
+
+        Returns:
+            tuple or None: shapes and flattened values of the arguments, or None if the
+            arguments cannot be compared by value
+        """
+
+        def freeze(value):
+            return np.shape(value), tuple(_flatten(value))
+
+        try:
+            key = (
+                tuple(freeze(v) for v in args),
+                tuple((k, freeze(v)) for k, v in sorted(kwargs.items())),
+            )
+            hash(key)
+        except (TypeError, ValueError):
+            return None
+
+        return key
+
     @staticmethod
     def _prune_tensors(res):
         """Prune the tensors that have been passed by the quantum function.
@@ -617,7 +656,10 @@ class BaseQNode:
                 # Squeezing ensures that there is only one array of values returned
                 # when only a single-mode sample is requested
                 self.output_conversion = np.squeeze
-            elif res.return_type is ObservableReturnTypes.Probability:
+            elif res.return_type in (
+                ObservableReturnTypes.Probability,
+                ObservableReturnTypes.Counts,
+            ):
                 self.output_conversion = np.squeeze
                 self.output_dim = 2 ** len(res.wires)
             else:
@@ -788,7 +830,27 @@ class BaseQNode:
                 self.variable_deps,
                 return_native_type=temp,
             )
-        return self.output_conversion(ret)
+
+        if self.device.shot_vector is not None:
+            # the device returns one set of results per number of shots
+            res = [self.output_conversion(r) for r in ret]
+
+            if not self.circuit.is_sampled:
+                return np.array(res)
+
+            # the sets of results have different shapes if samples are returned
+            ret = np.empty(len(res), dtype=object)
+
+            for i, r in enumerate(res):
+                ret[i] = r
+
+            return ret
+
+        res = self.output_conversion(ret)
+
+        # the output at the given arguments, which the Jacobian may reuse
+        self._forward_cache = (self._argument_key(args, kwargs), res)
+        return res
 
     def evaluate_obs(self, obs, args, kwargs):
         """Evaluate the value of the given observables.
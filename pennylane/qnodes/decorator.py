@@ -16,15 +16,17 @@ QNode decorator.
 """
 from functools import lru_cache
 
+from .adjoint import AdjointQNode
 from .base import BaseQNode
 from .cv import CVQNode
 from .device_jacobian import DeviceJacobianQNode
 from .jacobian import JacobianQNode
+from .passthru import PassthruQNode
 from .qubit import QubitQNode
 
 
 PARAMETER_SHIFT_QNODES = {"qubit": QubitQNode, "cv": CVQNode}
-ALLOWED_DIFF_METHODS = ("best", "parameter-shift", "finite-diff")
+ALLOWED_DIFF_METHODS = ("best", "parameter-shift", "finite-diff", "adjoint", "backprop")
 ALLOWED_INTERFACES = ("autograd", "numpy", "torch", "tf")
 
 
@@ -77,10 +79,21 @@ def QNode(func, device, *, interface="autograd", mutable=True, diff_method="best
 
             * ``"finite-diff"``: Uses numerical finite-differences.
 
+            * ``"adjoint"``: Computes the Jacobian of the expectation values in a single
+              backward sweep through the circuit. Only supported by state vector simulators
+              providing the ``adjoint_jacobian`` method, such as ``default.qubit``.
+
+            * ``"backprop"``: Returns a :class:`~.PassthruQNode`, which is differentiated by
+              backpropagation through the simulation using the interface's own autodiff
+              framework. Only supported by simulators written in that framework, such as
+              ``default.qubit.autograd`` for the autograd interface.
+
             * ``None``: a non-differentiable QNode is returned.
 
     Keyword Args:
         h (float): step size for the finite-difference method
+        parallel (int): number of worker processes evaluating the shifted circuits of the
+            parameter-shift and finite-difference Jacobians, each using a copy of the device
     """
     if diff_method is None:
         # QNode is not differentiable
@@ -98,7 +111,30 @@ def QNode(func, device, *, interface="autograd", mutable=True, diff_method="best
     model = device.capabilities().get("model", "qubit")
     device_jacobian = device.capabilities().get("provides_jacobian", False)
 
-    if device_jacobian and (diff_method == "best"):
+    if diff_method == "backprop":
+        # keep "numpy" for backwards compatibility
+        passthru_interface = "autograd" if interface == "numpy" else interface
+
+        if device.capabilities().get("passthru_interface", None) != passthru_interface:
+            raise ValueError(
+                "The {} device does not support backpropagation using the {} "
+                "interface.".format(device.short_name, interface)
+            )
+
+        # the simulation is differentiated directly by the interface
+        return PassthruQNode(func, device, **kwargs)
+
+    if diff_method == "adjoint":
+        if not device.capabilities().get("provides_adjoint_jacobian", False):
+            raise ValueError(
+                "The {} device does not support the adjoint differentiation "
+                "method.".format(device.short_name)
+            )
+
+        # adjoint differentiation of the state vector
+        node = AdjointQNode(func, device, mutable=mutable, **kwargs)
+
+    elif device_jacobian and (diff_method == "best"):
         # hand off differentiation to the device
         node = DeviceJacobianQNode(func, device, mutable=mutable, **kwargs)
 
@@ -178,6 +214,15 @@ def qnode(device, *, interface="autograd", mutable=True, diff_method="best", **k
 
             * ``"finite-diff"``: Uses numerical finite-differences.
 
+            * ``"adjoint"``: Computes the Jacobian of the expectation values in a single
+              backward sweep through the circuit. Only supported by state vector simulators
+              providing the ``adjoint_jacobian`` method, such as ``default.qubit``.
+
+            * ``"backprop"``: Returns a :class:`~.PassthruQNode`, which is differentiated by
+              backpropagation through the simulation using the interface's own autodiff
+              framework. Only supported by simulators written in that framework, such as
+              ``default.qubit.autograd`` for the autograd interface.
+
             * ``None``: a non-differentiable QNode is returned.
 
     Keyword Args:
@@ -15,11 +15,15 @@
 Differentiable quantum nodes.
 """
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import weakref
 
 import numpy as np
 
 from pennylane.operation import ObservableReturnTypes
 from pennylane.utils import _flatten, _inv_dict
+from pennylane.variable import Variable
 
 from .base import BaseQNode, QuantumFunctionError
 
@@ -27,6 +31,22 @@ DEFAULT_STEP_SIZE = 0.3
 DEFAULT_STEP_SIZE_ANALYTIC = 1e-7
 
 
+def _batch_execute(device, circuit, parameters, kwarg_values):
+    """Execute a circuit for a batch of positional parameter values in a worker process.
+
+    Args:
+        device (~.Device): copy of the device owned by the worker
+        circuit (~.CircuitGraph): circuit to execute
+        parameters (array[float]): positional parameter values, one row per execution
+        kwarg_values (dict[str, array[float]]): values of the auxiliary arguments
+
+    Returns:
+        array[float]: measured value(s), one row per set of parameter values
+    """
+    Variable.kwarg_values = kwarg_values
+    return device.batch_execute(circuit, parameters)
+
+
 class JacobianQNode(BaseQNode):
     """Quantum node that can be differentiated with respect to its positional parameters.
     """
@@ -46,6 +66,25 @@ class JacobianQNode(BaseQNode):
         self._h = kwargs.get("h", default_step_size)
         """float: step size for the finite difference method"""
 
+        self.parallel = kwargs.get("parallel", None)
+        """None or int: number of worker processes evaluating the shifted circuits of the
+        Jacobian; if None, they are evaluated in the calling process"""
+
+        self._executor = None
+        """None or ProcessPoolExecutor: worker processes evaluating the Jacobian, created on
+        first use and kept until :meth:`close` is called or the node is garbage collected"""
+
+        self._num_workers = None
+        """None or int: number of worker processes in :attr:`_executor`"""
+
+        self._executor_finalizer = None
+        """None or weakref.finalize: shuts down :attr:`_executor` when the node is garbage
+        collected or the interpreter exits"""
+
+        self._temp_variables = []
+        """list[tuple[Operator, int, Variable]]: Operator parameters temporarily replaced
+        by :meth:`_temp_variable`, together with the original parameters"""
+
     metric_tensor = None
 
     @property
@@ -164,6 +203,14 @@ class JacobianQNode(BaseQNode):
         * Device method (``'device'``): Delegates the computation of the Jacobian to the
           device executing the circuit.
 
+        * Adjoint method (``'adjoint'``): Computes the Jacobian of the expectation values
+          in a single backward sweep through the circuit, using the ``adjoint_jacobian``
+          method of the state vector simulator executing the circuit.
+
+        The circuits with shifted parameter values required by the finite difference and
+        analytic methods are evaluated together, using a single call to
+        :meth:`.Device.batch_execute`.
+
         .. note::
            The finite difference method is sensitive to statistical noise in the circuit output,
            since it compares the output at two points infinitesimally close to each other. Hence the
@@ -175,11 +222,14 @@ class JacobianQNode(BaseQNode):
             wrt (Sequence[int] or None): Indices of the flattened positional parameters with respect
                 to which to compute the Jacobian. None means all the parameters.
                 Note that you cannot compute the Jacobian with respect to the kwargs.
-            method (str): Jacobian computation method, in ``{'F', 'A', 'best', 'device'}``, see above
+            method (str): Jacobian computation method, in ``{'F', 'A', 'best', 'device', 'adjoint'}``,
+                see above
             options (dict[str, Any]): additional options for the computation methods
 
                 * h (float): finite difference method step size
                 * order (int): finite difference method order, 1 or 2
+                * parallel (int, None): number of worker processes evaluating the shifted
+                  circuits, each using a copy of the device; defaults to :attr:`parallel`
 
         Returns:
             array[float]: Jacobian, shape ``(n, len(wrt))``, where ``n`` is the number of outputs returned by the QNode
@@ -194,18 +244,21 @@ class JacobianQNode(BaseQNode):
 
         options = options or {}
 
-        # Add the step size into the options, if it was not there already
-        if "h" not in options.keys():
-            options = {"h": self.h, **options}
+        # Add the step size and the number of worker processes into the options,
+        # if they were not there already
+        options = {"h": self.h, "parallel": self.parallel, **options}
 
-        # (re-)construct the circuit if necessary
-        if self.circuit is None or self.mutable:
+        # (re-)construct the circuit if necessary; a mutable circuit is reused
+        # if it was constructed with the same argument values, e.g. by the forward pass
+        key = self._argument_key(args, kwargs)
+        reuse = key is not None and key == self._construction_key
+        if self.circuit is None or (self.mutable and not reuse):
             self._construct(args, kwargs)
 
         returns_samples = [
             str(ob)
             for ob in self.circuit.observables
-            if ob.return_type is ObservableReturnTypes.Sample
+            if ob.return_type in (ObservableReturnTypes.Sample, ObservableReturnTypes.Counts)
         ]
         if returns_samples:
             raise QuantumFunctionError(
@@ -213,6 +266,11 @@ class JacobianQNode(BaseQNode):
                 "The following observables include sampling: {}".format("; ".join(returns_samples))
             )
 
+        if self.device.shot_vector is not None:
+            raise QuantumFunctionError(
+                "Circuits executed with a shot vector can not be differentiated."
+            )
+
         # check that the wrt parameters are ok
         if wrt is None:
             wrt = range(self.num_variables)
@@ -243,6 +301,13 @@ class JacobianQNode(BaseQNode):
                 self.circuit.operations, self.circuit.observables, self.variable_deps
             )
 
+        if method == "adjoint":
+            self._set_variables(args, kwargs)
+            jac = self.device.adjoint_jacobian(
+                self.circuit.operations, self.circuit.observables, self.variable_deps
+            )
+            return jac[:, list(wrt)]
+
         if method == "A":
             bad = inds_using("F")
             if bad:
@@ -261,12 +326,7 @@ class JacobianQNode(BaseQNode):
         else:
             raise ValueError("Unknown gradient method.")
 
-        if "F" in method.values():
-            if options.get("order", 1) == 1:
-                # the value of the circuit at args, computed only once here
-                options["y0"] = np.asarray(self.evaluate(args, kwargs))
-
-        # In the following, to evaluate the Jacobian we call self.evaluate several times using
+        # In the following, to evaluate the Jacobian we evaluate the circuit several times using
         # modified args (and possibly modified circuit Operators).
         # We do not want evaluate to call _construct again. This would only be necessary if the
         # auxiliary args changed, since only they can change the structure of the circuit,
@@ -280,66 +340,273 @@ class JacobianQNode(BaseQNode):
             ob.return_type is ObservableReturnTypes.Variance for ob in self.circuit.observables
         )
 
-        # compute the partial derivative wrt. each parameter using the appropriate method
+        # Compute the partial derivative wrt. each parameter using the appropriate method.
+        # Partial derivatives that are linear combinations of the circuit output at shifted
+        # parameter values are collected first, and evaluated together in a single batch.
         grad = np.zeros((self.output_dim, len(wrt)), dtype=float)
-        for i, k in enumerate(wrt):
-            par_method = method[k]
+        shifts = {}
+        analytic_var = []
+        try:
+            for i, k in enumerate(wrt):
+                par_method = method[k]
+
+                if par_method == "0":
+                    # unused/invisible, partial derivatives wrt. this param are zero
+                    continue
+
+                if par_method == "A":
+                    if variances_required:
+                        analytic_var.append(i)
+                        continue
+
+                    recipe = self._parameter_shifts(k, **options)
+                    if recipe is None:
+                        grad[:, i] = self._pd_analytic(k, flat_args, kwargs, **options)
+                    else:
+                        shifts[i] = recipe
+                elif par_method == "F":
+                    shifts[i] = self._finite_diff_shifts(k, **options)
+                else:
+                    raise ValueError("Unknown gradient method.")
 
-            if par_method == "0":
-                # unused/invisible, partial derivatives wrt. this param are zero
-                continue
+            if shifts:
+                # reuse the output of the forward pass at the same argument values, if any
+                y0 = None
+                if key is not None and self._forward_cache and self._forward_cache[0] == key:
+                    y0 = self._forward_cache[1]
 
-            if par_method == "A":
-                if variances_required:
-                    grad[:, i] = self._pd_analytic_var(k, flat_args, kwargs, **options)
-                else:
-                    grad[:, i] = self._pd_analytic(k, flat_args, kwargs, **options)
-            elif par_method == "F":
-                grad[:, i] = self._pd_finite_diff(k, flat_args, kwargs, **options)
-            else:
-                raise ValueError("Unknown gradient method.")
+                grad[:, list(shifts)] = self._evaluate_shifts(
+                    list(shifts.values()), flat_args, kwargs, y0=y0, **options
+                )
+
+            if analytic_var:
+                indices = [wrt[i] for i in analytic_var]
+                grad[:, analytic_var] = self._jacobian_analytic_var(
+                    indices, flat_args, kwargs, **options
+                )
+        finally:
+            # restore the original parameters and mutability, also if an exception was raised
+            self._restore_variables()
+            self.mutable = mutable
 
-        self.mutable = mutable  # restore original mutability
         return grad
 
-    def _pd_finite_diff(self, idx, args, kwargs, **options):
-        """Partial derivative of the node using the finite difference method.
+    def _finite_diff_shifts(self, idx, **options):
+        """Shifted parameter values for the partial derivative of the node using the
+        finite difference method.
 
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
-            args (array[float]): flattened positional arguments at which to evaluate the p.d.
-            kwargs (dict[str, Any]): auxiliary arguments
 
         Keyword Args:
-            y0 (array[float], None): value of the circuit at the given arguments
             h (float): step size
             order (int): finite difference method order, 1 or 2
 
         Returns:
-            array[float]: partial derivative of the node
+            list[tuple[dict[int, float], float]]: the partial derivative is the sum of the node
+            outputs at the shifted parameter values, multiplied by the coefficients; each shift
+            maps flattened parameter indices to the amount by which their value is shifted
         """
-        y0 = options.get("y0", None)
         h = options.get("h", self.h)
         order = options.get("order", 1)
 
-        shift_args = args.copy()
         if order == 1:
             # shift the parameter by h
-            shift_args[idx] += h
-            y = np.asarray(self.evaluate(shift_args, kwargs))
-            return (y - y0) / h
+            return [({idx: h}, 1 / h), ({}, -1 / h)]
 
         if order == 2:
             # symmetric difference
             # shift the parameter by +-h/2
-            shift_args[idx] += 0.5 * h
-            y2 = np.asarray(self.evaluate(shift_args, kwargs))
-            shift_args[idx] = args[idx] - 0.5 * h
-            y1 = np.asarray(self.evaluate(shift_args, kwargs))
-            return (y2 - y1) / h
+            return [({idx: 0.5 * h}, 1 / h), ({idx: -0.5 * h}, -1 / h)]
 
         raise ValueError("Order must be 1 or 2.")
 
+    def _parameter_shifts(self, idx, **options):
+        """Shifted parameter values for the partial derivative of the node using an
+        analytic method.
+
+        Inheriting QNodes whose analytic partial derivatives are linear combinations of the
+        node output at shifted parameter values implement this method, so that the shifted
+        circuits can be evaluated together with the others in :meth:`_evaluate_shifts`.
+        Otherwise :meth:`_pd_analytic` is used.
+
+        Args:
+            idx (int): flattened index of the parameter wrt. which the p.d. is computed
+
+        Returns:
+            list[tuple[dict[int, float], float]] or None: shifts and coefficients, as returned by
+            :meth:`_finite_diff_shifts`, or None if the analytic method is not a
+            linear combination of shifted circuit evaluations
+        """
+        # pylint: disable=unused-argument,no-self-use
+        return None
+
+    def _temp_variable(self, op, p_idx):
+        """Replace a free parameter of an Operator by a temporary one.
+
+        The temporary :class:`~.Variable` is otherwise identical with the original, but has a
+        new flattened index larger than those of the positional arguments, so that its value can
+        be shifted without affecting other Operators depending on the original.
+        The original is restored by :meth:`_restore_variables`.
+
+        Args:
+            op (~.Operator): Operator depending on the free parameter
+            p_idx (int): index of the free parameter in ``op.params``
+
+        Returns:
+            int: flattened index of the temporary parameter
+        """
+        orig = op.params[p_idx]
+
+        temp_var = copy.copy(orig)
+        temp_var.idx = self.num_variables + len(self._temp_variables)
+        op.params[p_idx] = temp_var
+
+        self._temp_variables.append((op, p_idx, orig))
+        return temp_var.idx
+
+    def _restore_variables(self):
+        """Restore the free parameters replaced by :meth:`_temp_variable`."""
+        for op, p_idx, orig in reversed(self._temp_variables):
+            op.params[p_idx] = orig
+
+        self._temp_variables = []
+
+    def _evaluate_shifts(self, recipes, args, kwargs, y0=None, **options):
+        """Evaluate partial derivatives that are linear combinations of the node output
+        at shifted parameter values.
+
+        The node is evaluated at all the distinct shifted parameter values using a single call
+        to :meth:`.Device.batch_execute`. Afterwards, the temporary parameters created
+        by :meth:`_temp_variable` are replaced by the original ones.
+
+        Args:
+            recipes (list[list[tuple[dict[int, float], float]]]): for each partial derivative,
+                the shifts and coefficients returned by :meth:`_finite_diff_shifts`
+                or :meth:`_parameter_shifts`
+            args (array[float]): flattened positional arguments at which to evaluate the p.d.
+            kwargs (dict[str, Any]): auxiliary arguments
+            y0 (array[float], None): output of the node at the given arguments, if known
+
+        Returns:
+            array[float]: partial derivatives of the node, shape ``(output_dim, len(recipes))``
+        """
+        try:
+            # the temporary parameters initially have the values of the ones they replace
+            base = np.r_[args, [args[orig.idx] for _, _, orig in self._temp_variables]]
+
+            rows = {}
+            if y0 is not None:
+                # the output at the unshifted arguments is known and is not evaluated again
+                rows[()] = 0
+
+            coeffs = []
+            for j, recipe in enumerate(recipes):
+                for shift, c in recipe:
+                    key = tuple(sorted(shift.items()))
+                    row = rows.setdefault(key, len(rows))
+                    coeffs.append((row, j, c))
+
+            shifted_args = np.repeat(base[np.newaxis], len(rows), axis=0)
+            for key, row in rows.items():
+                for i, s in key:
+                    shifted_args[row, i] += s
+
+            if y0 is None:
+                ret = self._evaluate_batch(shifted_args, kwargs, parallel=options.get("parallel"))
+            else:
+                ret = np.reshape(np.asarray(y0, dtype=float), (1, -1))
+
+                if len(rows) > 1:
+                    res = self._evaluate_batch(
+                        shifted_args[1:], kwargs, parallel=options.get("parallel")
+                    )
+                    ret = np.concatenate([ret, np.reshape(res, (len(rows) - 1, -1))])
+        finally:
+            self._restore_variables()
+
+        c = np.zeros((len(rows), len(recipes)))
+        for row, j, coeff in coeffs:
+            c[row, j] += coeff
+
+        return np.reshape(ret, (len(rows), -1)).T @ c
+
+    def _process_pool(self, num_workers):
+        """Worker processes used to evaluate the shifted circuits in parallel.
+
+        The pool is created on first use, and reused by later evaluations of the Jacobian
+        with the same number of workers, so that the processes are not spawned again
+        on every optimization step.
+
+        Args:
+            num_workers (int): number of worker processes
+
+        Returns:
+            ProcessPoolExecutor: the worker processes
+        """
+        if self._executor is not None and self._num_workers != num_workers:
+            self.close()
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=num_workers)
+            self._num_workers = num_workers
+            # the finalizer must not reference the node, otherwise it is never collected
+            self._executor_finalizer = weakref.finalize(self, self._executor.shutdown, wait=True)
+
+        return self._executor
+
+    def close(self):
+        """Shut down the worker processes evaluating the Jacobian in parallel, if any,
+        and wait for them to exit.
+
+        The worker processes are otherwise kept for the lifetime of the node, and
+        shut down when it is garbage collected or the interpreter exits. A later
+        parallel evaluation of the Jacobian creates new worker processes.
+        """
+        if self._executor_finalizer is not None:
+            self._executor_finalizer()
+
+        self._executor = self._num_workers = self._executor_finalizer = None
+
+    def _evaluate_batch(self, args, kwargs, parallel=None):
+        """Evaluate the node for a batch of positional argument values.
+
+        Assumes :meth:`construct` has already been called.
+
+        If ``parallel`` is given, the batch is split into contiguous chunks, and each chunk is
+        executed by a copy of the device in a worker process. The free parameter values are
+        stored in class attributes of :class:`~.Variable`, so the chunks cannot be
+        executed by threads of the calling process.
+
+        Args:
+            args (array[float]): flattened positional arguments, one row per evaluation
+            kwargs (dict[str, Any]): auxiliary arguments
+            parallel (None or int): number of worker processes
+
+        Returns:
+            array[float]: output of the node, one row per evaluation
+        """
+        self._set_variables(args[0], kwargs)
+        self.device.reset()
+
+        if parallel is None:
+            ret = self.device.batch_execute(self.circuit, args)
+        else:
+            if parallel < 1:
+                raise ValueError("The number of worker processes must be a positive integer.")
+
+            executor = self._process_pool(parallel)
+            chunks = np.array_split(args, min(parallel, len(args)))
+            devices = self.device.clones(len(chunks))
+
+            futures = [
+                executor.submit(_batch_execute, dev, self.circuit, chunk, Variable.kwarg_values)
+                for dev, chunk in zip(devices, chunks)
+            ]
+            ret = [r for f in futures for r in f.result()]
+
+        return np.array([self.output_conversion(r) for r in ret], dtype=float)
+
     def _pd_analytic(self, idx, args, kwargs, **options):
         """Partial derivative of the node using an analytic method.
 
@@ -366,6 +633,22 @@ class JacobianQNode(BaseQNode):
         """
         raise NotImplementedError
 
+    def _jacobian_analytic_var(self, indices, args, kwargs, **options):
+        """Partial derivatives of a node returning variances using an analytic method.
+
+        The default implementation calls :meth:`_pd_analytic_var` for each parameter.
+
+        Args:
+            indices (list[int]): flattened indices of the parameters wrt. which the p.d.s are computed
+            args (array[float]): flattened positional arguments at which to evaluate the p.d.s
+            kwargs (dict[str, Any]): auxiliary arguments
+
+        Returns:
+            array[float]: partial derivatives of the node, shape ``(output_dim, len(indices))``
+        """
+        pds = [self._pd_analytic_var(k, args, kwargs, **options) for k in indices]
+        return np.stack(pds, axis=-1)
+
     def to_torch(self):
         """Attach the Torch interface to the Jacobian QNode.
 
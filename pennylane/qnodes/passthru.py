@@ -16,6 +16,7 @@ PassthruQNode class
 """
 import pennylane.operation
 import pennylane.circuit_graph
+from pennylane.operation import Observable
 from .base import BaseQNode, QuantumFunctionError
 
 
@@ -27,7 +28,7 @@ PassthruQNode requires some changes to the way other PennyLane components work:
 
 1. :class:`Operator` must not do domain checking for its parameters, or it must let the ADT pass the check.
 2. The simulator device must return the result as the ADT instead of plain Python/NumPy types.
-3. Any output_conversion in :meth:`BaseQNode.evaluate` must be skipped.
+3. The output_conversion in :meth:`BaseQNode.evaluate` must keep the ADT.
 
 Additionally, any array-like ADT needs to be able to handle (1) scalar multiplication,
 (2) indexing/slicing, and possibly (3) iteration, as these are the things qfuncs expect of
@@ -114,8 +115,13 @@ class PassthruQNode(BaseQNode):
         del self.queue
         del self.obs_queue
 
-        # no output conversion
-        self.output_conversion = lambda x: x
+        # The output must remain in the ADT, so the output conversion of BaseQNode cannot be used.
+        # Instead, a single returned observable is unpacked by indexing, which the ADTs support,
+        # such that the output has the same shape as for the other QNodes.
+        if isinstance(res, Observable):
+            self.output_conversion = lambda x: x[0]
+        else:
+            self.output_conversion = lambda x: x
 
         # no Variables, self.variable_deps is empty!
         # generate the DAG
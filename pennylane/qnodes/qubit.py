@@ -18,7 +18,6 @@ Provides analytic differentiation for all one-parameter gates where the generato
 only has two unique eigenvalues; this includes one-parameter single-qubit gates.
 """
 import itertools
-import copy
 
 import numpy as np
 from scipy import linalg
@@ -103,46 +102,46 @@ class QubitQNode(JacobianQNode):
 
         return "A"
 
-    def _pd_analytic(self, idx, args, kwargs, **options):
-        """Partial derivative of the node using the analytic parameter shift method.
+    def _parameter_shifts(self, idx, **options):
+        """Shifted parameter values for the partial derivative of the node using the
+        analytic parameter shift method.
+
         Args:
             idx (int): flattened index of the parameter wrt. which the p.d. is computed
-            args (array[float]): flattened positional arguments at which to evaluate the p.d.
-            kwargs (dict[str, Any]): auxiliary arguments
 
         Returns:
-            array[float]: partial derivative of the node
+            list[tuple[dict[int, float], float]]: shifts and coefficients of the
+            shifted circuit evaluations
         """
-        n = self.num_variables
-        pd = 0.0
+        recipe = []
         # find the Operators in which the free parameter appears, use the product rule
         for op, p_idx in self.variable_deps[idx]:
 
             # We temporarily edit the Operator such that parameter p_idx is replaced by a new one,
-            # which we can modify without affecting other Operators depending on the original.
-            orig = op.params[p_idx]
-            assert orig.idx == idx
-
-            # reference to a new, temporary parameter with index n, otherwise identical with orig
-            temp_var = copy.copy(orig)
-            temp_var.idx = n
-            op.params[p_idx] = temp_var
+            # which we can shift without affecting other Operators depending on the original.
+            assert op.params[p_idx].idx == idx
+            temp_idx = self._temp_variable(op, p_idx)
 
             multiplier, shift = op.get_parameter_shift(p_idx)
 
-            # shifted parameter values
-            shift_p1 = np.r_[args, args[idx] + shift]
-            shift_p2 = np.r_[args, args[idx] - shift]
-
             # evaluate the circuit at two points with shifted parameter values
-            y2 = np.asarray(self.evaluate(shift_p1, kwargs))
-            y1 = np.asarray(self.evaluate(shift_p2, kwargs))
-            pd += (y2 - y1) * multiplier
+            recipe.append(({temp_idx: shift}, multiplier))
+            recipe.append(({temp_idx: -shift}, -multiplier))
 
-            # restore the original parameter
-            op.params[p_idx] = orig
+        return recipe
 
-        return pd
+    def _pd_analytic(self, idx, args, kwargs, **options):
+        """Partial derivative of the node using the analytic parameter shift method.
+        Args:
+            idx (int): flattened index of the parameter wrt. which the p.d. is computed
+            args (array[float]): flattened positional arguments at which to evaluate the p.d.
+            kwargs (dict[str, Any]): auxiliary arguments
+
+        Returns:
+            array[float]: partial derivative of the node
+        """
+        recipe = self._parameter_shifts(idx, **options)
+        return self._evaluate_shifts([recipe], args, kwargs, **options)[:, 0]
 
     def _pd_analytic_var(self, idx, args, kwargs, **options):
         """Partial derivative of the variance of an observable using the parameter-shift method.
@@ -155,6 +154,22 @@ class QubitQNode(JacobianQNode):
         Returns:
             array[float]: partial derivative of the node
         """
+        return self._jacobian_analytic_var([idx], args, kwargs, **options)[:, 0]
+
+    def _jacobian_analytic_var(self, indices, args, kwargs, **options):
+        r"""Partial derivatives of a node returning variances using the parameter-shift method.
+
+        The shifted circuits are evaluated in two batches, one for the derivatives of
+        :math:`\langle A^2\rangle` and one for :math:`\langle A\rangle` and its derivatives.
+
+        Args:
+            indices (list[int]): flattened indices of the parameters wrt. which the p.d.s are computed
+            args (array[float]): flattened positional arguments at which to evaluate the p.d.s
+            kwargs (dict[str, Any]): auxiliary arguments
+
+        Returns:
+            array[float]: partial derivatives of the node, shape ``(output_dim, len(indices))``
+        """
         # boolean mask: elements are True where the return type is a variance, False for expectations
         where_var = [
             e.return_type is ObservableReturnTypes.Variance for e in self.circuit.observables
@@ -187,18 +202,19 @@ class QubitQNode(JacobianQNode):
             new_observables.append(new)
 
         # calculate the analytic derivatives of the <A^2> observables
-        pdA2 = self._pd_analytic(idx, args, kwargs)
+        recipes = [self._parameter_shifts(k, **options) for k in indices]
+        pdA2 = self._evaluate_shifts(recipes, args, kwargs, **options)
 
         # restore the original observables, but convert their return types to expectation
         for e, new in zip(var_observables, new_observables):
             self.circuit.update_node(new, e)
             e.return_type = ObservableReturnTypes.Expectation
 
-        # evaluate <A>
-        evA = np.asarray(self.evaluate(args, kwargs))
-
-        # evaluate the analytic derivative of <A>
-        pdA = self._pd_analytic(idx, args, kwargs)
+        # evaluate <A> and its analytic derivatives; <A> is the
+        # linear combination consisting of the unshifted circuit only
+        recipes = [self._parameter_shifts(k, **options) for k in indices]
+        res = self._evaluate_shifts(recipes + [[({}, 1.0)]], args, kwargs, **options)
+        pdA, evA = res[:, :-1], res[:, -1:]
 
         # restore return types
         for e in var_observables:
@@ -206,6 +222,7 @@ class QubitQNode(JacobianQNode):
 
         # return d(var(A))/dp = d<A^2>/dp -2 * <A> * d<A>/dp for the variances,
         # d<A>/dp for plain expectations
+        where_var = np.reshape(where_var, (-1, 1))
         return np.where(where_var, pdA2 - 2 * evA * pdA, pdA)
 
     def _construct_metric_tensor(self, *, diag_approx=False):
@@ -16,15 +16,92 @@ This submodule contains functionality for running Variational Quantum Eigensolve
 computations using PennyLane.
 """
 # pylint: disable=too-many-arguments, too-few-public-methods
+import itertools
+from collections.abc import Sequence
+
+import networkx as nx
 import numpy as np
 import pennylane as qml
-from pennylane.operation import Observable, Tensor
+from pennylane.collections import QNodeCollection
+from pennylane.collections.dot import _get_dot_func
+from pennylane.operation import Any, Observable, Tensor
+from pennylane.ops import Hermitian
+from pennylane.qnodes import QNode
 
 
 OBS_MAP = {"PauliX": "X", "PauliY": "Y", "PauliZ": "Z", "Hadamard": "H", "Identity": "I"}
 
 
-class Hamiltonian:
+def _factors(observable):
+    """Maps each wire an observable acts on non-trivially to its tensor factor on that wire.
+
+    Args:
+        observable (Observable): a single observable or a tensor product of observables
+
+    Returns:
+        dict[int, tuple]: for each wire, a hashable key identifying the factor acting on the
+        wire, consisting of its name, wires and parameters
+    """
+    obs = observable.obs if isinstance(observable, Tensor) else [observable]
+    factors = {}
+
+    for o in obs:
+        if o.name == "Identity":
+            continue
+
+        params = tuple(tuple(np.ravel(p).tolist()) for p in o.params)
+        key = (o.name, tuple(o.wires), params)
+        factors.update({w: key for w in o.wires})
+
+    return factors
+
+
+def _qwc(factors1, factors2):
+    """Whether two observables commute qubit-wise, i.e., act with the same
+    factor on every wire they share.
+
+    Args:
+        factors1 (dict[int, tuple]): factors of the first observable, as returned
+            by :func:`_factors`
+        factors2 (dict[int, tuple]): factors of the second observable
+
+    Returns:
+        bool: ``True`` if the observables commute qubit-wise
+    """
+    return all(factors2[w] == key for w, key in factors1.items() if w in factors2)
+
+
+class _DiagonalHermitian(Hermitian):
+    """A Hermitian observable that is diagonal in the computational basis, specified by
+    its eigenvalues.
+
+    Devices treat it as a :class:`~.Hermitian` observable. Its expectation value is
+    estimated from the computational basis samples using the eigenvalues alone; the dense
+    matrix is only built if a device requests it.
+
+    Args:
+        eigvals (array[float]): the diagonal of the observable, i.e., its eigenvalue for each
+            computational basis state of ``wires``
+        wires (Sequence[int]): the wires the observable acts on
+    """
+
+    def __init__(self, eigvals, wires):
+        super().__init__(eigvals, wires=wires)
+        self.name = "Hermitian"
+
+    @staticmethod
+    def _matrix(*params):
+        return np.diag(params[0])
+
+    @property
+    def eigvals(self):
+        return np.asarray(self.params[0])
+
+    def diagonalizing_gates(self):
+        return []
+
+
+class Hamiltonian(Observable):
     r"""Lightweight class for representing Hamiltonians for Variational Quantum
     Eigensolver problems.
 
@@ -32,6 +109,9 @@ class Hamiltonian:
     :math:`\sum_{k=0}^{N-1} c_k O_k`.
 
     This class keeps track of the terms (coefficients and observables) separately.
+    A Hamiltonian acts on the union of the wires of its terms, and its expectation value
+    can be returned by a QNode using :func:`~.expval` on devices that support the
+    ``"Hamiltonian"`` observable, such as ``default.qubit`` in analytic mode.
 
     Args:
         coeffs (Iterable[float]): coefficients of the Hamiltonian expression
@@ -53,8 +133,21 @@ class Hamiltonian:
     Alternatively, the :func:`~.generate_hamiltonian` function from the
     :doc:`/introduction/chemistry` module can be used to generate a molecular
     Hamiltonian.
+
+    The expectation value of the Hamiltonian can be measured by a QNode:
+
+    >>> dev = qml.device("default.qubit", wires=3)
+    >>> @qml.qnode(dev)
+    ... def circuit(x):
+    ...     qml.RX(x, wires=0)
+    ...     return qml.expval(H)
     """
 
+    num_params = 0
+    num_wires = Any
+    par_domain = None
+    grad_method = None
+
     def __init__(self, coeffs, observables):
 
         if len(coeffs) != len(observables):
@@ -77,6 +170,10 @@ class Hamiltonian:
         self._coeffs = coeffs
         self._ops = observables
 
+        # the Hamiltonian is queued by the measurement function returning it
+        wires = sorted({int(w) for obs in observables for w in np.hstack(obs.wires)})
+        super().__init__(wires=wires, do_queue=False)
+
     @property
     def coeffs(self):
         """Return the coefficients defining the Hamiltonian.
@@ -104,6 +201,63 @@ class Hamiltonian:
         """
         return self.coeffs, self.ops
 
+    def diagonalizing_gates(self):
+        """Hamiltonians are measured by the device on the unrotated state, since their
+        terms do not share an eigenbasis in general.
+
+        Returns:
+            list: an empty list
+        """
+        return []
+
+    def qwc_groups(self):
+        """Partition the terms of the Hamiltonian into groups of qubit-wise commuting terms.
+
+        Two terms commute qubit-wise if, on every wire they both act on non-trivially,
+        they act with the same observable. All terms of a group can be measured using the
+        same circuit execution after applying the diagonalizing gates of their factors.
+
+        The partition is found by a greedy colouring of the graph whose nodes are the terms,
+        and whose edges connect terms that do not commute qubit-wise.
+
+        Returns:
+            list[Hamiltonian]: the groups, with the terms of each group in the order
+            they appear in the Hamiltonian
+
+        **Example:**
+
+        >>> obs = [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliZ(1), qml.PauliZ(0)]
+        >>> H = qml.Hamiltonian([0.2, -0.5, 1.2], obs)
+        >>> for group in H.qwc_groups():
+        ...     print(group)
+        (0.2) [X0 Z1]
+        + (-0.5) [Z1]
+        (1.2) [Z0]
+        """
+        factors = [_factors(obs) for obs in self.ops]
+
+        graph = nx.Graph()
+        graph.add_nodes_from(range(len(self.ops)))
+        graph.add_edges_from(
+            (i, j)
+            for i, j in itertools.combinations(range(len(self.ops)), 2)
+            if not _qwc(factors[i], factors[j])
+        )
+
+        colours = nx.coloring.greedy_color(graph, strategy="largest_first")
+        groups = {}
+
+        for i in range(len(self.ops)):
+            groups.setdefault(colours[i], []).append(i)
+
+        # order the groups by their first term
+        groups = sorted(groups.values())
+
+        return [
+            Hamiltonian([self.coeffs[i] for i in group], [self.ops[i] for i in group])
+            for group in groups
+        ]
+
     def __str__(self):
         terms = []
 
@@ -144,6 +298,13 @@ class VQECost:
             Supports all interfaces supported by the :func:`~.qnode` decorator.
         diff_method (str, None): The method of differentiation to use with the created cost function.
             Supports all differentiation methods supported by the :func:`~.qnode` decorator.
+        grouping (bool): If ``True``, the terms of the Hamiltonian are partitioned into groups
+            of qubit-wise commuting terms using :meth:`Hamiltonian.qwc_groups`, and a single
+            QNode is created per group. Each QNode returns the computational basis probabilities
+            after rotating into the shared eigenbasis of its terms, from which the expectation
+            values of all terms in the group are computed. On devices that are not in analytic
+            mode, each QNode instead returns the expectation of the group's diagonal observable
+            in that basis, estimated from samples. Requires a single device.
 
     Returns:
         callable: a cost function with signature ``cost_fn(params, **kwargs)`` that evaluates
@@ -191,21 +352,161 @@ class VQECost:
 
     The cost function can be minimized using any gradient descent-based
     :doc:`optimizer </introduction/optimizers>`.
+
+    If the device computes the expectation values of Hamiltonians directly, as
+    ``default.qubit`` does in analytic mode, the cost function evaluates a single QNode
+    returning the expectation value of the whole Hamiltonian. Otherwise, a QNode is
+    created per term.
+
+    For Hamiltonians with many terms, passing ``grouping=True`` reduces the number of
+    circuit executions required to evaluate the cost function:
+
+    >>> cost = qml.VQECost(ansatz, hamiltonian, dev, interface="torch", grouping=True)
+    >>> len(cost.qnodes)
+    1
     """
 
-    def __init__(self, ansatz, hamiltonian, device, interface="autograd", diff_method="best"):
+    def __init__(
+        self, ansatz, hamiltonian, device, interface="autograd", diff_method="best", grouping=False
+    ):
         coeffs, observables = hamiltonian.terms
         self.hamiltonian = hamiltonian
         """Hamiltonian: the hamiltonian defining the VQE problem."""
 
+        if grouping:
+            self.qnodes, self.cost_fn = self._grouped_cost(
+                ansatz, device, interface=interface, diff_method=diff_method
+            )
+            return
+
+        if (
+            not isinstance(device, Sequence)
+            and getattr(device, "analytic", False)
+            and device.supports_observable("Hamiltonian")
+        ):
+            self.qnodes, self.cost_fn = self._hamiltonian_cost(
+                ansatz, device, interface=interface, diff_method=diff_method
+            )
+            return
+
         self.qnodes = qml.map(
             ansatz, observables, device, interface=interface, diff_method=diff_method
         )
         """QNodeCollection: The QNodes to be evaluated. Each QNode corresponds to the
-        the expectation value of each observable term after applying the circuit ansatz.
+        the expectation value of each observable term after applying the circuit ansatz,
+        unless the Hamiltonian is measured by a single QNode.
         """
 
         self.cost_fn = qml.dot(coeffs, self.qnodes)
 
+    def _hamiltonian_cost(self, ansatz, device, interface, diff_method):
+        """Create a cost function that measures the whole Hamiltonian using a single QNode,
+        on devices that compute the expectation values of Hamiltonians directly.
+
+        Args:
+            ansatz (callable): the ansatz for the circuit before the final measurement step
+            device (Device): device where the QNode should be executed
+            interface (str, None): which interface to use
+            diff_method (str, None): the method of differentiation to use
+
+        Returns:
+            tuple[QNodeCollection, callable]: the QNode, and the cost function
+        """
+        if not callable(ansatz):
+            raise ValueError("Could not create QNodes. The ansatz is not a callable function.")
+
+        dev_wires = list(range(device.num_wires))
+        hamiltonian = self.hamiltonian
+
+        def circuit(params, **kwargs):
+            ansatz(params, wires=dev_wires, **kwargs)
+            return qml.expval(hamiltonian)
+
+        qnode = QNode(circuit, device, interface=interface, diff_method=diff_method)
+        qnodes = QNodeCollection([qnode])
+
+        # the coefficients are part of the measured Hamiltonian; the dot product returns
+        # the cost in the same type as the cost function summing the individual terms
+        return qnodes, qml.dot([1.0], qnodes)
+
+    def _grouped_cost(self, ansatz, device, interface, diff_method):
+        """Create a cost function that measures each group of qubit-wise
+        commuting Hamiltonian terms using a single QNode.
+
+        Args:
+            ansatz (callable): the ansatz for the circuit before the final measurement step
+            device (Device): device where the QNodes should be executed
+            interface (str, None): which interface to use
+            diff_method (str, None): the method of differentiation to use
+
+        Returns:
+            tuple[QNodeCollection, callable]: the QNodes, one per group, and the cost function
+        """
+        if not callable(ansatz):
+            raise ValueError("Could not create QNodes. The ansatz is not a callable function.")
+
+        if isinstance(device, Sequence):
+            raise ValueError("Grouping the Hamiltonian terms requires a single device.")
+
+        qnodes = []
+        weights = []
+        dev_wires = list(range(device.num_wires))
+
+        # hardware devices do not define the analytic attribute, and return estimates
+        analytic = getattr(device, "analytic", False)
+
+        for group in self.hamiltonian.qwc_groups():
+            # the distinct tensor factors of the group, with their diagonalizing gates
+            factors = {}
+
+            for obs in group.ops:
+                for o in obs.obs if isinstance(obs, Tensor) else [obs]:
+                    if o.name != "Identity":
+                        factors.setdefault(_factors(o)[o.wires[0]], o)
+
+            wires = sorted({w for obs in group.ops for w in np.hstack(obs.wires)})
+
+            # the eigenvalues of the group's terms in the computational basis of the measured
+            # wires, after rotating into their shared eigenbasis
+            basis = np.array(list(itertools.product([0, 1], repeat=len(wires))))
+            w = np.zeros(2 ** len(wires))
+
+            for coeff, obs in zip(*group.terms):
+                # the eigenvalues of tensor products are ordered by the wires of their factors
+                obs_wires = np.hstack(sorted(obs.wires) if isinstance(obs, Tensor) else obs.wires)
+                bits = basis[:, [wires.index(i) for i in obs_wires]]
+                idx = np.ravel_multi_index(bits.T, [2] * len(obs_wires))
+                w += coeff * obs.eigvals[idx]
+
+            # Note: the factors, measured wires and eigenvalues are passed as *default arguments*
+            # to avoid Python's late binding closure behaviour
+            def circuit(
+                params, _factors=list(factors.values()), _wires=wires, _w=w, **kwargs
+            ):  # pylint: disable=dangerous-default-value
+                ansatz(params, wires=dev_wires, **kwargs)
+
+                for o in _factors:
+                    o.diagonalizing_gates()
+
+                if analytic:
+                    return qml.probs(wires=_wires)
+
+                # probabilities are exact even in finite-shot mode, so the expectation
+                # of the group is estimated from samples of the diagonal observable
+                return qml.expval(_DiagonalHermitian(_w, wires=_wires))
+
+            qnodes.append(QNode(circuit, device, interface=interface, diff_method=diff_method))
+            weights.append(_get_dot_func(interface, w)[1])
+
+        dot, _ = _get_dot_func(interface)
+
+        def cost_fn(params, **kwargs):
+            if not analytic:
+                return sum(q(params, **kwargs) for q in qnodes)
+
+            return sum(dot(q(params, **kwargs), w) for q, w in zip(qnodes, weights))
+
+        return QNodeCollection(qnodes), cost_fn
+
     def __call__(self, *args, **kwargs):
         return self.cost_fn(*args, **kwargs)
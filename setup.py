@@ -38,6 +38,8 @@ info = {
     'entry_points': {
         'pennylane.plugins': [
             'default.qubit = pennylane.plugins:DefaultQubit',
+            'default.qubit.autograd = pennylane.plugins:DefaultQubitAutograd',
+            'default.mixed = pennylane.plugins:DefaultMixed',
             'default.gaussian = pennylane.plugins:DefaultGaussian',
             'default.tensor = pennylane.beta.plugins.default_tensor:DefaultTensor',
             'default.tensor.tf = pennylane.beta.plugins.default_tensor_tf:DefaultTensorTF'
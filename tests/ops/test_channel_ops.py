@@ -0,0 +1,64 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the available built-in quantum channels.
+"""
+import pytest
+import numpy as np
+
+import pennylane as qml
+
+
+CHANNELS = [qml.AmplitudeDamping, qml.BitFlip, qml.DepolarizingChannel]
+
+
+class TestChannels:
+    """Tests for the quantum channels"""
+
+    @pytest.mark.parametrize("channel", CHANNELS)
+    @pytest.mark.parametrize("p", [0.0, 0.1, 0.5, 1.0])
+    def test_kraus_matrices_are_trace_preserving(self, channel, p, tol):
+        """Test that the Kraus matrices of each channel satisfy sum_k K_k^dagger K_k = I"""
+        op = channel(p, wires=0)
+        K_list = op.kraus_matrices
+
+        K_arr = np.array(K_list)
+        res = np.einsum("kji,kjl->il", K_arr.conj(), K_arr)
+        assert np.allclose(res, np.eye(2), atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("channel", CHANNELS)
+    @pytest.mark.parametrize("p", [-0.1, 1.1])
+    def test_invalid_parameter(self, channel, p):
+        """Test that an error is raised if the channel parameter is not a probability"""
+        with pytest.raises(ValueError, match="must be between 0 and 1"):
+            channel(p, wires=0).kraus_matrices
+
+    def test_amplitude_damping(self, tol):
+        """Test the Kraus matrices of the amplitude damping channel"""
+        K0, K1 = qml.AmplitudeDamping._kraus_matrices(0.36)
+        assert np.allclose(K0, np.diag([1, 0.8]), atol=tol, rtol=0)
+        assert np.allclose(K1, [[0, 0.6], [0, 0]], atol=tol, rtol=0)
+
+    def test_bit_flip(self, tol):
+        """Test the Kraus matrices of the bit flip channel"""
+        K0, K1 = qml.BitFlip._kraus_matrices(0.36)
+        assert np.allclose(K0, 0.8 * np.eye(2), atol=tol, rtol=0)
+        assert np.allclose(K1, [[0, 0.6], [0.6, 0]], atol=tol, rtol=0)
+
+    def test_depolarizing_channel(self, tol):
+        """Test the Kraus matrices of the depolarizing channel"""
+        K = qml.DepolarizingChannel._kraus_matrices(0.75)
+        assert len(K) == 4
+        assert np.allclose(K[0], 0.5 * np.eye(2), atol=tol, rtol=0)
+        assert np.allclose(K[2], 0.5 * np.array([[0, -1j], [1j, 0]]), atol=tol, rtol=0)
@@ -19,7 +19,7 @@ import numpy as np
 import pytest
 
 import pennylane as qml
-from pennylane.qnodes import qnode, CVQNode, JacobianQNode, BaseQNode, QubitQNode
+from pennylane.qnodes import qnode, CVQNode, JacobianQNode, BaseQNode, QubitQNode, AdjointQNode
 from pennylane.qnodes.jacobian import DEFAULT_STEP_SIZE_ANALYTIC, DEFAULT_STEP_SIZE
 
 
@@ -155,6 +155,31 @@ def test_no_interface():
     assert circuit.interface is None
 
 
+def test_create_adjoint_qnode():
+    """Test the decorator correctly creates adjoint QNodes"""
+    dev = qml.device('default.qubit', wires=1)
+
+    @qnode(dev, diff_method="adjoint")
+    def circuit(a):
+        qml.RX(a, wires=0)
+        return qml.expval(qml.PauliZ(wires=0))
+
+    assert isinstance(circuit, AdjointQNode)
+    assert hasattr(circuit, "jacobian")
+
+
+def test_adjoint_unsupported_device():
+    """Test exception raised if the adjoint method is requested
+    for a device that does not support it"""
+    dev = qml.device('default.gaussian', wires=1)
+
+    with pytest.raises(ValueError, match="does not support the adjoint differentiation method"):
+        @qnode(dev, diff_method="adjoint")
+        def circuit(a):
+            qml.Displacement(a, 0, wires=0)
+            return qml.expval(qml.X(wires=0))
+
+
 def test_not_differentiable():
     """Test QNode marked as non-differentiable"""
     dev = qml.device('default.qubit', wires=1)
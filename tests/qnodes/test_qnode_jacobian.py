@@ -15,6 +15,9 @@
 Unit tests for the :mod:`pennylane` :class:`JacobianQNode` class.
 """
 
+import gc
+import multiprocessing
+
 import pytest
 import numpy as np
 
@@ -215,3 +218,316 @@ class TestBestMethod:
         q = JacobianQNode(circuit, operable_mock_device_2_wires)
         q._construct([np.array([1.0])], {})
         assert q.par_to_grad_method == {0: None}
+
+
+@pytest.fixture(scope="function")
+def batch_counter(monkeypatch):
+    """Counts the calls to batch_execute of the default.qubit device."""
+    calls = []
+    original = qml.plugins.DefaultQubit.batch_execute
+
+    def batch_execute(self, circuit, parameters, **kwargs):
+        calls.append(len(parameters))
+        return original(self, circuit, parameters, **kwargs)
+
+    monkeypatch.setattr(qml.plugins.DefaultQubit, "batch_execute", batch_execute)
+    return calls
+
+
+class TestBatchedJacobian:
+    """Tests that the shifted circuits of a Jacobian are evaluated in batches."""
+
+    @staticmethod
+    def circuit(x, y, z):
+        qml.RX(x, wires=[0])
+        qml.RY(y, wires=[1])
+        qml.CNOT(wires=[0, 1])
+        qml.RX(z, wires=[0])
+        qml.RY(x, wires=[1])
+        return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+    @pytest.mark.parametrize("method", ["A", "F"])
+    def test_single_batch(self, method, batch_counter, tol):
+        """Test that all the shifted circuits are evaluated in a single batch, and that
+        the Jacobian agrees with the one evaluated one partial derivative at a time."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        args = (0.1, -0.4, 0.7)
+
+        jac = node.jacobian(args, method=method)
+        assert len(batch_counter) == 1
+
+        # x appears in two operations, which are shifted separately
+        expected_rows = {"A": 8, "F": 4}[method]
+        assert batch_counter[0] == expected_rows
+
+        expected = [node.jacobian(args, wrt=[k], method=method)[:, 0] for k in range(3)]
+        expected = np.stack(expected, axis=-1)
+        assert np.allclose(jac, expected, atol=tol, rtol=0)
+
+    def test_mixed_methods(self, batch_counter):
+        """Test that analytic and finite difference partial derivatives are evaluated
+        in the same batch."""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        node = qml.qnodes.QubitQNode(circuit, dev)
+        node._construct((0.3, 0.2), {})
+        node.par_to_grad_method = {0: "A", 1: "F"}
+        node.mutable = False
+
+        jac = node.jacobian([0.3, 0.2], method="best")
+        assert len(batch_counter) == 1
+
+        expected = [-np.sin(0.3) * np.cos(0.2), -np.cos(0.3) * np.sin(0.2)]
+        assert np.allclose(jac, [expected], atol=1e-6, rtol=0)
+
+    def test_variance(self, batch_counter, tol):
+        """Test that the derivatives of variances are evaluated in two batches,
+        independently of the number of parameters."""
+        dev = qml.device("default.qubit", wires=1)
+
+        def circuit(x, y):
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[0])
+            return qml.var(qml.PauliZ(0))
+
+        node = qml.qnodes.QubitQNode(circuit, dev)
+        x, y = 0.3, -0.5
+
+        jac = node.jacobian([x, y], method="A")
+        assert len(batch_counter) == 2
+
+        # var(Z) = 1 - cos(x)^2 cos(y)^2
+        expected = [
+            2 * np.cos(x) * np.sin(x) * np.cos(y) ** 2,
+            2 * np.cos(x) ** 2 * np.cos(y) * np.sin(y),
+        ]
+        assert np.allclose(jac, [expected], atol=tol, rtol=0)
+
+    def test_parameters_restored(self, tol):
+        """Test that the temporary parameters used for the shifts are
+        replaced by the original ones afterwards."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        args = (0.1, -0.4, 0.7)
+
+        res = node(*args)
+        node.jacobian(args, method="A")
+
+        assert node._temp_variables == []
+        assert all(
+            op.params[p_idx].idx == idx
+            for idx, deps in node.variable_deps.items()
+            for op, p_idx in deps
+        )
+        assert np.allclose(node(*args), res, atol=tol, rtol=0)
+
+
+class TestParallelJacobian:
+    """Tests for evaluating the shifted circuits of a Jacobian in worker processes."""
+
+    @staticmethod
+    def circuit(x, y, z):
+        qml.RX(x, wires=[0])
+        qml.RY(y, wires=[1])
+        qml.CNOT(wires=[0, 1])
+        qml.RX(z, wires=[0])
+        qml.RY(x, wires=[1])
+        return qml.expval(qml.PauliZ(0)), qml.var(qml.PauliZ(1))
+
+    @pytest.mark.parametrize("method", ["A", "F"])
+    def test_agrees_with_serial(self, method, tol):
+        """Test that the Jacobian evaluated by worker processes agrees with
+        the one evaluated in the calling process."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        args = (0.1, -0.4, 0.7)
+
+        res = node.jacobian(args, method=method, options={"parallel": 2})
+        expected = node.jacobian(args, method=method)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_qnode_option(self, tol):
+        """Test that the number of worker processes can be set for the QNode, and
+        is then used when differentiating it using an interface."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.QNode(self.circuit, dev, parallel=2)
+        assert node.parallel == 2
+
+        def cost(x, y, z):
+            return node(x, y, z)[1]
+
+        res = qml.grad(cost, argnum=[0, 1, 2])(0.1, -0.4, 0.7)
+        expected = qml.qnodes.QubitQNode(self.circuit, dev).jacobian([0.1, -0.4, 0.7])[1]
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_workers_are_reused(self):
+        """Test that the worker processes are kept between evaluations of the Jacobian,
+        and shut down by close."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        children = set(multiprocessing.active_children())
+
+        node.jacobian((0.1, -0.4, 0.7), options={"parallel": 2})
+        executor = node._executor
+        workers = set(multiprocessing.active_children()) - children
+        assert executor is not None
+
+        node.jacobian((0.2, -0.3, 0.5), options={"parallel": 2})
+        assert node._executor is executor
+        assert set(multiprocessing.active_children()) - children == workers
+
+        node.close()
+        assert node._executor is None
+        assert workers.isdisjoint(multiprocessing.active_children())
+
+    def test_workers_number_changed(self):
+        """Test that the worker processes are replaced if the number of workers changes."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        children = set(multiprocessing.active_children())
+
+        node.jacobian((0.1, -0.4, 0.7), options={"parallel": 2})
+        executor = node._executor
+        workers = set(multiprocessing.active_children()) - children
+        node.jacobian((0.1, -0.4, 0.7), options={"parallel": 3})
+
+        assert node._executor is not executor
+        assert node._num_workers == 3
+        assert workers.isdisjoint(multiprocessing.active_children())
+
+        node.close()
+
+    def test_workers_are_shut_down_on_collection(self):
+        """Test that the worker processes are shut down when the node is garbage collected."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+        children = set(multiprocessing.active_children())
+
+        node.jacobian((0.1, -0.4, 0.7), options={"parallel": 2})
+        finalizer = node._executor_finalizer
+        workers = set(multiprocessing.active_children()) - children
+
+        del node
+        gc.collect()
+
+        assert not finalizer.alive
+        assert workers.isdisjoint(multiprocessing.active_children())
+
+    def test_invalid_number_of_workers(self):
+        """Test that an exception is raised if the number of worker processes is not positive."""
+        dev = qml.device("default.qubit", wires=2)
+        node = qml.qnodes.QubitQNode(self.circuit, dev)
+
+        with pytest.raises(ValueError, match="number of worker processes must be a positive"):
+            node.jacobian((0.1, -0.4, 0.7), options={"parallel": 0})
+
+        # the temporary parameters were restored
+        assert node._temp_variables == []
+
+
+@pytest.fixture(scope="function")
+def construct_counter(monkeypatch):
+    """Counts the constructions of the circuits of JacobianQNodes."""
+    calls = []
+    original = JacobianQNode._construct
+
+    def _construct(self, args, kwargs):
+        calls.append(args)
+        return original(self, args, kwargs)
+
+    monkeypatch.setattr(JacobianQNode, "_construct", _construct)
+    return calls
+
+
+class TestForwardPassReuse:
+    """Tests that the Jacobian reuses the circuit and the output of the forward pass."""
+
+    @staticmethod
+    def circuit(x, y, n=1):
+        for _ in range(n):
+            qml.RX(x, wires=[0])
+        qml.RY(y, wires=[0])
+        return qml.expval(qml.PauliZ(0))
+
+    def test_forward_pass_reused(self, batch_counter, construct_counter, tol):
+        """Test that the Jacobian at the arguments of the last evaluation reuses the
+        circuit and does not evaluate the unshifted circuit again."""
+        dev = qml.device("default.qubit", wires=1)
+        node = qml.qnodes.QubitQNode(self.circuit, dev, mutable=True)
+        x, y = 0.3, -0.2
+
+        node(x, y)
+        assert len(construct_counter) == 1
+
+        jac = node.jacobian([x, y], method="F")
+        assert len(construct_counter) == 1
+
+        # only the shifted circuits are evaluated
+        assert batch_counter == [2]
+
+        expected = [[-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)]]
+        assert np.allclose(jac, expected, atol=1e-6, rtol=0)
+
+    def test_different_arguments(self, batch_counter, construct_counter, tol):
+        """Test that the circuit is constructed again and the unshifted circuit is
+        evaluated if the arguments differ from the last evaluation."""
+        dev = qml.device("default.qubit", wires=1)
+        node = qml.qnodes.QubitQNode(self.circuit, dev, mutable=True)
+        x, y = 0.3, -0.2
+
+        node(0.1, 0.5)
+        jac = node.jacobian([x, y], method="F")
+
+        assert len(construct_counter) == 2
+        assert batch_counter == [3]
+
+        expected = [[-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)]]
+        assert np.allclose(jac, expected, atol=1e-6, rtol=0)
+
+    def test_different_auxiliary_arguments(self, construct_counter, tol):
+        """Test that the circuit is constructed again if the auxiliary arguments differ
+        from the last evaluation."""
+        dev = qml.device("default.qubit", wires=1)
+        node = qml.qnodes.QubitQNode(self.circuit, dev, mutable=True)
+        x, y = 0.3, -0.2
+
+        node(x, y, n=1)
+        jac = node.jacobian([x, y], {"n": 2}, method="A")
+
+        assert len(construct_counter) == 2
+
+        expected = [[-2 * np.sin(2 * x) * np.cos(y), -np.cos(2 * x) * np.sin(y)]]
+        assert np.allclose(jac, expected, atol=tol, rtol=0)
+
+    def test_interface(self, construct_counter, tol):
+        """Test that differentiating a QNode using an interface constructs
+        the circuit only once."""
+        dev = qml.device("default.qubit", wires=1)
+        node = qml.QNode(self.circuit, dev)
+        x, y = 0.3, -0.2
+
+        res = qml.grad(node, argnum=[0, 1])(x, y)
+        assert len(construct_counter) == 1
+
+        expected = [-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_argument_key(self):
+        """Test that the argument key identifies the shapes and values of the arguments."""
+        key = JacobianQNode._argument_key
+
+        class Unhashable:
+            __hash__ = None
+
+        assert key((0.1, [0.2, 0.3]), {"n": 1}) == key((0.1, np.array([0.2, 0.3])), {"n": 1})
+        assert key((0.1, [0.2, 0.3]), {}) != key((0.1, [[0.2, 0.3]]), {})
+        assert key((0.1,), {"n": 1}) != key((0.1,), {"n": 2})
+        assert key((0.1,), {"f": Unhashable()}) is None
@@ -0,0 +1,202 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.plugin.DefaultMixed` device.
+"""
+# pylint: disable=protected-access
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np, DeviceError
+
+
+def circuit_ops(x, y):
+    """A pure two-qubit circuit"""
+    qml.RX(x, wires=0)
+    qml.RY(y, wires=1)
+    qml.CNOT(wires=[0, 1])
+    qml.Rot(x, y, 0.3, wires=1)
+    qml.CRZ(y, wires=[1, 0])
+    qml.S(wires=0).inv()
+
+
+class TestDefaultMixed:
+    """Tests for the default.mixed device"""
+
+    def test_load_device(self):
+        """Test that the device loads through its entry point"""
+        dev = qml.device("default.mixed", wires=2)
+        assert dev.num_wires == 2
+        assert dev.short_name == "default.mixed"
+
+    def test_initial_state(self, tol):
+        """Test that the device is initialized in the |00><00| state"""
+        dev = qml.device("default.mixed", wires=2)
+        expected = np.zeros((4, 4))
+        expected[0, 0] = 1
+        assert np.allclose(dev.state, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("x,y", [(0.1, 0.2), (1.3, -0.6)])
+    def test_pure_circuit_agrees_with_default_qubit(self, x, y, tol):
+        """Test that the density matrix of a pure circuit is the projector
+        onto the state vector computed by default.qubit"""
+        dev = qml.device("default.mixed", wires=2)
+        dev_qubit = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            circuit_ops(x, y)
+            return qml.expval(qml.PauliZ(0)), qml.var(qml.PauliX(1))
+
+        def probs(x, y):
+            circuit_ops(x, y)
+            return qml.probs(wires=[1, 0])
+
+        for func in (circuit, probs):
+            res = qml.QNode(func, dev)(x, y)
+            expected = qml.QNode(func, dev_qubit)(x, y)
+            assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        psi = dev_qubit.state
+        assert np.allclose(dev.state, np.outer(psi, psi.conj()), atol=tol, rtol=0)
+
+    def test_hermitian_expval(self, tol):
+        """Test that Hermitian expectation values agree with default.qubit"""
+        A = np.array([[1, 2j], [-2j, 0]])
+        dev = qml.device("default.mixed", wires=2)
+        dev_qubit = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            circuit_ops(x, y)
+            return qml.expval(qml.Hermitian(A, wires=1))
+
+        res = qml.QNode(circuit, dev)(0.4, 0.7)
+        expected = qml.QNode(circuit, dev_qubit)(0.4, 0.7)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("gamma", [0.0, 0.2, 1.0])
+    def test_amplitude_damping(self, gamma, tol):
+        """Test that amplitude damping decays the excited state"""
+        dev = qml.device("default.mixed", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(gamma):
+            qml.PauliX(wires=0)
+            qml.AmplitudeDamping(gamma, wires=0)
+            return qml.probs(wires=0)
+
+        res = circuit(gamma)
+        assert np.allclose(res, [gamma, 1 - gamma], atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("p", [0.0, 0.3, 1.0])
+    def test_bit_flip(self, p, tol):
+        """Test that the bit flip channel flips one qubit of an entangled state"""
+        dev = qml.device("default.mixed", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(p):
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.BitFlip(p, wires=1)
+            return qml.probs(wires=[0, 1])
+
+        res = circuit(p)
+        expected = np.array([1 - p, p, p, 1 - p]) / 2
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_depolarizing_channel(self, tol):
+        """Test that the fully depolarizing channel with p=3/4 yields the
+        maximally mixed state"""
+        dev = qml.device("default.mixed", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.DepolarizingChannel(0.75, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        assert np.allclose(circuit(0.4), 0, atol=tol, rtol=0)
+
+        rho = dev.state
+        assert np.allclose(np.trace(rho), 1, atol=tol, rtol=0)
+        assert np.allclose(rho, rho.conj().T, atol=tol, rtol=0)
+        # the first wire is traced out into the maximally mixed state
+        reduced = np.trace(np.reshape(rho, [2] * 4), axis1=1, axis2=3)
+        assert np.allclose(reduced, np.eye(2) / 2, atol=tol, rtol=0)
+
+    def test_channel_gradient(self, tol):
+        """Test that the channel parameters are differentiated using finite differences"""
+        dev = qml.device("default.mixed", wires=1)
+
+        @qml.qnode(dev)
+        def circuit(gamma):
+            qml.PauliX(wires=0)
+            qml.AmplitudeDamping(gamma, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        grad = qml.grad(circuit, argnum=0)(0.3)
+        assert np.allclose(grad, 2, atol=1e-5, rtol=0)
+
+    def test_state_vector_preparation(self, tol):
+        """Test that QubitStateVector prepares the corresponding pure state"""
+        dev = qml.device("default.mixed", wires=2)
+        psi = np.array([1, 1j]) / np.sqrt(2)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.QubitStateVector(psi, wires=[1])
+            return qml.expval(qml.PauliY(1))
+
+        assert np.allclose(circuit(), 1, atol=tol, rtol=0)
+
+        expected = np.zeros(4, dtype=complex)
+        expected[:2] = psi
+        assert np.allclose(dev.state, np.outer(expected, expected.conj()), atol=tol, rtol=0)
+
+    def test_state_preparation_after_operations(self):
+        """Test that an error is raised if a state is prepared after other operations"""
+        dev = qml.device("default.mixed", wires=1)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.PauliX(wires=0)
+            qml.BasisState(np.array([1]), wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            circuit()
+
+    def test_sampling(self):
+        """Test that samples are generated from the diagonal of the density matrix"""
+        dev = qml.device("default.mixed", wires=1, shots=10, analytic=False, seed=42)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.PauliX(wires=0)
+            qml.AmplitudeDamping(1.0, wires=0)
+            return qml.sample(qml.PauliZ(0))
+
+        assert np.all(circuit() == 1)
+
+    def test_channels_unsupported_by_default_qubit(self):
+        """Test that default.qubit does not accept channels"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.BitFlip(0.1, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(qml.DeviceError, match="not supported on device"):
+            circuit()
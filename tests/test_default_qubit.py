@@ -402,6 +402,544 @@ class TestApply:
                 qml.BasisState(np.array([1, 1]), wires=[0, 1])
             ])
 
+
+class TestApplyUnitary:
+    """Tests for the slicing kernels used to apply one- and two-qubit gates."""
+
+    @pytest.mark.parametrize("mat,wires", [
+        (U, [0]), (U, [2]), (U, [3]),
+        (U2, [0, 1]), (U2, [1, 0]), (U2, [3, 1]), (U2, [0, 3]),
+    ])
+    def test_agrees_with_mat_vec_product(self, mat, wires, tol):
+        """Tests that the slicing kernel agrees with the tensordot implementation."""
+        dev = qml.device("default.qubit", wires=4)
+
+        state = np.random.random(16) + 1j * np.random.random(16)
+        state /= np.linalg.norm(state)
+        dev._state = state
+
+        expected = dev.mat_vec_product(mat, state, wires)
+        dev._apply_unitary(mat, wires)
+
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    def test_buffers_are_recycled(self):
+        """Tests that consecutive gates alternate between two preallocated arrays."""
+        dev = qml.device("default.qubit", wires=3)
+        dev._apply_unitary(U, [0])
+        dev._apply_unitary(U2, [0, 1])
+
+        state, buffer = dev._state, dev._buffer
+        assert buffer is not None
+        assert state is not buffer
+
+        dev._apply_unitary(U, [2])
+        assert dev._state is buffer
+        assert dev._buffer is state
+
+    def test_rotations_do_not_overwrite_pre_rotated_state(self, tol):
+        """Tests that applying the diagonalizing gates does not modify the state
+        returned by the ``state`` attribute."""
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply(
+            [qml.RX(0.4, wires=[0]), qml.CNOT(wires=[0, 1])],
+            rotations=[qml.Hadamard(wires=[0]), qml.RY(0.2, wires=[1]), qml.Hadamard(wires=[1])],
+        )
+
+        expected = np.array([np.cos(0.2), 0, 0, -1j * np.sin(0.2)])
+        assert np.allclose(dev.state, expected, atol=tol, rtol=0)
+
+
+class TestApplyOperation:
+    """Tests for the diagonal and permutation gate kernels."""
+
+    @pytest.mark.parametrize("op", [
+        qml.PauliZ(wires=[2]),
+        qml.S(wires=[0]),
+        qml.T(wires=[3]),
+        qml.RZ(0.432, wires=[1]),
+        qml.PhaseShift(-0.12, wires=[2]),
+        qml.CZ(wires=[3, 0]),
+        qml.CRZ(0.654, wires=[1, 3]),
+        qml.PauliX(wires=[1]),
+        qml.CNOT(wires=[2, 0]),
+        qml.SWAP(wires=[1, 3]),
+        qml.CSWAP(wires=[3, 0, 2]),
+        qml.Toffoli(wires=[0, 2, 1]),
+    ])
+    @pytest.mark.parametrize("inverse", [False, True])
+    def test_agrees_with_mat_vec_product(self, op, inverse, tol):
+        """Tests that the diagonal and permutation kernels agree with the
+        tensordot implementation."""
+        dev = qml.device("default.qubit", wires=4)
+
+        if inverse:
+            op.inv()
+
+        state = np.random.random(16) + 1j * np.random.random(16)
+        state /= np.linalg.norm(state)
+        dev._state = state
+
+        expected = dev.mat_vec_product(op.matrix, state, op.wires)
+        dev._apply_operation(op)
+
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("name,kernel", [
+        ("RZ", "_apply_diagonal"),
+        ("CNOT", "_apply_permutation"),
+        ("Hadamard", "_apply_unitary"),
+    ])
+    def test_kernel_dispatch(self, name, kernel, monkeypatch):
+        """Tests that operations are dispatched to the correct kernel."""
+        dev = qml.device("default.qubit", wires=2)
+        calls = []
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, kernel, lambda *args: calls.append(args))
+
+            op_class = getattr(qml, name)
+            op = op_class(*[0.1] * op_class.num_params, wires=list(range(op_class.num_wires)))
+            dev.apply([op])
+
+        assert len(calls) == 1
+
+
+class TestPrecision:
+    """Tests for the single-precision simulation mode."""
+
+    def test_invalid_dtype(self):
+        """Tests that an exception is raised for non-complex data types."""
+        with pytest.raises(DeviceError, match="requires a complex floating point type"):
+            qml.device("default.qubit", wires=2, c_dtype=np.float32)
+
+    @pytest.mark.parametrize("ops", [
+        [qml.RX(0.1, wires=[0]), qml.CNOT(wires=[0, 1])],
+        [qml.BasisState(np.array([1, 0]), wires=[0, 1]), qml.RZ(0.3, wires=[1])],
+        [qml.QubitStateVector(np.array([1, 1j]) / np.sqrt(2), wires=[1]), qml.SWAP(wires=[0, 1])],
+    ])
+    def test_state_dtype(self, ops):
+        """Tests that the state vector keeps the requested data type."""
+        dev = qml.device("default.qubit", wires=2, c_dtype=np.complex64)
+        assert dev.state.dtype == np.complex64
+
+        dev.apply(ops, rotations=[qml.Hadamard(wires=[0])])
+        assert dev.state.dtype == np.complex64
+        assert dev._state.dtype == np.complex64
+        assert dev.probability().dtype == np.float32
+
+        dev.reset()
+        assert dev.state.dtype == np.complex64
+
+    def test_agrees_with_double_precision(self):
+        """Tests that single-precision simulation agrees with double-precision
+        simulation up to single-precision accuracy."""
+        def circuit(weights, x):
+            qml.templates.StronglyEntanglingLayers(weights, wires=[0, 1, 2])
+            qml.Toffoli(wires=[2, 0, 1])
+            qml.CRZ(x, wires=[1, 2])
+            qml.QubitUnitary(U_toffoli, wires=[1, 0, 2])
+            return qml.expval(qml.PauliZ(0)), qml.var(qml.PauliX(1) @ qml.PauliY(2))
+
+        weights = qml.init.strong_ent_layers_normal(n_layers=3, n_wires=3, seed=42)
+
+        dev = qml.device("default.qubit", wires=3)
+        dev32 = qml.device("default.qubit", wires=3, c_dtype=np.complex64)
+
+        expected = qml.QNode(circuit, dev)(weights, 0.4)
+        res = qml.QNode(circuit, dev32)(weights, 0.4)
+
+        assert dev32.state.dtype == np.complex64
+        assert np.allclose(dev32.state, dev.state, atol=1e-6, rtol=0)
+        assert np.allclose(res, expected, atol=1e-6, rtol=0)
+
+
+class TestMultithreading:
+    """Tests for the multithreaded gate kernels and probabilities."""
+
+    def test_invalid_num_threads(self):
+        """Tests that an exception is raised for a non-positive number of threads."""
+        with pytest.raises(DeviceError, match="number of threads must be a positive integer"):
+            qml.device("default.qubit", wires=2, num_threads=0)
+
+    def test_chunk_wires(self):
+        """Tests that the state is split over the highest-order wires not acted on,
+        and only on devices with sufficiently many wires."""
+        dev = qml.device("default.qubit", wires=5, num_threads=3)
+        assert dev._chunk_wires([0, 2]) == []
+
+        dev._min_threaded_wires = 5
+        assert dev._chunk_wires([0, 2]) == [1, 3]
+        assert dev._chunk_wires([1, 2, 3, 4]) == [0]
+
+        dev.num_threads = 1
+        assert dev._chunk_wires([0, 2]) == []
+
+    @pytest.mark.parametrize("num_threads", [2, 3, 8])
+    def test_agrees_with_single_thread(self, num_threads, tol):
+        """Tests that multithreaded simulation agrees with single-threaded simulation."""
+        ops = [
+            qml.QubitStateVector(np.arange(32) / np.linalg.norm(np.arange(32)), wires=range(5)),
+            qml.Rot(0.1, 0.2, 0.3, wires=[0]),
+            qml.CRX(0.4, wires=[4, 1]),
+            qml.CRZ(0.5, wires=[0, 3]),
+            qml.Toffoli(wires=[2, 0, 1]),
+            qml.QubitUnitary(U_toffoli, wires=[4, 2, 3]),
+            qml.SWAP(wires=[1, 4]),
+        ]
+
+        dev = qml.device("default.qubit", wires=5)
+        dev.apply(ops, rotations=[qml.Hadamard(wires=[2])])
+
+        threaded_dev = qml.device("default.qubit", wires=5, num_threads=num_threads)
+        threaded_dev._min_threaded_wires = 5
+        threaded_dev.apply(ops, rotations=[qml.Hadamard(wires=[2])])
+
+        assert np.allclose(threaded_dev.state, dev.state, atol=tol, rtol=0)
+
+        for wires in [None, [0], [3], [4, 0], [2, 1, 3], [1, 3, 0], [4, 3, 2, 1, 0]]:
+            expected = dev.probability(wires=wires)
+            res = threaded_dev.probability(wires=wires)
+            assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_copies_do_not_share_thread_pool(self):
+        """Tests that copies of the device, e.g. sent to worker processes,
+        create their own thread pool and do not share the checkpoints."""
+        import pickle
+
+        dev = qml.device("default.qubit", wires=5, num_threads=2, checkpoints=2)
+        dev._min_threaded_wires = 5
+        dev.apply([qml.Hadamard(wires=[0]), qml.RX(0.3, wires=[1])])
+        list(dev._map(abs, [-1, 1]))
+        assert dev._executor is not None
+
+        clone = dev.clones(1)[0]
+        assert clone._executor is None
+        assert clone._checkpoints is not dev._checkpoints
+
+        # copies can be pickled
+        res = pickle.loads(pickle.dumps(clone))
+        assert res.num_threads == 2
+
+
+class TestMemmapStorage:
+    """Tests for the memory-mapped state vector storage."""
+
+    def test_invalid_storage(self):
+        """Tests that an exception is raised for an unknown storage option."""
+        with pytest.raises(DeviceError, match="Unknown storage disk"):
+            qml.device("default.qubit", wires=2, storage="disk")
+
+    def test_invalid_chunk_size(self):
+        """Tests that an exception is raised for a non-positive chunk size."""
+        with pytest.raises(DeviceError, match="chunk size must be a positive integer"):
+            qml.device("default.qubit", wires=2, chunk_size=0)
+
+    def test_state_is_memory_mapped(self):
+        """Tests that the state vector and buffer are memory-mapped."""
+        dev = qml.device("default.qubit", wires=3, storage="memmap")
+        assert dev.chunk_size == 2 ** 20
+        assert isinstance(dev.state, np.memmap)
+
+        dev.apply([qml.BasisState(np.array([1, 0, 1]), wires=[0, 1, 2]), qml.RX(0.1, wires=[0])])
+        assert isinstance(dev.state, np.memmap)
+        assert isinstance(dev._buffer, np.memmap)
+
+        dev.reset()
+        assert isinstance(dev.state, np.memmap)
+        assert np.allclose(dev.state, np.eye(8)[0])
+
+    def test_chunk_wires(self):
+        """Tests that the state is split into chunks whose blocks are bounded by the chunk size."""
+        dev = qml.device("default.qubit", wires=6, chunk_size=4)
+
+        # blocks of a single-qubit gate contain 2**5 amplitudes
+        assert dev._chunk_wires([2]) == [0, 1, 3]
+        assert dev._chunk_wires([0, 1, 2, 3]) == []
+        assert dev._chunk_wires([]) == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize("storage", ["memory", "memmap"])
+    @pytest.mark.parametrize("chunk_size", [1, 3, 8])
+    def test_agrees_with_unchunked(self, storage, chunk_size, tol):
+        """Tests that chunked simulation agrees with unchunked in-memory simulation."""
+        ops = [
+            qml.QubitStateVector(np.arange(32) / np.linalg.norm(np.arange(32)), wires=range(5)),
+            qml.Rot(0.1, 0.2, 0.3, wires=[0]),
+            qml.CRX(0.4, wires=[4, 1]),
+            qml.CRZ(0.5, wires=[0, 3]),
+            qml.Toffoli(wires=[2, 0, 1]),
+            qml.QubitUnitary(U_toffoli, wires=[4, 2, 3]),
+            qml.SWAP(wires=[1, 4]),
+        ]
+
+        dev = qml.device("default.qubit", wires=5)
+        dev.apply(ops, rotations=[qml.Hadamard(wires=[2])])
+
+        chunked_dev = qml.device("default.qubit", wires=5, storage=storage, chunk_size=chunk_size)
+        chunked_dev.apply(ops, rotations=[qml.Hadamard(wires=[2])])
+
+        assert np.allclose(chunked_dev.state, dev.state, atol=tol, rtol=0)
+
+        for wires in [None, [0], [3], [4, 0], [2, 1, 3], [1, 3, 0], [4, 3, 2, 1, 0]]:
+            expected = dev.probability(wires=wires)
+            res = chunked_dev.probability(wires=wires)
+            assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_qnode(self, tol):
+        """Tests that QNodes can be evaluated and differentiated on a memory-mapped device."""
+        dev = qml.device("default.qubit", wires=2, storage="memmap", chunk_size=2)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        assert np.allclose(circuit(0.3), np.cos(0.3), atol=tol, rtol=0)
+        assert np.allclose(qml.grad(circuit, argnum=0)(0.3), -np.sin(0.3), atol=tol, rtol=0)
+
+
+class TestProbabilityCache:
+    """Tests for the caching of the computational basis state probabilities."""
+
+    def test_probabilities_computed_once(self):
+        """Tests that the probabilities are computed once per execution, and shared by
+        all statistics."""
+        dev = qml.device("default.qubit", wires=3, analytic=False, shots=10)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            return (
+                qml.expval(qml.PauliZ(0)),
+                qml.var(qml.PauliZ(1)),
+                qml.sample(qml.PauliZ(2)),
+            )
+
+        circuit(0.1)
+        prob = dev._prob
+        assert prob is not None
+
+        dev.probability(wires=[2])
+        dev.probability(wires=[1, 0])
+        dev.generate_samples()
+        assert dev._prob is prob
+
+    def test_cache_invalidation(self, tol):
+        """Tests that the cached probabilities are discarded if the state changes."""
+        dev = qml.device("default.qubit", wires=2)
+
+        dev.apply([qml.RX(0.4, wires=[0])])
+        expected = [np.cos(0.2) ** 2, np.sin(0.2) ** 2]
+        assert np.allclose(dev.probability(wires=[0]), expected, atol=tol, rtol=0)
+
+        dev.apply([qml.PauliX(wires=[1])])
+        assert np.allclose(dev.probability(wires=[1]), [0, 1], atol=tol, rtol=0)
+
+        dev.reset()
+        assert np.allclose(dev.probability(wires=[1]), [1, 0], atol=tol, rtol=0)
+
+        dev._state = np.array([0, 0, 1, 0])
+        assert np.allclose(dev.probability(wires=[0]), [0, 1], atol=tol, rtol=0)
+
+
+class TestPauliExpval:
+    """Tests for the direct evaluation of expectation values of Pauli words."""
+
+    ops = [
+        qml.RX(0.3, wires=[0]),
+        qml.RY(0.7, wires=[1]),
+        qml.CNOT(wires=[0, 2]),
+        qml.Rot(0.2, 0.5, 0.9, wires=[2]),
+        qml.CRY(0.4, wires=[2, 1]),
+    ]
+
+    paulis = {
+        "PauliX": np.array([[0, 1], [1, 0]]),
+        "PauliY": np.array([[0, -1j], [1j, 0]]),
+        "PauliZ": np.array([[1, 0], [0, -1]]),
+        "Identity": np.identity(2),
+    }
+
+    def expected(self, state, names, wires):
+        """Expectation value of a Pauli word computed from its full matrix"""
+        mat = np.ones([1, 1])
+
+        for w in range(3):
+            mat = np.kron(mat, self.paulis[names[wires.index(w)]] if w in wires else np.identity(2))
+
+        return np.vdot(state, mat @ state).real
+
+    @pytest.mark.parametrize("names, wires", [
+        (["PauliX"], [1]),
+        (["PauliY"], [0]),
+        (["PauliZ"], [2]),
+        (["Identity"], [1]),
+        (["PauliX", "PauliY"], [2, 0]),
+        (["PauliY", "PauliY"], [0, 1]),
+        (["PauliZ", "Identity", "PauliX"], [1, 0, 2]),
+        (["PauliY", "PauliZ", "PauliX"], [2, 1, 0]),
+        (["PauliY", "PauliY", "PauliY"], [0, 1, 2]),
+    ])
+    def test_pauli_word(self, names, wires, tol):
+        """Tests that the expectation value and variance of a Pauli word are correct"""
+        dev = qml.device("default.qubit", wires=3)
+        dev.apply(self.ops)
+
+        obs = [getattr(qml, n)(wires=[w]) for n, w in zip(names, wires)]
+        obs = obs[0] if len(obs) == 1 else qml.operation.Tensor(*obs)
+
+        expected = self.expected(dev.state, names, wires)
+        assert np.allclose(dev.expval(obs), expected, atol=tol, rtol=0)
+        assert np.allclose(dev.var(obs), 1 - expected ** 2, atol=tol, rtol=0)
+
+    def test_rotations_not_applied(self, tol):
+        """Tests that the diagonalizing gates are not applied if all observables
+        are Pauli words, and are applied once the rotated state is required"""
+        dev = qml.device("default.qubit", wires=3)
+
+        @qml.qnode(dev)
+        def circuit():
+            for op in self.ops:
+                op.queue()
+            return qml.expval(qml.PauliX(0) @ qml.PauliY(2)), qml.expval(qml.PauliY(1))
+
+        res = circuit()
+        expected = [
+            self.expected(dev.state, ["PauliX", "PauliY"], [0, 2]),
+            self.expected(dev.state, ["PauliY"], [1]),
+        ]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        assert dev._state is dev._pre_rotated_state
+        assert dev._rotations
+
+        # the probabilities are those of the rotated state
+        prob = dev.probability(wires=[1])
+        assert not dev._rotations
+        assert dev._state is not dev._pre_rotated_state
+        assert np.allclose(prob @ np.array([1, -1]), expected[1], atol=tol, rtol=0)
+
+    def test_hamiltonian(self, tol):
+        """Tests that the expectation value of a Hamiltonian is correct"""
+        dev = qml.device("default.qubit", wires=3)
+        dev.apply(self.ops)
+
+        coeffs = [0.5, -0.3, 1.1]
+        obs = [
+            qml.PauliX(0) @ qml.PauliY(2),
+            qml.Hermitian(H, wires=[1]) @ qml.PauliZ(0),
+            qml.Identity(1),
+        ]
+        H_op = qml.vqe.Hamiltonian(coeffs, obs)
+
+        mat = np.kron(np.kron(self.paulis["PauliZ"], H), np.identity(2))
+        expected = (
+            coeffs[0] * self.expected(dev.state, ["PauliX", "PauliY"], [0, 2])
+            + coeffs[1] * np.vdot(dev.state, mat @ dev.state).real
+            + coeffs[2]
+        )
+        assert np.allclose(dev.expval(H_op), expected, atol=tol, rtol=0)
+
+    def test_hamiltonian_sparse_state(self, tol):
+        """Tests that the expectation value of a Hamiltonian is correct for a sparse
+        state, and that the state is not converted to a dense state vector"""
+        dev = qml.device("default.qubit", wires=3, storage="sparse")
+        dev.apply([qml.BasisState(np.array([1, 0, 1]), wires=[0, 1, 2]), qml.CNOT(wires=[0, 1])])
+        sparse_state = dev._sparse_state
+
+        obs = [qml.PauliX(0) @ qml.PauliX(1), qml.PauliZ(1), qml.Hermitian(H, wires=[2])]
+        H_op = qml.vqe.Hamiltonian([0.5, -0.3, 1.1], obs)
+
+        expected = 0.3 + 1.1 * H[1, 1]
+        assert np.allclose(dev.expval(H_op), expected, atol=tol, rtol=0)
+
+        assert dev._sparse_state is sparse_state
+        assert dev._state is None
+
+    def test_hamiltonian_not_analytic(self):
+        """Tests that an exception is raised if the expectation value of a Hamiltonian
+        is requested on a device that is not in analytic mode"""
+        dev = qml.device("default.qubit", wires=1, analytic=False)
+        H_op = qml.vqe.Hamiltonian([1.0], [qml.PauliZ(0)])
+
+        with pytest.raises(DeviceError, match="only be computed .* in analytic mode"):
+            dev.expval(H_op)
+
+    def test_hamiltonian_qnode(self, monkeypatch, tol):
+        """Tests that a QNode returning the expectation value of a Hamiltonian executes
+        the circuit once, and agrees with the expectation values of the terms"""
+        dev = qml.device("default.qubit", wires=3)
+        coeffs = [0.5, -0.3, 1.1]
+        obs = [
+            qml.PauliX(0) @ qml.PauliY(2),
+            qml.PauliZ(0) @ qml.Hermitian(H, wires=[1]),
+            qml.PauliZ(1),
+        ]
+        H_op = qml.vqe.Hamiltonian(coeffs, obs)
+
+        def ansatz(x, y):
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            qml.CNOT(wires=[0, 1])
+            qml.CNOT(wires=[1, 2])
+
+        def circuit(x, y, _obs=H_op):
+            ansatz(x, y)
+            return qml.expval(_obs)
+
+        node = qml.QNode(circuit, dev)
+        measured = []
+        expval = dev.expval
+
+        def recording_expval(observable):
+            measured.append(observable)
+            return expval(observable)
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "expval", recording_expval)
+            res = node(0.4, -0.7)
+
+        # the single measured observable is the Hamiltonian
+        assert measured == [H_op]
+
+        expected = sum(c * qml.QNode(circuit, dev)(0.4, -0.7, _obs=o) for c, o in zip(coeffs, obs))
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        grad = qml.grad(node, argnum=[0, 1])(0.4, -0.7)
+        grad_fd = node.jacobian([0.4, -0.7], method="F")
+        assert np.allclose(grad, grad_fd[0], atol=1e-6, rtol=0)
+
+    def test_hamiltonian_constructed_in_circuit(self, tol):
+        """Tests that a Hamiltonian constructed inside the quantum function can be measured"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            obs = [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliZ(1)]
+            return qml.expval(qml.vqe.Hamiltonian([0.5, 2.0], obs))
+
+        assert np.allclose(circuit(0.3), 0.5 + 2 * np.cos(0.3), atol=tol, rtol=0)
+
+    def test_hamiltonian_qnode_not_analytic(self):
+        """Tests that an exception is raised if a QNode returns the expectation value of
+        a Hamiltonian on a device that is not in analytic mode, also if the samples
+        would be streamed"""
+        H_op = qml.vqe.Hamiltonian([1.0], [qml.PauliZ(0)])
+
+        for shot_chunk_size in [None, 10]:
+            dev = qml.device(
+                "default.qubit", wires=1, analytic=False, shots=100, shot_chunk_size=shot_chunk_size
+            )
+            node = qml.QNode(lambda: qml.expval(H_op), dev)
+
+            with pytest.raises(DeviceError, match="only be computed .* in analytic mode"):
+                node()
+
+
 class TestExpval:
     """Tests that expectation values are properly calculated or that the proper errors are raised."""
 
@@ -619,6 +1157,69 @@ class TestSample:
         s3 = qubit_device_2_wires.sample(qml.PauliX(0) @ qml.PauliZ(1))
         assert np.array_equal(s3.shape, (17,))
 
+    def test_sample_measured_wires_only(self, tol):
+        """Tests that only the measured wires are sampled when executing a circuit,
+        and that the samples are correlated"""
+        dev = qml.device("default.qubit", wires=4, shots=1000)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=[3])
+            qml.CNOT(wires=[3, 1])
+            qml.PauliX(wires=[0])
+            return qml.sample(qml.PauliZ(1)), qml.sample(qml.PauliZ(3))
+
+        res = circuit()
+
+        assert dev._wires_measured == {1, 3}
+        assert np.all(dev._samples[:, [0, 2]] == 0)
+        assert np.array_equal(res[0], res[1])
+        assert set(res[0]) == {-1, 1}
+
+    def test_measured_wires_not_reused(self):
+        """Tests that the measured wires of a circuit are not used to generate the
+        samples of the next circuit executed on the same device"""
+        dev = qml.device("default.qubit", wires=2, shots=1000)
+
+        @qml.qnode(dev)
+        def circuit1():
+            qml.PauliX(wires=[1])
+            return qml.sample(qml.PauliZ(0))
+
+        @qml.qnode(dev)
+        def circuit2():
+            qml.PauliX(wires=[1])
+            return qml.expval(qml.PauliZ(1))
+
+        circuit1()
+        assert dev._wires_measured == {0}
+
+        assert circuit2() == -1
+        assert dev._wires_measured is None
+
+        # samples generated after the second execution include all wires
+        dev._samples = dev.generate_samples()
+        assert np.all(dev._samples[:, 1] == 1)
+
+        dev.reset()
+        assert dev._wires_measured is None
+
+    def test_sample_seed_reproducible(self):
+        """Tests that devices created with the same seed return the same samples"""
+
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.RY(0.3, wires=1)
+            return qml.sample(qml.PauliZ(0)), qml.sample(qml.PauliZ(1))
+
+        dev1 = qml.device("default.qubit", wires=2, shots=100, analytic=False, seed=42)
+        dev2 = qml.device("default.qubit", wires=2, shots=100, analytic=False, seed=42)
+
+        res1 = qml.QNode(circuit, dev1)()
+        res2 = qml.QNode(circuit, dev2)()
+
+        assert np.array_equal(res1, res2)
+
     def test_sample_values(self, qubit_device_2_wires, tol):
         """Tests if the samples returned by sample have
         the correct values
@@ -1594,3 +2195,436 @@ class TestTensorSample:
             )
         ) / 16
         assert np.allclose(var, expected, atol=tol, rtol=0)
+
+
+class TestBatchExecute:
+    """Tests for the batched execution of circuits"""
+
+    @staticmethod
+    def circuit(weights, x):
+        """Circuit containing dense, diagonal and permutation gates that depend on the
+        positional arguments"""
+        qml.BasisState(np.array([1, 0, 0, 1]), wires=[0, 1, 2, 3])
+        qml.templates.StronglyEntanglingLayers(weights, wires=[0, 1, 2, 3])
+        qml.RZ(x, wires=[1])
+        qml.CRZ(2 * x, wires=[2, 0])
+        qml.PauliX(wires=[1]).inv()
+        qml.CSWAP(wires=[0, 1, 2])
+        qml.CRot(x, 0.1, -x, wires=[1, 3])
+        return (
+            qml.var(qml.PauliX(1) @ qml.PauliY(2)),
+            qml.expval(qml.Hermitian(np.diag([1, 2, 3, 4]), wires=[3, 0])),
+        )
+
+    @staticmethod
+    def batch(n):
+        """Random parameters for ``circuit``"""
+        np.random.seed(42)
+        return [(qml.init.strong_ent_layers_normal(2, 4), np.random.random()) for _ in range(n)]
+
+    def test_agrees_with_execute(self, tol):
+        """Test that batched execution agrees with executing the rows one by one"""
+        dev = qml.device("default.qubit", wires=4)
+        qnode = qml.QNode(self.circuit, dev)
+
+        batch = self.batch(5)
+        expected = np.array([qnode(*args) for args in batch])
+
+        parameters = np.array([np.hstack([w.flatten(), x]) for w, x in batch])
+        res = dev.batch_execute(qnode.circuit, parameters)
+
+        assert res.shape == (5, 2)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_probabilities(self, tol):
+        """Test that batched execution of a circuit returning probabilities agrees
+        with executing the rows one by one"""
+        dev = qml.device("default.qubit", wires=3)
+
+        def circuit(x):
+            qml.RX(x[0], wires=[0])
+            qml.CNOT(wires=[0, 2])
+            qml.RY(x[1], wires=[1])
+            return qml.probs(wires=[2, 1])
+
+        qnode = qml.QNode(circuit, dev)
+        parameters = np.random.random((4, 2))
+        expected = np.array([qnode(x) for x in parameters])
+
+        res = dev.batch_execute(qnode.circuit, parameters)
+
+        assert res.shape == (4, 1, 4)
+        assert np.allclose(res[:, 0], expected, atol=tol, rtol=0)
+
+    def test_variables_are_restored(self):
+        """Test that the positional argument values are restored after batched execution"""
+        dev = qml.device("default.qubit", wires=4)
+        qnode = qml.QNode(self.circuit, dev)
+
+        weights, x = self.batch(1)[0]
+        qnode(weights, x)
+        values = qml.variable.Variable.positional_arg_values
+
+        dev.batch_execute(qnode.circuit, np.random.random((2, len(values))))
+        assert qml.variable.Variable.positional_arg_values is values
+
+    def test_vectorized(self, monkeypatch):
+        """Test that batched execution of supported circuits does not execute
+        the rows one by one"""
+        dev = qml.device("default.qubit", wires=4)
+        qnode = qml.QNode(self.circuit, dev)
+
+        weights, x = self.batch(1)[0]
+        qnode(weights, x)
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "execute", lambda *args, **kwargs: pytest.fail())
+            dev.batch_execute(qnode.circuit, np.random.random((2, weights.size + 1)))
+
+    @pytest.mark.parametrize("analytic", [True, False])
+    def test_fallback(self, analytic, monkeypatch):
+        """Test that unsupported circuits are executed row by row"""
+        dev = qml.device("default.qubit", wires=2, analytic=analytic)
+
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            return qml.expval(qml.PauliZ(0)), qml.sample(qml.PauliZ(1))
+
+        qnode = qml.QNode(circuit, dev)
+        qnode(0.1)
+
+        calls = []
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "execute", lambda circuit: calls.append(circuit))
+            dev.batch_execute(qnode.circuit, np.random.random((3, 1)))
+
+        assert len(calls) == 3
+
+
+class TestCheckpoints:
+    """Tests for the state vector checkpoints of default.qubit"""
+
+    @staticmethod
+    def circuit(x, y, z):
+        """Test circuit with three parametrized layers"""
+        qml.RX(x, wires=[0])
+        qml.CNOT(wires=[0, 1])
+        qml.RY(y, wires=[1])
+        qml.CNOT(wires=[1, 2])
+        qml.RZ(z, wires=[2])
+        qml.Hadamard(wires=[2])
+        return qml.expval(qml.PauliZ(0) @ qml.PauliZ(2))
+
+    def test_requires_memory_storage(self):
+        """Test that an exception is raised if checkpoints are requested with memmap storage"""
+        with pytest.raises(DeviceError, match="checkpoints require storage='memory'"):
+            qml.device("default.qubit", wires=1, storage="memmap", checkpoints=2)
+
+    def test_resume_from_checkpoint(self, monkeypatch, tol):
+        """Test that unchanged operations are only replayed until a checkpoint is stored"""
+        dev = qml.device("default.qubit", wires=3, checkpoints=2)
+        qnode = qml.QNode(self.circuit, dev)
+
+        applied = []
+        apply_operation = dev._apply_operation
+
+        def recording_apply_operation(operation):
+            applied.append(operation.name)
+            apply_operation(operation)
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "_apply_operation", recording_apply_operation)
+
+            qnode(0.1, 0.2, 0.3)
+            assert len(applied) == 6
+
+            # the first four operations are unchanged, and are checkpointed
+            applied.clear()
+            qnode(0.1, 0.2, 0.4)
+            assert len(applied) == 6
+            assert len(dev._checkpoints) == 1
+
+            # the execution resumes after the checkpointed operations
+            applied.clear()
+            res = qnode(0.1, 0.2, 0.5)
+            assert applied == ["RZ", "Hadamard"]
+
+        dev_ref = qml.device("default.qubit", wires=3)
+        expected = qml.QNode(self.circuit, dev_ref)(0.1, 0.2, 0.5)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_changed_prefix_is_not_restored(self, tol):
+        """Test that a checkpoint is not used if the parameters of its prefix changed"""
+        dev = qml.device("default.qubit", wires=3, checkpoints=2)
+        qnode = qml.QNode(self.circuit, dev)
+
+        qnode(0.1, 0.2, 0.3)
+        qnode(0.1, 0.2, 0.4)
+        res = qnode(0.6, 0.2, 0.4)
+
+        dev_ref = qml.device("default.qubit", wires=3)
+        expected = qml.QNode(self.circuit, dev_ref)(0.6, 0.2, 0.4)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_number_of_checkpoints_bounded(self):
+        """Test that at most the given number of checkpoints is stored"""
+        dev = qml.device("default.qubit", wires=3, checkpoints=1)
+        qnode = qml.QNode(self.circuit, dev)
+
+        qnode(0.1, 0.2, 0.3)
+        qnode(0.1, 0.2, 0.4)
+        qnode(0.1, 0.5, 0.4)
+        qnode(0.1, 0.5, 0.6)
+
+        assert len(dev._checkpoints) == 1
+
+    def test_jacobian(self, tol):
+        """Test that the parameter-shift Jacobian agrees with a device without checkpoints"""
+        dev = qml.device("default.qubit", wires=3, checkpoints=3)
+        qnode = qml.QNode(self.circuit, dev)
+
+        dev_ref = qml.device("default.qubit", wires=3)
+        qnode_ref = qml.QNode(self.circuit, dev_ref)
+
+        args = (0.1, 0.2, 0.3)
+        res = qnode.jacobian(args, method="A")
+        expected = qnode_ref.jacobian(args, method="A")
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+
+class TestSparseState:
+    """Tests for the sparse state storage of default.qubit"""
+
+    @staticmethod
+    def circuit(x):
+        """Test circuit mixing basis state preparation, permutation, diagonal and general gates"""
+        qml.BasisState(np.array([1, 0, 1]), wires=[0, 1, 2])
+        qml.CNOT(wires=[0, 1])
+        qml.Toffoli(wires=[2, 1, 0])
+        qml.RX(x, wires=[2])
+        qml.CRY(2 * x, wires=[2, 0])
+        qml.T(wires=[0])
+        qml.SWAP(wires=[0, 2])
+        return qml.expval(qml.PauliX(0)), qml.var(qml.PauliY(2)), qml.probs(wires=[1])
+
+    @pytest.mark.parametrize("sparse_threshold", [1.0, 0.3, 0.0])
+    def test_agrees_with_dense(self, sparse_threshold, tol):
+        """Test that the results agree with a dense state vector, whether or not
+        the state is converted to a dense state vector during the simulation"""
+        dev = qml.device("default.qubit", wires=3, storage="sparse", sparse_threshold=sparse_threshold)
+        dev._min_dense_amplitudes = 0
+        dev_ref = qml.device("default.qubit", wires=3)
+
+        res = qml.QNode(self.circuit, dev)(0.4)
+        expected = qml.QNode(self.circuit, dev_ref)(0.4)
+
+        assert np.allclose(np.hstack(res), np.hstack(expected), atol=tol, rtol=0)
+        assert np.allclose(dev.state, dev_ref.state, atol=tol, rtol=0)
+
+    def test_permutations_stay_sparse(self):
+        """Test that a state prepared by permutation gates keeps a single amplitude"""
+        dev = qml.device("default.qubit", wires=4, storage="sparse")
+
+        dev.apply(
+            [
+                qml.BasisState(np.array([1, 1, 0, 0]), wires=[0, 1, 2, 3]),
+                qml.CNOT(wires=[1, 3]),
+                qml.SWAP(wires=[0, 2]),
+                qml.PauliX(wires=[1]),
+            ]
+        )
+
+        indices, amplitudes = dev._sparse_state
+        assert np.array_equal(indices, [int("0011", 2)])
+        assert np.allclose(amplitudes, [1])
+        assert dev._state is None
+
+    def test_densify(self):
+        """Test that the state is converted to a dense state vector once the
+        fraction of non-zero amplitudes exceeds the threshold"""
+        dev = qml.device("default.qubit", wires=3, storage="sparse", sparse_threshold=0.5)
+        dev._min_dense_amplitudes = 0
+
+        dev.apply([qml.Hadamard(wires=[0]), qml.Hadamard(wires=[1])])
+        assert dev._sparse_state is not None
+
+        dev.apply([qml.Hadamard(wires=[2])])
+        assert dev._sparse_state is None
+        assert np.allclose(dev.state, np.ones(8) / np.sqrt(8))
+
+        dev.reset()
+        assert dev._sparse_state is not None
+        assert dev._state is None
+
+    def test_small_states_stay_sparse(self):
+        """Test that states with few non-zero amplitudes are kept sparse with the
+        default threshold, even if they fill most of a small state vector"""
+        dev = qml.device("default.qubit", wires=4, storage="sparse")
+        dev.apply([qml.Hadamard(wires=[w]) for w in range(4)])
+
+        indices, amplitudes = dev._sparse_state
+        assert len(indices) == 16
+        assert np.allclose(amplitudes, 0.25)
+        assert dev._state is None
+
+    def test_cancelled_amplitudes_are_dropped(self):
+        """Test that amplitudes which cancel are removed from the sparse state"""
+        dev = qml.device("default.qubit", wires=2, storage="sparse")
+
+        dev.apply([qml.Hadamard(wires=[1]), qml.Hadamard(wires=[1])])
+
+        indices, _ = dev._sparse_state
+        assert np.array_equal(indices, [0])
+
+    def test_many_wires(self, tol):
+        """Test that basis-dominated circuits on many wires are simulated without
+        allocating a dense state vector"""
+        num_wires = 40
+        dev = qml.device("default.qubit", wires=num_wires, storage="sparse")
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.BasisState(np.array([1] * 20 + [0] * 20), wires=list(range(num_wires)))
+            qml.RY(x, wires=[0])
+
+            for i in range(num_wires - 1):
+                qml.CNOT(wires=[i, i + 1])
+
+            return qml.expval(qml.PauliZ(num_wires - 1)), qml.probs(wires=[0, 20])
+
+        res = circuit(0.3)
+
+        assert len(dev._sparse_state[0]) == 2
+        assert np.allclose(res[0], np.cos(0.3), atol=tol, rtol=0)
+        assert np.allclose(res[1][[1, 2]], [np.sin(0.15) ** 2, np.cos(0.15) ** 2], atol=tol, rtol=0)
+
+
+ADJOINT_A = np.array([[1.2, 0.3 - 0.1j], [0.3 + 0.1j, -0.4]])
+
+
+def adjoint_circuit(x):
+    """Test circuit for the adjoint method containing state preparation, inverse operations,
+    scaled parameters, and operations without a generator"""
+    qml.QubitStateVector(np.array([1, 0, 0, 0, 0, 0, 1, 0]) / np.sqrt(2), wires=[0, 1, 2])
+    qml.RX(x[0], wires=0)
+    qml.Rot(x[1], x[2], x[3], wires=1)
+    qml.CRX(-x[4], wires=[0, 2])
+    qml.PhaseShift(x[0], wires=1).inv()
+    qml.CNOT(wires=[1, 0])
+    qml.CRot(x[5], 2 * x[1], x[2], wires=[1, 2])
+    qml.RY(x[4], wires=0).inv()
+    return (
+        qml.expval(qml.PauliX(0) @ qml.PauliY(1)),
+        qml.expval(qml.Hermitian(ADJOINT_A, wires=2)),
+    )
+
+
+class TestAdjointJacobian:
+    """Tests for the adjoint differentiation method of default.qubit"""
+
+    def test_agrees_with_finite_differences(self, tol):
+        """Test that the adjoint Jacobian agrees with finite differences; the two-term
+        parameter-shift rule is not exact for the controlled rotations in the circuit"""
+        dev = qml.device("default.qubit", wires=3)
+        x = np.array([0.1, -0.4, 0.7, 1.3, 0.5, -1.1])
+
+        adjoint = qml.QNode(adjoint_circuit, dev, diff_method="adjoint")
+        numeric = qml.QNode(adjoint_circuit, dev, diff_method="finite-diff")
+
+        assert np.allclose(adjoint(x), numeric(x), atol=tol, rtol=0)
+
+        res = adjoint.jacobian([x])
+        expected = numeric.jacobian([x], method="F", options={"order": 2, "h": 1e-6})
+        assert res.shape == (2, 6)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_agrees_with_parameter_shift(self, tol):
+        """Test that the adjoint Jacobian agrees with the parameter-shift rule
+        for a circuit without controlled rotations"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x):
+            qml.RX(x[0], wires=0)
+            qml.Rot(x[1], x[2], x[0], wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.PhaseShift(x[2], wires=0).inv()
+            qml.RY(2 * x[1], wires=1)
+            return qml.expval(qml.PauliY(0)), qml.expval(qml.Hermitian(ADJOINT_A, wires=1))
+
+        x = np.array([0.3, -0.8, 1.1])
+        adjoint = qml.QNode(circuit, dev, diff_method="adjoint")
+        shift = qml.QNode(circuit, dev, diff_method="parameter-shift")
+
+        res = adjoint.jacobian([x])
+        expected = shift.jacobian([x])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_wrt(self, tol):
+        """Test that the Jacobian is returned for the requested parameters only"""
+        dev = qml.device("default.qubit", wires=3)
+        x = np.array([0.1, -0.4, 0.7, 1.3, 0.5, -1.1])
+
+        adjoint = qml.QNode(adjoint_circuit, dev, diff_method="adjoint")
+        full = adjoint.jacobian([x])
+        res = adjoint.jacobian([x], wrt=[4, 1])
+
+        assert res.shape == (2, 2)
+        assert np.allclose(res, full[:, [4, 1]], atol=tol, rtol=0)
+
+    def test_single_execution(self, monkeypatch, tol):
+        """Test that the Jacobian is computed using a single forward simulation"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, diff_method="adjoint")
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        circuit(0.3, 0.2)
+        calls = []
+        apply = dev.apply
+
+        def spy(*args, **kwargs):
+            calls.append(args)
+            return apply(*args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "apply", spy)
+            grad = qml.grad(circuit, argnum=[0, 1])(0.3, 0.2)
+
+        # one forward execution, and one forward simulation for the Jacobian
+        assert len(calls) == 2
+        expected = [-np.sin(0.3) * np.cos(0.2), -np.cos(0.3) * np.sin(0.2)]
+        assert np.allclose(grad, expected, atol=tol, rtol=0)
+
+    def test_variance_not_supported(self):
+        """Test that an error is raised if a variance is differentiated"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, diff_method="adjoint")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.var(qml.PauliZ(0))
+
+        with pytest.raises(DeviceError, match="only supports expectation values"):
+            circuit.jacobian([0.3])
+
+    def test_no_generator_or_decomposition(self, monkeypatch):
+        """Test that an error is raised if a differentiable operation has
+        neither a generator nor a decomposition"""
+        dev = qml.device("default.qubit", wires=1)
+
+        @qml.qnode(dev, diff_method="adjoint")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        with monkeypatch.context() as m:
+            m.setattr(qml.RX, "generator", [None, 1])
+
+            with pytest.raises(DeviceError, match="cannot be differentiated using the adjoint"):
+                circuit.jacobian([0.3])
@@ -0,0 +1,148 @@
+# Copyright 2018-2020 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.plugin.DefaultQubitAutograd` device.
+"""
+# pylint: disable=protected-access
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.qnodes import PassthruQNode
+
+
+A = np.array([[1.2, 0.3 - 0.1j], [0.3 + 0.1j, -0.4]])
+
+
+def circuit(x):
+    """Test circuit containing all parametrized operations and inverses"""
+    qml.RX(x[0], wires=0)
+    qml.RY(x[1], wires=1)
+    qml.Rot(x[2], x[0], x[1], wires=1)
+    qml.CRX(x[2], wires=[0, 1])
+    qml.CNOT(wires=[1, 0])
+    qml.CRot(x[1], x[2], x[0], wires=[1, 0])
+    qml.PhaseShift(x[0], wires=1).inv()
+    qml.RZ(x[1], wires=0)
+    qml.CRY(x[2], wires=[1, 0]).inv()
+    qml.CRZ(x[0], wires=[0, 1])
+    return qml.expval(qml.PauliZ(0)), qml.var(qml.Hermitian(A, wires=1))
+
+
+class TestDefaultQubitAutograd:
+    """Tests for the default.qubit.autograd device"""
+
+    def test_load_device(self):
+        """Test that the device loads through its entry point"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        assert dev.short_name == "default.qubit.autograd"
+        assert dev.capabilities()["passthru_interface"] == "autograd"
+
+    def test_create_passthru_qnode(self):
+        """Test that the backprop differentiation method creates a PassthruQNode"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        node = qml.QNode(circuit, dev, diff_method="backprop")
+        assert isinstance(node, PassthruQNode)
+
+    @pytest.mark.parametrize("interface", ["torch", "tf"])
+    def test_unsupported_interface(self, interface):
+        """Test that an error is raised if backpropagation is requested
+        using a different interface"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+
+        with pytest.raises(ValueError, match="does not support backpropagation"):
+            qml.QNode(circuit, dev, interface=interface, diff_method="backprop")
+
+    def test_unsupported_device(self):
+        """Test that an error is raised if backpropagation is requested
+        for a device that is not written in autograd"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with pytest.raises(ValueError, match="does not support backpropagation"):
+            qml.QNode(circuit, dev, diff_method="backprop")
+
+    def test_evaluate(self, tol):
+        """Test that the results agree with default.qubit"""
+        x = np.array([0.3, -0.7, 1.2])
+        dev = qml.device("default.qubit.autograd", wires=2)
+        node = qml.QNode(circuit, dev, diff_method="backprop")
+        expected = qml.QNode(circuit, qml.device("default.qubit", wires=2))(x)
+
+        assert np.allclose(node(x), expected, atol=tol, rtol=0)
+
+    def test_output_shapes(self):
+        """Test that the outputs have the same shapes as on default.qubit"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+
+        def single(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        def probs(x):
+            qml.RX(x, wires=1)
+            return qml.probs(wires=[1])
+
+        for func in (single, probs, circuit):
+            node = qml.QNode(func, dev, diff_method="backprop")
+            expected = qml.QNode(func, qml.device("default.qubit", wires=2))
+            x = np.array([0.3, -0.7, 1.2]) if func is circuit else 0.3
+            assert np.shape(node(x)) == np.shape(expected(x))
+
+    def test_jacobian(self, tol):
+        """Test that the Jacobian computed by backpropagation agrees with
+        finite differences"""
+        x = np.array([0.3, -0.7, 1.2])
+        dev = qml.device("default.qubit.autograd", wires=2)
+        node = qml.QNode(circuit, dev, diff_method="backprop")
+        numeric = qml.QNode(circuit, qml.device("default.qubit", wires=2))
+
+        res = qml.jacobian(node, argnum=0)(x)
+
+        # the two-term parameter-shift rule is not exact for the controlled rotations
+        expected = numeric.jacobian([x], method="F")
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_gradient_of_cost(self, tol):
+        """Test that a classical cost function of the QNode output is differentiable"""
+        dev = qml.device("default.qubit.autograd", wires=2)
+
+        @qml.qnode(dev, diff_method="backprop")
+        def node(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.probs(wires=[1])
+
+        def cost(x, y):
+            return node(x, y)[0] ** 2
+
+        x, y = 0.4, -0.3
+        res = qml.grad(cost, argnum=[0, 1])(x, y)
+
+        # probability of measuring the second wire in the zero state
+        p0 = (1 + np.cos(x) * np.cos(y)) / 2
+        expected = [-p0 * np.sin(x) * np.cos(y), -p0 * np.cos(x) * np.sin(y)]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_sampling(self):
+        """Test that samples are returned in non-analytic mode"""
+        dev = qml.device("default.qubit.autograd", wires=1, shots=10, analytic=False, seed=42)
+
+        @qml.qnode(dev, diff_method="backprop")
+        def node(x):
+            qml.RX(x, wires=0)
+            return qml.sample(qml.PauliZ(0))
+
+        res = node(np.pi)
+        assert np.all(res == -1)
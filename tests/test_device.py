@@ -16,6 +16,7 @@ Unit tests for the :mod:`pennylane` :class:`Device` class.
 """
 
 import pytest
+import numpy as np
 import pennylane as qml
 from pennylane import Device, DeviceError
 from pennylane.qnodes import QuantumFunctionError
@@ -82,6 +83,7 @@ def mock_device_supporting_observables_and_inverse(monkeypatch):
         yield Device()
 
 mock_device_capabilities = {
+    "model": "qubit",
     "measurements": "everything",
     "noise_models": ["depolarizing", "bitflip"],
 }
@@ -377,6 +379,38 @@ class TestOperations:
         with pytest.raises(qml.DeviceError, match="The specified number of shots needs to be at least 1"):
             mock_device.shots = shots
 
+    def test_shot_vector_setter(self, mock_device):
+        """Tests that a sequence of shot numbers sets the shot vector, and the number
+        of shots to the largest number of shots."""
+
+        assert mock_device.shot_vector is None
+
+        mock_device.shots = [100, 10, 1000]
+
+        assert mock_device.shot_vector == (100, 10, 1000)
+        assert mock_device.shots == 1000
+
+        mock_device.shots = 10
+
+        assert mock_device.shot_vector is None
+        assert mock_device.shots == 10
+
+    @pytest.mark.parametrize("shots", [[10, 0], []])
+    def test_shot_vector_setter_error(self, mock_device, shots):
+        """Tests that the property setter of shots raises an error if the shot vector
+        is empty, or contains an erroneous number of shots."""
+
+        with pytest.raises(qml.DeviceError, match="The specified (number of shots|shot vector)"):
+            mock_device.shots = shots
+
+    def test_shot_vector_not_supported(self, mock_device_with_paulis_and_methods):
+        """Tests that devices not implementing shot vectors raise an error when executing
+        with a shot vector."""
+        mock_device_with_paulis_and_methods.shots = [10, 100]
+
+        with pytest.raises(qml.DeviceError, match="does not support shot vectors"):
+            mock_device_with_paulis_and_methods.execute([qml.PauliX(0)], [])
+
     def test_op_queue_accessed_outside_execution_context(self, mock_device):
         """Tests that a call to op_queue outside the execution context raises the correct error"""
 
@@ -597,3 +631,109 @@ class TestDeviceInit:
             m.setattr(qml, "version", lambda: "0.0.1")
             with pytest.raises(DeviceError, match="plugin requires PennyLane versions"):
                 qml.device("default.qubit", wires=0)
+
+
+class TestRandomNumberGenerator:
+    """Tests for the random number generator owned by a device"""
+
+    def test_global_rng_by_default(self, mock_device):
+        """Test that the global NumPy random state is used if no seed is provided"""
+        assert mock_device.rng is np.random
+
+    def test_seeded_rng_reproducible(self, monkeypatch):
+        """Test that devices created with the same seed produce the same random numbers"""
+        with monkeypatch.context() as m:
+            m.setattr(Device, "__abstractmethods__", frozenset())
+            dev1 = Device(seed=42)
+            dev2 = Device(seed=42)
+
+        assert isinstance(dev1.rng, np.random.Generator)
+        assert np.allclose(dev1.rng.random(10), dev2.rng.random(10))
+
+    def test_generator_is_used(self, monkeypatch):
+        """Test that a provided generator is used directly by the device"""
+        rng = np.random.default_rng(1)
+
+        with monkeypatch.context() as m:
+            m.setattr(Device, "__abstractmethods__", frozenset())
+            dev = Device(seed=rng)
+
+        assert dev.rng is rng
+
+    def test_invalid_seed(self, monkeypatch):
+        """Test that an exception is raised for an unknown string seed"""
+        with monkeypatch.context() as m:
+            m.setattr(Device, "__abstractmethods__", frozenset())
+            with pytest.raises(DeviceError, match="Unknown seed"):
+                Device(seed="local")
+
+    def test_spawn_rngs(self, monkeypatch):
+        """Test that spawned generators are independent and reproducible"""
+        with monkeypatch.context() as m:
+            m.setattr(Device, "__abstractmethods__", frozenset())
+            dev1 = Device(seed=42)
+            dev2 = Device(seed=42)
+
+        rngs1 = dev1.spawn_rngs(3)
+        rngs2 = dev2.spawn_rngs(3)
+
+        samples1 = [r.random(5) for r in rngs1]
+        samples2 = [r.random(5) for r in rngs2]
+
+        assert len(rngs1) == 3
+        assert np.allclose(samples1, samples2)
+        assert not np.allclose(samples1[0], samples1[1])
+
+    def test_spawn_rngs_global(self, mock_device):
+        """Test that generators can be spawned from a device using the global random state"""
+        rngs = mock_device.spawn_rngs(2)
+        assert all(isinstance(r, np.random.Generator) for r in rngs)
+
+    def test_clones(self):
+        """Test that copies of a device can be created for parallel evaluations,
+        each owning an independent and reproducible random number generator"""
+        dev1 = qml.device("default.qubit", wires=1, shots=10, analytic=False, seed=42)
+        dev2 = qml.device("default.qubit", wires=1, shots=10, analytic=False, seed=42)
+
+        clones1 = dev1.clones(2)
+        clones2 = dev2.clones(2)
+
+        assert len(clones1) == 2
+        assert all(type(c) is type(dev1) and c is not dev1 for c in clones1)
+        assert all(c.shots == 10 and not c.analytic for c in clones1)
+
+        samples1 = [c.rng.random(5) for c in clones1]
+        samples2 = [c.rng.random(5) for c in clones2]
+
+        assert np.allclose(samples1, samples2)
+        assert not np.allclose(samples1[0], samples1[1])
+
+
+class TestBatchExecute:
+    """Tests for the default implementation of batch_execute"""
+
+    def test_rows_are_executed(self, mock_device, monkeypatch, tol):
+        """Test that the default implementation executes the circuit once per row,
+        using the row as the positional argument values"""
+        from pennylane.variable import Variable
+
+        def apply(self, name, wires, params):
+            self._applied = params[0]
+
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        with monkeypatch.context() as m:
+            m.setattr(Device, "apply", apply)
+            m.setattr(Device, "expval", lambda self, name, wires, params: self._applied)
+
+            qnode = qml.qnodes.BaseQNode(circuit, mock_device)
+            qnode(0.1)
+            values = Variable.positional_arg_values
+
+            parameters = np.array([[0.3], [0.5], [0.7]])
+            res = mock_device.batch_execute(qnode.circuit, parameters)
+
+        assert np.allclose(res, parameters, atol=tol, rtol=0)
+        assert Variable.positional_arg_values is values
@@ -17,7 +17,7 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.qnodes import QuantumFunctionError
-from pennylane.operation import Sample, Variance, Expectation
+from pennylane.operation import Sample, Variance, Expectation, Counts
 
 
 def test_no_measure(tol):
@@ -77,6 +77,23 @@ class TestExpval:
 
         circuit()
 
+    def test_hamiltonian_return_type(self):
+        """Test that the expectation value of a Hamiltonian is a single measurement
+        whose terms are not queued as operations"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=1)
+            H = qml.vqe.Hamiltonian([1.0, 0.5], [qml.PauliZ(0) @ qml.PauliX(1), qml.PauliZ(0)])
+            res = qml.expval(H)
+            assert res.return_type is Expectation
+            return res
+
+        assert np.allclose(circuit(), 1.5)
+        assert circuit.ops[-1].name == "Hamiltonian"
+        assert [op.name for op in circuit.ops[:-1]] == ["Hadamard"]
+
 
 class TestVar:
     """Tests for the var function"""
@@ -121,6 +138,19 @@ class TestVar:
 
         circuit()
 
+    def test_hamiltonian(self):
+        """Test that a QuantumFunctionError is raised if the variance of a Hamiltonian
+        is requested"""
+        dev = qml.device("default.qubit", wires=2)
+        H = qml.vqe.Hamiltonian([1.0, 0.5], [qml.PauliZ(0), qml.PauliX(1)])
+
+        @qml.qnode(dev)
+        def circuit():
+            return qml.var(H)
+
+        with pytest.raises(QuantumFunctionError, match="only be measured using expval, not var"):
+            circuit()
+
 
 class TestSample:
     """Tests for the sample function"""
@@ -229,6 +259,18 @@ class TestSample:
         with pytest.raises(QuantumFunctionError, match="CNOT is not an observable"):
             sample = circuit()
 
+    def test_hamiltonian(self):
+        """Test that a QuantumFunctionError is raised if a Hamiltonian is sampled"""
+        dev = qml.device("default.qubit", wires=2, shots=10)
+        H = qml.vqe.Hamiltonian([1.0, 0.5], [qml.PauliZ(0), qml.PauliX(1)])
+
+        @qml.qnode(dev)
+        def circuit():
+            return qml.sample(H)
+
+        with pytest.raises(QuantumFunctionError, match="only be measured using expval, not sample"):
+            circuit()
+
     def test_observable_return_type_is_sample(self):
         """Test that the return type of the observable is :attr:`ObservableReturnTypes.Sample`"""
         n_shots = 10
@@ -241,3 +283,81 @@ class TestSample:
             return res
 
         circuit()
+
+
+class TestCounts:
+    """Tests for the counts function"""
+
+    def test_counts_dimension(self):
+        """Test that the counts have the right shape and sum to the number of shots"""
+        n_shots = 100
+        dev = qml.device("default.qubit", wires=3, shots=n_shots)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.Hadamard(wires=2)
+            return qml.counts(wires=[0, 2])
+
+        res = circuit()
+
+        assert res.shape == (4,)
+        assert np.sum(res) == n_shots
+
+    def test_counts_values(self):
+        """Test that only the prepared basis states are counted, in lexicographic order"""
+        n_shots = 100
+        dev = qml.device("default.qubit", wires=3, shots=n_shots)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.PauliX(wires=0)
+            qml.Hadamard(wires=1)
+            qml.CNOT(wires=[1, 2])
+            return qml.counts(wires=[2, 0])
+
+        res = circuit()
+
+        # wire 0 is always 1, and wire 2 is 0 or 1 with equal probability
+        assert np.all(res[[0, 2]] == 0)
+        assert np.sum(res) == n_shots
+
+    def test_counts_agree_with_samples(self):
+        """Test that the counts agree with the samples of the same execution"""
+        dev = qml.device("default.qubit", wires=3, shots=50)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.CNOT(wires=[1, 2])
+            return qml.sample(qml.PauliZ(0)), qml.counts(wires=[1, 2])
+
+        samples, counts = circuit()
+
+        assert counts[0] == np.sum(samples == 1)
+        assert counts[3] == np.sum(samples == -1)
+
+    def test_counts_not_differentiable(self):
+        """Test that an exception is raised if a circuit returning counts is differentiated"""
+        dev = qml.device("default.qubit", wires=1, shots=10)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.counts(wires=0)
+
+        with pytest.raises(QuantumFunctionError, match="can not be differentiated"):
+            circuit.jacobian([0.5])
+
+    def test_observable_return_type_is_counts(self):
+        """Test that the return type of the observable is :attr:`ObservableReturnTypes.Counts`"""
+        dev = qml.device("default.qubit", wires=1, shots=10)
+
+        @qml.qnode(dev)
+        def circuit():
+            res = qml.counts(wires=0)
+            assert res.return_type is Counts
+            return res
+
+        circuit()
@@ -340,6 +340,26 @@ class TestGenerateSamples:
 
         assert mock_qubit_device._samples == (number_of_states, mock_qubit_device.num_wires)
 
+    def test_marginal_sampling(self, mock_qubit_device, monkeypatch):
+        """Tests that only the marginal distribution of the measured wires is sampled,
+        and that the columns of the remaining wires are zero"""
+        mock_qubit_device.num_wires = 3
+        mock_qubit_device.shots = 10
+        mock_qubit_device._wires_measured = {2, 0}
+
+        probability_wires = []
+
+        def probability_mock(self, wires=None):
+            probability_wires.append(wires)
+            return np.array([0, 0, 0, 1]) if wires == [0, 2] else None
+
+        with monkeypatch.context() as m:
+            m.setattr(QubitDevice, "probability", probability_mock)
+            samples = mock_qubit_device.generate_samples()
+
+        assert probability_wires == [[0, 2]]
+        assert np.array_equal(samples, np.tile([1, 0, 1], (10, 1)))
+
 
 class TestSampleBasisStates:
     """Test the sample_basis_states method"""
@@ -347,20 +367,52 @@ class TestSampleBasisStates:
     def test_sampling_with_correct_arguments(self, mock_qubit_device, monkeypatch):
         """Tests that the sample_basis_states method samples with the correct arguments"""
 
-        shots = 1000
+        shots = 7
 
         number_of_states = 4
         mock_qubit_device.shots = shots
-        state_probs = [0.1, 0.2, 0.3, 0.4]
+        state_probs = np.array([0.1, 0.2, 0.3, 0.4])
+        uniform = np.array([0.95, 0.05, 0.35, 0.15, 0.55, 0.25, 0.65])
 
         with monkeypatch.context() as m:
-            # Mock the numpy.random.choice method such that it returns the expected values
-            m.setattr("numpy.random.choice", lambda x, y, p: (x, y, p))
+            # Mock the numpy.random.random method such that it returns the expected values
+            m.setattr("numpy.random.random", lambda size: uniform[:size])
             res = mock_qubit_device.sample_basis_states(number_of_states, state_probs)
 
-        assert np.array_equal(res[0], np.array([0, 1, 2, 3]))
-        assert res[1] == shots
-        assert res[2] == state_probs
+        assert np.array_equal(np.sort(res), np.array([0, 1, 1, 2, 2, 3, 3]))
+
+    def test_sample_frequencies(self, mock_qubit_device):
+        """Tests that the frequencies of the sampled basis states agree with the
+        probabilities, and that the samples are not ordered"""
+        mock_qubit_device.shots = 100000
+        state_probs = np.array([0.1, 0.2, 0.3, 0.4])
+
+        res = mock_qubit_device.sample_basis_states(4, state_probs)
+        assert np.allclose(np.bincount(res, minlength=4) / 100000, state_probs, atol=0.01, rtol=0)
+        assert np.any(np.diff(res) < 0)
+
+    def test_zero_probability_states_not_sampled(self, mock_qubit_device):
+        """Tests that basis states with zero probability are never sampled"""
+        mock_qubit_device.shots = 1000
+        state_probs = np.array([0, 0.5, 0, 0, 0.5, 0, 0, 0])
+
+        res = mock_qubit_device.sample_basis_states(8, state_probs)
+        assert set(res) == {1, 4}
+
+    def test_cumulative_distribution_cached(self, mock_qubit_device):
+        """Tests that the cumulative distribution is only recomputed if a different
+        probability array is passed"""
+        state_probs = np.array([0.1, 0.2, 0.3, 0.4])
+
+        mock_qubit_device.sample_basis_states(4, state_probs)
+        cdf = mock_qubit_device._cdf[1]
+        assert np.allclose(cdf, [0.1, 0.3, 0.6, 1])
+
+        mock_qubit_device.sample_basis_states(4, state_probs)
+        assert mock_qubit_device._cdf[1] is cdf
+
+        mock_qubit_device.sample_basis_states(4, state_probs.copy())
+        assert mock_qubit_device._cdf[1] is not cdf
 
 
 class TestStatesToBinary:
@@ -398,6 +450,7 @@ class TestStatesToBinary:
         wires = binary_states.shape[1]
         res = mock_qubit_device.states_to_binary(samples, wires)
         assert np.allclose(res, binary_states, atol=tol, rtol=0)
+        assert res.dtype == np.uint8
 
 
 class TestExpval:
@@ -521,6 +574,19 @@ class TestSample:
 
         assert np.array_equal(res, np.array([-1, 1]))
 
+    def test_unsigned_samples(self, mock_qubit_device_with_original_statistics):
+        """Test that samples stored as unsigned integers are converted to eigenvalues correctly"""
+        mock_qubit_device_with_original_statistics._samples = np.array(
+            [[1, 0], [0, 0], [1, 1]], dtype=np.uint8
+        )
+
+        res = mock_qubit_device_with_original_statistics.sample(qml.PauliZ(0))
+        assert np.array_equal(res, np.array([-1, 1, -1]))
+
+        obs = qml.Hermitian(np.diag([1, 2, 3, 4]), wires=[1, 0])
+        res = mock_qubit_device_with_original_statistics.sample(obs)
+        assert np.array_equal(res, np.array([2, 1, 4]))
+
 
 class TestMarginalProb:
     """Test the marginal_prob method"""
@@ -548,17 +614,17 @@ class TestMarginalProb:
         probs = np.array([random() for i in range(2 ** 3)])
         probs /= sum(probs)
 
-        def apply_over_axes_mock(x, y, p):
-            arguments_apply_over_axes.append((y, p))
-            return np.zeros([2 ** len(wires)])
+        def sum_mock(x, axis):
+            arguments_sum.append((x, axis))
+            return np.zeros([2] * len(wires))
 
-        arguments_apply_over_axes = []
+        arguments_sum = []
         with monkeypatch.context() as m:
-            m.setattr("numpy.apply_over_axes", apply_over_axes_mock)
+            m.setattr("numpy.sum", sum_mock)
             res = mock_qubit_device_with_original_statistics.marginal_prob(probs, wires=wires)
 
-        assert np.array_equal(arguments_apply_over_axes[0][0].flatten(), probs)
-        assert np.array_equal(arguments_apply_over_axes[0][1], inactive_wires)
+        assert np.array_equal(arguments_sum[0][0].flatten(), probs)
+        assert arguments_sum[0][1] == tuple(inactive_wires)
 
     marginal_test_data = [
         (np.array([0.1, 0.2, 0.3, 0.4]), np.array([0.4, 0.6]), [1]),
@@ -614,3 +680,340 @@ class TestActiveWires:
 
         res = mock_qubit_device.active_wires(queue)
         assert res == {0, 2, 5}
+
+
+class TestGateFusion:
+    """Tests for the optional gate fusion stage of QubitDevice.execute."""
+
+    def test_fusion_requires_qubit_unitary(self, monkeypatch):
+        """Test that an exception is raised if gate fusion is requested on a device
+        that does not support QubitUnitary"""
+        with monkeypatch.context() as m:
+            m.setattr(QubitDevice, "__abstractmethods__", frozenset())
+            m.setattr(QubitDevice, "operations", ["PauliY", "RX", "Rot"])
+            m.setattr(QubitDevice, "short_name", "MockDevice")
+
+            with pytest.raises(DeviceError, match="Gate fusion requires the QubitUnitary"):
+                QubitDevice(fusion=2)
+
+    def test_fused_operations(self, tol):
+        """Test that runs of operations on nested wires are merged, and that the
+        fused unitaries are correct"""
+        dev = qml.device("default.qubit", wires=3, fusion=2)
+
+        ops = [
+            qml.RX(0.1, wires=[0]),
+            qml.RZ(0.2, wires=[0]),
+            qml.CNOT(wires=[0, 1]),
+            qml.RY(0.3, wires=[1]),
+            qml.Hadamard(wires=[2]),
+            qml.Toffoli(wires=[0, 1, 2]),
+            qml.RX(0.4, wires=[2]),
+        ]
+
+        res = dev.fuse_operations(ops)
+
+        assert [op.name for op in res] == ["QubitUnitary", "Hadamard", "Toffoli", "RX"]
+        assert res[0].wires == [0, 1]
+        assert res[1] is ops[4]
+        assert res[2] is ops[5]
+
+        expected = (
+            np.kron(np.identity(2), ops[3].matrix)
+            @ ops[2].matrix
+            @ np.kron(ops[1].matrix @ ops[0].matrix, np.identity(2))
+        )
+        assert np.allclose(res[0].matrix, expected, atol=tol, rtol=0)
+
+    def test_fused_wire_order(self, tol):
+        """Test that the fused unitary is correct if the wires of later operations
+        are not in increasing order"""
+        dev = qml.device("default.qubit", wires=3, fusion=2)
+
+        ops = [qml.RX(0.1, wires=[2]), qml.CNOT(wires=[0, 2])]
+        res = dev.fuse_operations(ops)
+
+        assert len(res) == 1
+        assert res[0].wires == [2, 0]
+
+        dev.apply(ops)
+        expected = dev.state
+
+        dev.reset()
+        dev.apply(res)
+        assert np.allclose(dev.state, expected, atol=tol, rtol=0)
+
+    def test_state_preparations_are_not_fused(self):
+        """Test that state preparations are never merged with other operations"""
+        dev = qml.device("default.qubit", wires=2, fusion=2)
+
+        ops = [
+            qml.BasisState(np.array([1, 0]), wires=[0, 1]),
+            qml.RX(0.1, wires=[0]),
+            qml.RY(0.2, wires=[0]),
+        ]
+        res = dev.fuse_operations(ops)
+
+        assert [op.name for op in res] == ["BasisState", "QubitUnitary"]
+
+    @pytest.mark.parametrize("fusion", [1, 2, 3])
+    def test_qnode_results_agree(self, fusion, tol):
+        """Test that QNodes evaluated with and without gate fusion agree"""
+        def circuit(weights, x):
+            qml.templates.StronglyEntanglingLayers(weights, wires=[0, 1, 2])
+            qml.RZ(x, wires=[1])
+            qml.PhaseShift(x, wires=[1])
+            return qml.expval(qml.PauliZ(0)), qml.var(qml.PauliX(1) @ qml.PauliY(2))
+
+        weights = qml.init.strong_ent_layers_normal(n_layers=2, n_wires=3, seed=42)
+
+        dev = qml.device("default.qubit", wires=3)
+        fused_dev = qml.device("default.qubit", wires=3, fusion=fusion)
+
+        expected = qml.QNode(circuit, dev)(weights, 0.5)
+        res = qml.QNode(circuit, fused_dev)(weights, 0.5)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_plan_is_cached(self, monkeypatch, tol):
+        """Test that the fusion plan is computed only once per circuit hash, and that
+        the fused matrices are recomputed for new parameter values"""
+        dev = qml.device("default.qubit", wires=1, fusion=1)
+
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            qml.RY(0.2, wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        qnode = qml.QNode(circuit, dev)
+        qnode(0.1)
+        assert len(dev._fusion_plans) == 1
+
+        with monkeypatch.context() as m:
+            m.setattr(QubitDevice, "_fusion_plan", lambda self, ops: pytest.fail())
+            res = qnode(0.3)
+
+        assert np.allclose(res, np.cos(0.3) * np.cos(0.2), atol=tol, rtol=0)
+        assert len(dev._fusion_plans) == 1
+
+
+class TestBatchExecute:
+    """Tests for the default implementation of batch_execute"""
+
+    def test_rows_are_executed(self, tol):
+        """Test that the default implementation executes the circuit once per row,
+        using the row as the positional argument values"""
+        dev = qml.device("default.qubit", wires=2)
+
+        def circuit(x, y):
+            qml.RX(x, wires=[0])
+            qml.RY(y, wires=[1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        qnode = qml.QNode(circuit, dev)
+        qnode(0.1, 0.2)
+        values = Variable.positional_arg_values
+
+        parameters = np.array([[0.3, 0.4], [0.5, 0.6], [0.7, 0.8]])
+        res = QubitDevice.batch_execute(dev, qnode.circuit, parameters)
+
+        assert np.allclose(res, np.cos(parameters), atol=tol, rtol=0)
+        assert Variable.positional_arg_values is values
+
+
+class TestStreamedStatistics:
+    """Tests for the estimation of statistics from samples generated in chunks"""
+
+    def test_invalid_shot_chunk_size(self, monkeypatch):
+        """Test that an exception is raised if the shot chunk size is not positive"""
+        with monkeypatch.context() as m:
+            m.setattr(QubitDevice, "__abstractmethods__", frozenset())
+
+            with pytest.raises(DeviceError, match="shot chunk size must be a positive"):
+                QubitDevice(shot_chunk_size=0)
+
+    def test_statistics_agree_with_single_chunk(self, monkeypatch, tol):
+        """Test that the statistics estimated chunk by chunk equal the statistics of
+        all samples generated at once"""
+        dev = qml.device("default.qubit", wires=3, shots=1000, analytic=False, shot_chunk_size=300)
+
+        def circuit():
+            qml.RX(0.5, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            qml.CNOT(wires=[1, 2])
+            return qml.expval(qml.PauliZ(0)), qml.var(qml.PauliZ(1)), qml.probs(wires=[2])
+
+        qnode = qml.QNode(circuit, dev)
+        qnode()
+
+        chunks = []
+        generate_samples = dev.generate_samples
+
+        def recording_generate_samples():
+            samples = generate_samples()
+            chunks.append(samples)
+            return samples
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "generate_samples", recording_generate_samples)
+            dev.reset()
+            res = dev.execute(qnode.circuit)
+
+        assert [len(c) for c in chunks] == [300, 300, 300, 100]
+        assert dev.shots == 1000
+        assert dev._samples is None
+
+        samples = 1 - 2 * np.vstack(chunks).astype(int)
+        assert np.allclose(res[0], np.mean(samples[:, 0]), atol=tol, rtol=0)
+        assert np.allclose(res[1], np.var(samples[:, 1]), atol=tol, rtol=0)
+        assert np.allclose(res[2], [np.cos(0.25) ** 2, np.sin(0.25) ** 2], atol=tol, rtol=0)
+
+    @pytest.mark.filterwarnings("error::numpy.VisibleDeprecationWarning")
+    def test_expval_with_counts(self, tol):
+        """Test that an expectation value streamed together with counts is returned
+        in an object array, as without streaming"""
+        dev = qml.device("default.qubit", wires=2, shots=1000, analytic=False, shot_chunk_size=300)
+
+        def circuit():
+            qml.PauliX(wires=[0])
+            qml.Hadamard(wires=[1])
+            return qml.expval(qml.PauliZ(0)), qml.counts(wires=[1])
+
+        res = qml.QNode(circuit, dev)()
+
+        assert res.dtype == object
+        assert np.allclose(res[0], -1, atol=tol, rtol=0)
+        assert np.sum(res[1]) == 1000
+        assert len(res[1]) == 2
+
+    def test_distribution_computed_once(self, monkeypatch):
+        """Test that the probabilities and their cumulative distribution are computed
+        once per execution, and reused for all chunks"""
+        dev = qml.device("default.qubit", wires=2, shots=1000, analytic=False, shot_chunk_size=300)
+
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0)), qml.var(qml.PauliZ(1))
+
+        qnode = qml.QNode(circuit, dev)
+        calls = []
+        cumsum = np.cumsum
+
+        def recording_cumsum(*args, **kwargs):
+            calls.append(args)
+            return cumsum(*args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(np, "cumsum", recording_cumsum)
+            qnode(0.5)
+            assert len(calls) == 1
+
+            # the distribution is recomputed for the next execution
+            res = qnode(np.pi)
+            assert len(calls) == 2
+
+        assert np.allclose(res, [-1, 0])
+
+    def test_counts_are_summed(self):
+        """Test that the counts of all chunks are summed"""
+        dev = qml.device("default.qubit", wires=2, shots=1000, analytic=False, shot_chunk_size=300)
+
+        def circuit():
+            qml.Hadamard(wires=[0])
+            return qml.counts(wires=[0, 1])
+
+        res = qml.QNode(circuit, dev)()
+
+        assert np.sum(res) == 1000
+        assert np.all(res[[1, 3]] == 0)
+
+    def test_samples_are_not_streamed(self):
+        """Test that circuits returning samples generate all samples at once"""
+        dev = qml.device("default.qubit", wires=1, shots=10, analytic=False, shot_chunk_size=3)
+
+        def circuit():
+            qml.Hadamard(wires=[0])
+            return qml.sample(qml.PauliZ(0))
+
+        res = qml.QNode(circuit, dev)()
+        assert res.shape == (10,)
+
+
+class TestShotVector:
+    """Tests for the execution of circuits with a shot vector"""
+
+    def test_statistics_from_sample_prefixes(self, monkeypatch, tol):
+        """Test that the circuit is applied once, and that the statistics for each number
+        of shots are computed from the first samples of a single sample stream"""
+        dev = qml.device("default.qubit", wires=2, shots=[10, 100, 50], analytic=False)
+
+        def circuit():
+            qml.RX(0.5, wires=[0])
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0)), qml.var(qml.PauliZ(1))
+
+        qnode = qml.QNode(circuit, dev)
+        qnode()
+
+        applied = []
+        apply = dev.apply
+
+        def recording_apply(*args, **kwargs):
+            applied.append(args)
+            return apply(*args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(dev, "apply", recording_apply)
+            dev.reset()
+            res = dev.execute(qnode.circuit)
+
+        assert len(applied) == 1
+        assert res.shape == (3, 2)
+        assert dev._samples.shape == (100, 2)
+
+        values = 1 - 2 * dev._samples.astype(int)
+
+        for row, shots in zip(res, [10, 100, 50]):
+            assert np.allclose(row[0], np.mean(values[:shots, 0]), atol=tol, rtol=0)
+            assert np.allclose(row[1], np.var(values[:shots, 1]), atol=tol, rtol=0)
+
+    def test_samples(self):
+        """Test that samples are returned for each number of shots"""
+        dev = qml.device("default.qubit", wires=1, shots=[5, 20])
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.Hadamard(wires=[0])
+            return qml.sample(qml.PauliZ(0))
+
+        res = circuit()
+
+        assert len(res) == 2
+        assert res[0].shape == (5,)
+        assert res[1].shape == (20,)
+        assert np.array_equal(res[0], res[1][:5])
+
+    def test_analytic(self, tol):
+        """Test that the exact results are returned for each number of shots in analytic mode"""
+        dev = qml.device("default.qubit", wires=1, shots=[5, 20, 100])
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        res = circuit(0.3)
+        assert np.allclose(res, np.cos(0.3) * np.ones(3), atol=tol, rtol=0)
+
+    def test_not_differentiable(self):
+        """Test that circuits executed with a shot vector can not be differentiated"""
+        dev = qml.device("default.qubit", wires=1, shots=[5, 20])
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(qml.QuantumFunctionError, match="shot vector can not be differentiated"):
+            circuit.jacobian([0.3])
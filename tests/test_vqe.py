@@ -212,6 +212,37 @@ class TestHamiltonian:
         with pytest.raises(ValueError, match="observables are not valid"):
             H = qml.vqe.Hamiltonian(coeffs, obs)
 
+    @pytest.mark.parametrize("coeffs, ops", valid_hamiltonians)
+    def test_qwc_groups_partition(self, coeffs, ops):
+        """Tests that the groups partition the terms of the Hamiltonian
+        into qubit-wise commuting sets"""
+        H = qml.vqe.Hamiltonian(coeffs, ops)
+        groups = H.qwc_groups()
+
+        terms = [(c, o) for g in groups for c, o in zip(*g.terms)]
+        assert len(terms) == len(ops)
+        assert all(any(o is op for _, o in terms) for op in ops)
+
+        for g in groups:
+            factors = [qml.vqe.vqe._factors(o) for o in g.ops]
+            assert all(qml.vqe.vqe._qwc(f1, f2) for f1 in factors for f2 in factors)
+
+    @pytest.mark.parametrize("ops, expected", [
+        ((qml.PauliX(0), qml.PauliY(1)), [[0, 1]]),
+        ((qml.PauliX(1), qml.PauliY(1)), [[0], [1]]),
+        ((qml.PauliX(0) @ qml.PauliZ(1), qml.PauliZ(1), qml.PauliY(0) @ qml.Identity(1)), [[0, 1], [2]]),
+        ((qml.Hermitian(H_TWO_QUBITS, [0, 2]), qml.PauliZ(1), qml.Hermitian(H_TWO_QUBITS, [0, 2])), [[0, 1, 2]]),
+        ((qml.Hermitian(H_TWO_QUBITS, [0, 2]), qml.Hermitian(H_TWO_QUBITS, [2, 0])), [[0], [1]]),
+        ((qml.Hermitian(H_ONE_QUBIT, 0), qml.PauliZ(0), qml.Hermitian(H_ONE_QUBIT, 0)), [[0, 2], [1]]),
+    ])
+    def test_qwc_groups(self, ops, expected):
+        """Tests that the terms are grouped correctly"""
+        coeffs = list(range(len(ops)))
+        H = qml.vqe.Hamiltonian(coeffs, ops)
+        groups = H.qwc_groups()
+
+        assert [list(g.coeffs) for g in groups] == expected
+
 
 class TestVQE:
     """Test the core functionality of the VQE module"""
@@ -285,12 +316,160 @@ class TestVQE:
         cost = qml.VQECost(lambda params, **kwargs: None, hamiltonian, dev)
         assert cost([]) == sum(expected)
 
+    @pytest.mark.parametrize("ansatz, params", CIRCUITS)
+    @pytest.mark.parametrize("coeffs, observables", [z for z in zip(COEFFS, OBSERVABLES)])
+    def test_cost_single_qnode(self, params, ansatz, coeffs, observables, tol):
+        """Tests that the cost function measures the whole Hamiltonian with a single QNode
+        on default.qubit in analytic mode, and agrees with the sum of the terms"""
+        hamiltonian = qml.vqe.Hamiltonian(coeffs, observables)
+        dev = qml.device("default.qubit", wires=3)
+        cost = qml.VQECost(ansatz, hamiltonian, dev)
+
+        assert len(cost.qnodes) == 1
+
+        expected = qml.dot(coeffs, qml.map(ansatz, observables, dev))(params)
+        assert np.allclose(cost(params), expected, atol=tol, rtol=0)
+
+    def test_cost_qnode_per_term(self):
+        """Tests that a QNode is created per term on devices that do not measure
+        Hamiltonians directly"""
+        hamiltonian = qml.vqe.Hamiltonian([1.0, 0.5], [qml.PauliZ(0), qml.PauliX(0)])
+
+        def ansatz(params, **kwargs):
+            qml.RX(params[0], wires=0)
+
+        dev = qml.device("default.qubit", wires=1, analytic=False)
+        assert len(qml.VQECost(ansatz, hamiltonian, dev).qnodes) == 2
+
+        dev = qml.device("default.mixed", wires=1)
+        assert len(qml.VQECost(ansatz, hamiltonian, dev).qnodes) == 2
+
+    def test_cost_single_qnode_invalid_ansatz(self):
+        """Tests that the cost function measuring the whole Hamiltonian raises an
+        exception if the ansatz is not valid"""
+        hamiltonian = qml.vqe.Hamiltonian((1.0,), [qml.PauliZ(0)])
+        dev = qml.device("default.qubit", wires=1)
+
+        with pytest.raises(ValueError, match="not a callable function."):
+            qml.VQECost(4, hamiltonian, dev)
+
     @pytest.mark.parametrize("ansatz", JUNK_INPUTS)
-    def test_cost_invalid_ansatz(self, ansatz, mock_device):
+    @pytest.mark.parametrize("grouping", [False, True])
+    def test_cost_invalid_ansatz(self, ansatz, grouping, mock_device):
         """Tests that the cost function raises an exception if the ansatz is not valid"""
         hamiltonian = qml.vqe.Hamiltonian((1.0,), [qml.PauliZ(0)])
         with pytest.raises(ValueError, match="not a callable function."):
-            cost = qml.VQECost(4, hamiltonian, mock_device)
+            cost = qml.VQECost(4, hamiltonian, mock_device, grouping=grouping)
+
+    @pytest.mark.parametrize("ansatz, params", CIRCUITS)
+    @pytest.mark.parametrize("coeffs, observables", [z for z in zip(COEFFS, OBSERVABLES)])
+    def test_grouped_cost_evaluate(self, params, ansatz, coeffs, observables, tol):
+        """Tests that the cost function with grouped terms agrees with the
+        cost function measuring each term separately"""
+        hamiltonian = qml.vqe.Hamiltonian(coeffs, observables)
+        dev = qml.device("default.qubit", wires=3)
+
+        expected = qml.VQECost(ansatz, hamiltonian, dev)(params)
+        cost = qml.VQECost(ansatz, hamiltonian, dev, grouping=True)
+        res = cost(params)
+
+        assert len(cost.qnodes) == len(hamiltonian.qwc_groups())
+        assert np.shape(res) == ()
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_grouped_cost_tensor_wire_order(self, tol):
+        """Tests that the cost function with grouped terms is correct for
+        tensor products whose factors are not ordered by wire"""
+        coeffs = [0.3, -1.1, 0.5]
+        observables = [
+            qml.PauliY(2) @ qml.Identity(1),
+            qml.Hermitian(H_TWO_QUBITS, [2, 0]) @ qml.PauliX(1),
+            qml.PauliZ(1) @ qml.PauliY(2),
+        ]
+        hamiltonian = qml.vqe.Hamiltonian(coeffs, observables)
+        dev = qml.device("default.qubit", wires=3)
+        params = LAYER_PARAMS
+        ansatz = qml.templates.layers.StronglyEntanglingLayers
+
+        expected = sum(
+            c * qml.VQECost(ansatz, qml.vqe.Hamiltonian([1.0], [o]), dev)(params)
+            for c, o in zip(coeffs, observables)
+        )
+        res = qml.VQECost(ansatz, hamiltonian, dev, grouping=True)(params)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_grouped_cost_finite_shots(self):
+        """Tests that the cost function with grouped terms is estimated from samples
+        if the device is not in analytic mode"""
+        coeffs = [0.3, -1.1, 0.5]
+        observables = [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliX(0), qml.PauliZ(1)]
+        hamiltonian = qml.vqe.Hamiltonian(coeffs, observables)
+        params = np.array([0.3, 0.7])
+
+        def ansatz(params, **kwargs):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=1)
+            qml.CNOT(wires=[0, 1])
+
+        dev = qml.device("default.qubit", wires=2)
+        expected = qml.VQECost(ansatz, hamiltonian, dev)(params)
+
+        dev = qml.device("default.qubit", wires=2, analytic=False, shots=20000)
+        cost = qml.VQECost(ansatz, hamiltonian, dev, grouping=True)
+        res = cost(params)
+
+        assert len(cost.qnodes) == 2
+        assert not np.allclose(res, expected, atol=1e-8, rtol=0)
+        assert np.allclose(res, expected, atol=0.05, rtol=0)
+
+    def test_grouped_cost_finite_shots_no_matrix(self, monkeypatch):
+        """Tests that the cost function with grouped terms is estimated in finite-shot
+        mode without building the matrix of the group observables"""
+        observables = [qml.PauliZ(i) @ qml.PauliZ(i + 1) for i in range(11)]
+        hamiltonian = qml.vqe.Hamiltonian(np.ones(11), observables)
+
+        def ansatz(params, **kwargs):
+            for i in range(12):
+                qml.RX(params[i], wires=i)
+
+        def no_matrix(*params):
+            raise AssertionError("the matrix of the group observable was built")
+
+        monkeypatch.setattr(qml.vqe.vqe._DiagonalHermitian, "_matrix", staticmethod(no_matrix))
+
+        dev = qml.device("default.qubit", wires=12, analytic=False, shots=100)
+        cost = qml.VQECost(ansatz, hamiltonian, dev, grouping=True)
+        params = np.zeros(12)
+
+        assert len(cost.qnodes) == 1
+        assert np.allclose(cost(params), 11)
+        assert np.shape(qml.grad(cost, argnum=0)(params)) == (12,)
+
+    def test_grouped_cost_single_shot(self):
+        """Tests that the cost function with grouped terms evaluated with a single shot
+        is an eigenvalue of the Hamiltonian"""
+        observables = [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliZ(1)]
+        hamiltonian = qml.vqe.Hamiltonian([0.3, 0.5], observables)
+
+        def ansatz(params, **kwargs):
+            qml.RX(params[0], wires=0)
+            qml.RY(params[1], wires=1)
+
+        dev = qml.device("default.qubit", wires=2, analytic=False, shots=1)
+        cost = qml.VQECost(ansatz, hamiltonian, dev, grouping=True)
+
+        eigvals = [0.8, -0.8, -0.2, 0.2]
+        for _ in range(5):
+            assert np.any(np.isclose(cost([0.3, 0.7]), eigvals))
+
+    def test_grouping_requires_single_device(self):
+        """Tests that an exception is raised if grouping is requested with multiple devices"""
+        hamiltonian = qml.vqe.Hamiltonian((1.0, 0.5), [qml.PauliZ(0), qml.PauliX(0)])
+        devs = [qml.device("default.qubit", wires=1) for _ in range(2)]
+
+        with pytest.raises(ValueError, match="requires a single device"):
+            qml.VQECost(lambda params, **kwargs: None, hamiltonian, devs, grouping=True)
 
 
 class TestAutogradInterface:
@@ -311,7 +490,8 @@ class TestAutogradInterface:
         assert all(isinstance(val, float) for val in res)
 
     @pytest.mark.parametrize("interface", ["autograd", "numpy"])
-    def test_gradient(self, tol, interface):
+    @pytest.mark.parametrize("grouping", [False, True])
+    def test_gradient(self, tol, interface, grouping):
         """Test differentiation works"""
         dev = qml.device("default.qubit", wires=1)
 
@@ -326,7 +506,7 @@ class TestAutogradInterface:
         a, b = 0.54, 0.123
         params = np.array([a, b])
 
-        cost = qml.VQECost(ansatz, H, dev, interface=interface)
+        cost = qml.VQECost(ansatz, H, dev, interface=interface, grouping=grouping)
         dcost = qml.grad(cost, argnum=[0])
         res = dcost(params)
 
@@ -353,7 +533,8 @@ class TestTorchInterface:
         res = [c(params) for c in circuits]
         assert all(isinstance(val, torch.Tensor) for val in res)
 
-    def test_gradient(self, tol):
+    @pytest.mark.parametrize("grouping", [False, True])
+    def test_gradient(self, tol, grouping):
         """Test differentiation works"""
         dev = qml.device("default.qubit", wires=1)
 
@@ -368,7 +549,7 @@ class TestTorchInterface:
         a, b = 0.54, 0.123
         params = torch.autograd.Variable(torch.tensor([a, b]), requires_grad=True)
 
-        cost = qml.VQECost(ansatz, H, dev, interface="torch")
+        cost = qml.VQECost(ansatz, H, dev, interface="torch", grouping=grouping)
         loss = cost(params)
         loss.backward()
 
@@ -401,7 +582,8 @@ class TestTFInterface:
         res = [c(params) for c in circuits]
         assert all(isinstance(val, (Variable, tf.Tensor)) for val in res)
 
-    def test_gradient(self, tol):
+    @pytest.mark.parametrize("grouping", [False, True])
+    def test_gradient(self, tol, grouping):
         """Test differentiation works"""
         dev = qml.device("default.qubit", wires=1)
 
@@ -415,7 +597,7 @@ class TestTFInterface:
         H = qml.vqe.Hamiltonian(coeffs, observables)
         a, b = 0.54, 0.123
         params = Variable([a, b], dtype=tf.float64)
-        cost = qml.VQECost(ansatz, H, dev, interface="tf")
+        cost = qml.VQECost(ansatz, H, dev, interface="tf", grouping=grouping)
 
         with tf.GradientTape() as tape:
             loss = cost(params)